@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-spec parsing cost.
+
+Times the single-pass tokenizer, the MCP server's full `_parse_spec`, and
+the static checks spec readers over every spec in a project.
+
+Usage:
+    python3 dev/bench_spec_parser.py [project_root] [--repeat N]
+"""
+
+import glob
+import os
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'scripts', 'mcp'))
+sys.path.insert(0, os.path.join(HERE, '..', 'scripts', 'audit'))
+
+import purlin_server
+import static_checks
+from spec_parser import tokenize_spec
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 200
+    if '--repeat' in args:
+        idx = args.index('--repeat')
+        repeat = int(args[idx + 1])
+        del args[idx:idx + 2]
+    project_root = os.path.abspath(args[0] if args else os.path.join(HERE, '..'))
+
+    paths = sorted(glob.glob(os.path.join(project_root, 'specs', '**', '*.md'), recursive=True))
+    if not paths:
+        print(f"No specs found under {project_root}/specs", file=sys.stderr)
+        sys.exit(1)
+    specs = []
+    for path in paths:
+        with open(path) as f:
+            specs.append((os.path.relpath(path, project_root), f.read()))
+    total_bytes = sum(len(content) for _, content in specs)
+
+    cases = [
+        ('tokenize_spec', lambda: [tokenize_spec(c) for _, c in specs]),
+        ('_parse_spec', lambda: [purlin_server._parse_spec(c, p) for p, c in specs]),
+        ('static_checks readers', lambda: [
+            (static_checks._read_rule_descriptions(p), static_checks._read_proof_descriptions(p))
+            for p in paths
+        ]),
+    ]
+
+    print(f"{len(specs)} specs, {total_bytes / 1024:.1f} KiB, {repeat} repeats")
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=repeat, repeat=3))
+        per_spec_us = best / repeat / len(specs) * 1e6
+        print(f"  {name:<24} {per_spec_us:8.1f} us/spec")
+
+
+if __name__ == '__main__':
+    main()
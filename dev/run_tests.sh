@@ -36,6 +36,10 @@ run_suite "E2E Build Changeset" bash "$SCRIPT_DIR/test_e2e_build_changeset.sh"
 run_suite "All Pytest Tests" pytest \
   "$SCRIPT_DIR/test_config_engine.py" \
   "$SCRIPT_DIR/test_mcp_server.py" \
+  "$SCRIPT_DIR/test_spec_parser.py" \
+  "$SCRIPT_DIR/test_purlin_daemon.py" \
+  "$SCRIPT_DIR/test_shard_runner.py" \
+  "$SCRIPT_DIR/test_proof_journal.py" \
   "$SCRIPT_DIR/test_purlin_references.py" \
   "$SCRIPT_DIR/test_purlin_agent.py" \
   "$SCRIPT_DIR/test_purlin_skills.py" \
@@ -17,7 +17,7 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'mcp'))
 import config_engine
-from config_engine import find_project_root, resolve_config, update_config
+from config_engine import find_project_root, parse_jobs, resolve_config, update_config
 
 
 class TestFindProjectRoot:
@@ -170,6 +170,16 @@ class TestResolveConfig:
         assert result == {"standalone": True}
 
 
+
+class TestParseJobs:
+
+    @pytest.mark.proof("config_engine", "PROOF-13", "RULE-11")
+    def test_worker_count_from_jobs_value(self):
+        with mock.patch.object(config_engine.os, 'cpu_count', return_value=6):
+            counts = [parse_jobs(v) for v in (None, '', 'auto', 4, '3', 0, -2, 'many')]
+        assert counts == [6, 6, 6, 4, 3, 1, 1, 1]
+
+
 class TestUpdateConfig:
 
     def setup_method(self):
@@ -158,7 +158,7 @@ class TestAuditCachePipeline:
         with mock.patch.object(static_checks.os, 'replace', side_effect=spy_replace):
             write_audit_cache(self.tmp_dir, cache)
 
-        cache_path = os.path.join(self.tmp_dir, '.purlin', 'cache', 'audit_cache.json')
+        cache_path = os.path.join(self.tmp_dir, '.purlin', 'cache', 'audit_cache.d', 'login.json')
         assert replace_calls, "write is not atomic — os.replace was never called"
         src, dst = replace_calls[-1]
         assert src.endswith('.tmp'), f"expected rename from a .tmp file, got {src!r}"
@@ -166,7 +166,7 @@ class TestAuditCachePipeline:
             f"os.replace target {dst!r} is not the cache file"
         assert not os.path.exists(cache_path + '.tmp'), "temp file left behind after rename"
 
-        assert os.path.isfile(cache_path), "audit_cache.json was not created"
+        assert os.path.isfile(cache_path), "login's audit cache shard was not created"
         with open(cache_path) as f:
             data = json.load(f)
         assert len(data) == 3, f"Expected 3 cache entries, got {len(data)}"
@@ -414,9 +414,8 @@ class TestAuditCachePipeline:
             f"Expected 'Integrity:' in first sync_status output, got:\n{output_before}"
         )
 
-        # Delete cache file
-        cache_path = os.path.join(self.tmp_dir, '.purlin', 'cache', 'audit_cache.json')
-        os.remove(cache_path)
+        # Delete the cache (its per-feature shards)
+        shutil.rmtree(os.path.join(self.tmp_dir, '.purlin', 'cache', 'audit_cache.d'))
 
         # Second run — no cache, must show "No audit data"
         output_after = sync_status(self.tmp_dir)
@@ -1375,22 +1374,25 @@ Invoice management.
             f"  These should delegate to _determine_status()"
         )
 
-        # Verify the main call sites delegate to _determine_status
-        # sync_status and _build_report_data should both call it
-        callers_found = []
-        for caller in ('sync_status', '_build_report_data'):
-            caller_match = re.search(
-                rf'^def {caller}\(.*?\n(?=^def |\Z)', content,
+        def _body(func):
+            match = re.search(
+                rf'^def {func}\(.*?\n(?=^def |\Z)', content,
                 re.MULTILINE | re.DOTALL
             )
-            if caller_match and '_determine_status(' in caller_match.group(0):
-                callers_found.append(caller)
+            return match.group(0) if match else ''
 
-        assert 'sync_status' in callers_found, (
-            "sync_status must call _determine_status()"
+        # Per-feature coverage delegates to _determine_status, and every
+        # consumer (CLI report, report data, drift) takes its status from it
+        assert '_determine_status(' in _body('_feature_coverage'), (
+            "_feature_coverage must call _determine_status()"
         )
-        assert '_build_report_data' in callers_found, (
-            "_build_report_data must call _determine_status()"
+        assert '_feature_coverage(' in _body('_build_coverage_map')
+        for caller in ('sync_status', '_build_report_data'):
+            assert '_build_coverage_map(' in _body(caller), (
+                f"{caller} must take status from _build_coverage_map()"
+            )
+        assert '_feature_coverage(' in _body('_compute_drift'), (
+            "_compute_drift must take status from _feature_coverage()"
         )
 
     @pytest.mark.proof("sync_status", "PROOF-60", "RULE-34", tier="e2e")
@@ -49,6 +49,8 @@ CONF
   # Copy the real MCP server files so sync_status works
   cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$tmpdir/scripts/mcp/purlin_server.py"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$tmpdir/scripts/mcp/config_engine.py"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$tmpdir/scripts/mcp/spec_parser.py"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$tmpdir/scripts/mcp/purlin_daemon.py"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$tmpdir/scripts/mcp/__init__.py" 2>/dev/null || true
 
   # Create a spec with 2 rules
@@ -540,6 +542,8 @@ FAKE_LLM="$REAL_PROJECT_ROOT/dev/fake_audit_llm.sh"
 mkdir -p "$TMPDIR_E/.purlin" "$TMPDIR_E/specs/auth" "$TMPDIR_E/scripts/mcp"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$TMPDIR_E/scripts/mcp/purlin_server.py"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$TMPDIR_E/scripts/mcp/config_engine.py"
+cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$TMPDIR_E/scripts/mcp/spec_parser.py"
+cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$TMPDIR_E/scripts/mcp/purlin_daemon.py"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$TMPDIR_E/scripts/mcp/__init__.py" 2>/dev/null || true
 
 # Config points to our fake LLM — same pattern as a real user would configure
@@ -47,6 +47,8 @@ echo '{"version":"0.9.0","test_framework":"shell","spec_dir":"specs"}' > "$TMPDI
 # Copy the real MCP server files
 cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$TMPDIR/scripts/mcp/purlin_server.py"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$TMPDIR/scripts/mcp/config_engine.py"
+cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$TMPDIR/scripts/mcp/spec_parser.py"
+cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$TMPDIR/scripts/mcp/purlin_daemon.py"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$TMPDIR/scripts/mcp/__init__.py" 2>/dev/null || true
 
 # Create the scope file
@@ -30,6 +30,8 @@ create_test_project() {
   # Copy the real MCP server files
   cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$tmpdir/scripts/mcp/purlin_server.py"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$tmpdir/scripts/mcp/config_engine.py"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$tmpdir/scripts/mcp/spec_parser.py"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$tmpdir/scripts/mcp/purlin_daemon.py"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$tmpdir/scripts/mcp/__init__.py" 2>/dev/null || true
 
   # Anchor spec: api_conventions with 2 rules
@@ -29,6 +29,8 @@ create_test_project() {
   # Copy the real MCP server files so sync_status works
   cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$tmpdir/scripts/mcp/purlin_server.py"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$tmpdir/scripts/mcp/config_engine.py"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$tmpdir/scripts/mcp/spec_parser.py"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$tmpdir/scripts/mcp/purlin_daemon.py"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$tmpdir/scripts/mcp/__init__.py" 2>/dev/null || true
 
   # Create a spec with the requested number of rules
@@ -325,6 +327,8 @@ mkdir -p "$TMPDIR_E/scripts/mcp"
 echo '{"version":"0.9.0","test_framework":"shell","spec_dir":"specs"}' > "$TMPDIR_E/.purlin/config.json"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$TMPDIR_E/scripts/mcp/purlin_server.py"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$TMPDIR_E/scripts/mcp/config_engine.py"
+cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$TMPDIR_E/scripts/mcp/spec_parser.py"
+cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$TMPDIR_E/scripts/mcp/purlin_daemon.py"
 cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$TMPDIR_E/scripts/mcp/__init__.py" 2>/dev/null || true
 
 # Behavioral spec
@@ -124,6 +124,8 @@ with open('$tmpdir/.purlin/config.json', 'w') as f:
   mkdir -p "$tmpdir/scripts/mcp"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_server.py" "$tmpdir/scripts/mcp/"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/config_engine.py" "$tmpdir/scripts/mcp/"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/spec_parser.py" "$tmpdir/scripts/mcp/"
+  cp "$REAL_PROJECT_ROOT/scripts/mcp/purlin_daemon.py" "$tmpdir/scripts/mcp/"
   cp "$REAL_PROJECT_ROOT/scripts/mcp/__init__.py" "$tmpdir/scripts/mcp/" 2>/dev/null || true
 
   # Initialize git repo if not already
@@ -3,10 +3,13 @@
 import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from io import StringIO
 from unittest.mock import patch
 
@@ -76,6 +79,177 @@ class TestMCPProtocol:
         assert "nonexistent" in resp["error"]["message"]
 
 
+class TestConcurrentDispatch:
+    """mcp_transport RULE-8, RULE-9: concurrent tools/call dispatch and cancellation."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    @staticmethod
+    def _call(req_id, tool):
+        return json.dumps({"jsonrpc": "2.0", "id": req_id, "method": "tools/call",
+                           "params": {"name": tool, "arguments": {}}}) + '\n'
+
+    @staticmethod
+    def _cancel(req_id):
+        return json.dumps({"jsonrpc": "2.0", "method": "notifications/cancelled",
+                           "params": {"requestId": req_id}}) + '\n'
+
+    def _serve(self, stdin_lines, stdout_mock=None):
+        stdout_mock = stdout_mock or StringIO()
+        with patch.dict(os.environ, {"PURLIN_PROJECT_ROOT": self.project_root}), \
+             patch('sys.stdin', stdin_lines), patch('sys.stdout', stdout_mock), \
+             patch('sys.stderr', StringIO()):
+            purlin_server.main()
+        return [json.loads(l) for l in stdout_mock.getvalue().splitlines()]
+
+    @pytest.mark.proof("mcp_transport", "PROOF-8", "RULE-8")
+    def test_fast_call_answered_while_slow_call_runs(self):
+        fast_written = threading.Event()
+
+        class Stdout(StringIO):
+            def write(self, text):
+                n = super().write(text)
+                if '"id": 2' in text:
+                    fast_written.set()
+                return n
+
+        def slow_sync_status(project_root, **kwargs):
+            # Only returns once the later purlin_config response is out
+            assert fast_written.wait(5)
+            return 'slow done'
+
+        with patch.object(purlin_server, 'sync_status', side_effect=slow_sync_status), \
+             patch.object(purlin_server, 'handle_purlin_config', return_value='fast done'):
+            responses = self._serve(StringIO(
+                self._call(1, 'sync_status') + self._call(2, 'purlin_config')), Stdout())
+        assert [r['id'] for r in responses] == [2, 1]
+        assert responses[1]['result']['content'][0]['text'] == 'slow done'
+
+    @pytest.mark.proof("mcp_transport", "PROOF-9", "RULE-9")
+    def test_cancelled_calls_stop_and_send_no_response(self):
+        started = threading.Event()
+        observed = []
+
+        def cancellable_sync_status(project_root, **kwargs):
+            started.set()
+            deadline = time.time() + 5
+            try:
+                while time.time() < deadline:
+                    purlin_server._check_cancelled()
+                    time.sleep(0.01)
+            except purlin_server.RequestCancelled:
+                observed.append('cancelled')
+                raise
+            return 'not cancelled'
+
+        def stdin_lines():
+            yield self._call(1, 'sync_status')
+            assert started.wait(5)
+            # id 2 queues behind the single busy worker, then both are cancelled
+            yield self._call(2, 'drift')
+            yield self._cancel(2)
+            yield self._cancel(1)
+            yield self._call(3, 'purlin_config')
+
+        with patch.object(purlin_server, '_MAX_WORKERS', 1), \
+             patch.object(purlin_server, 'sync_status', side_effect=cancellable_sync_status), \
+             patch.object(purlin_server, 'drift', return_value='drift ran') as drift, \
+             patch.object(purlin_server, 'handle_purlin_config', return_value='config'):
+            responses = self._serve(stdin_lines())
+        assert observed == ['cancelled']
+        assert drift.call_count == 0
+        assert [r['id'] for r in responses] == [3]
+
+    @pytest.mark.proof("mcp_transport", "PROOF-12", "RULE-12")
+    def test_concurrent_writes_to_one_file_do_not_collide(self):
+        payloads = [{'writer': n, 'data': [n] * 20000} for n in range(8)]
+        barrier = threading.Barrier(len(payloads))
+        errors = []
+
+        def write(payload):
+            try:
+                barrier.wait(5)
+                purlin_server._write_cache_json(self.project_root, 'shared.json', payload)
+            except Exception as exc:  # noqa: BLE001 — surfaced by the assert below
+                errors.append(exc)
+
+        for _ in range(5):
+            threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert errors == []
+        cache_dir = os.path.dirname(purlin_server._cache_path(self.project_root, 'shared.json'))
+        with open(os.path.join(cache_dir, 'shared.json')) as f:
+            assert json.load(f) in payloads
+        assert os.listdir(cache_dir) == ['shared.json']
+
+
+class TestHotReload:
+    """mcp_transport RULE-10, RULE-11: interval-based reload of all server modules."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    def _serve(self, stdin_lines, interval):
+        with open(os.path.join(self.project_root, '.purlin', 'config.json'), 'w') as f:
+            json.dump({'mcp_reload_interval': interval}, f)
+        with patch.dict(os.environ, {"PURLIN_PROJECT_ROOT": self.project_root}), \
+             patch('sys.stdin', stdin_lines), patch('sys.stdout', StringIO()), \
+             patch('sys.stderr', StringIO()):
+            purlin_server.main()
+
+    @staticmethod
+    def _requests(n):
+        return ''.join(json.dumps({"jsonrpc": "2.0", "id": i, "method": "tools/list"}) + '\n'
+                       for i in range(n))
+
+    @pytest.mark.proof("mcp_transport", "PROOF-10", "RULE-10")
+    def test_sources_checked_at_most_once_per_interval(self):
+        changed = {name: -1 for name in purlin_server._SERVER_MODULES}
+        with patch.object(purlin_server, '_module_mtimes',
+                          side_effect=[{}] + [changed] * 10) as mtimes, \
+             patch.object(purlin_server, '_reload_server_modules',
+                          return_value=purlin_server) as reload:
+            self._serve(StringIO(self._requests(5)), 3600)
+            # Only the startup snapshot: no check within the interval
+            assert mtimes.call_count == 1
+            assert reload.call_count == 0
+
+            mtimes.reset_mock(side_effect=True)
+            mtimes.side_effect = [{}] + [changed] * 10
+
+            def paced():
+                for line in self._requests(3).splitlines(keepends=True):
+                    time.sleep(0.06)
+                    yield line
+            self._serve(paced(), 0.05)
+            # Every module is reloaded together once a change is seen
+            assert reload.call_count == 1
+            assert mtimes.call_count >= 2
+
+    @pytest.mark.proof("mcp_transport", "PROOF-11", "RULE-11")
+    def test_reload_preserves_resident_model_of_same_format(self):
+        purlin_server._RESIDENT[('json', '/sentinel')] = ([1, 1], {'kept': True})
+        module = purlin_server._reload_server_modules()
+        assert module is purlin_server
+        assert purlin_server._RESIDENT[('json', '/sentinel')][1] == {'kept': True}
+
+        purlin_server._resident_format = ('older format',)
+        purlin_server._reload_server_modules()
+        assert ('json', '/sentinel') not in purlin_server._RESIDENT
+
+
 class TestSyncStatus:
     """sync_status RULE-1 through RULE-15: coverage reporting."""
 
@@ -876,6 +1050,606 @@ class TestSyncStatus:
         assert 'Legacy MCP config' not in result, \
             'Absent .mcp.json must not trigger the advisory'
 
+    @pytest.mark.proof("sync_status", "PROOF-71", "RULE-41")
+    def test_coverage_computed_once_per_feature(self):
+        self._write_spec('api_conv', (
+            '# Anchor: api_conv\n\n'
+            '## Rules\n- RULE-1: JSON envelope\n\n'
+            '## Proof\n- PROOF-1 (RULE-1): Check JSON\n'
+        ), subdir='schema')
+        self._write_spec('login', (
+            '# Feature: login\n\n'
+            '> Requires: api_conv\n\n'
+            '## Rules\n- RULE-1: Return 200\n\n'
+            '## Proof\n- PROOF-1 (RULE-1): POST valid creds\n'
+        ))
+        self._write_proofs('login', [
+            {"feature": "login", "id": "PROOF-1", "rule": "RULE-1",
+             "test_file": "tests/test.py", "test_name": "test_valid",
+             "status": "pass", "tier": "unit"},
+        ])
+        self._write_proofs('api_conv', [
+            {"feature": "api_conv", "id": "PROOF-1", "rule": "RULE-1",
+             "test_file": "tests/test.py", "test_name": "test_json",
+             "status": "pass", "tier": "unit"},
+        ], subdir='schema')
+        with open(os.path.join(self.project_root, '.purlin', 'config.json'), 'w') as f:
+            json.dump({'report': True}, f)
+
+        calls = []
+        real = purlin_server._build_coverage_rules
+
+        def counting(name, *args, **kwargs):
+            calls.append(name)
+            return real(name, *args, **kwargs)
+
+        with patch.object(purlin_server, '_build_coverage_rules', side_effect=counting):
+            result = purlin_server.sync_status(self.project_root)
+
+        # One coverage computation per spec feeds the detail report, the
+        # summary table and report data alike
+        assert sorted(calls) == ['api_conv', 'login']
+        assert 'login: PASSING' in result
+        with open(os.path.join(self.project_root, '.purlin', 'report-data.js')) as f:
+            report_js = f.read()
+        data = json.loads(report_js[report_js.index('{'):report_js.rindex('}') + 1])
+        statuses = {f['name']: (f['proved'], f['total'], f['status']) for f in data['features']}
+        assert statuses == {'login': (2, 2, 'PASSING'), 'api_conv': (1, 1, 'PASSING')}
+
+
+class TestSpecIndex:
+    """sync_status RULE-39: persistent incremental spec index."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+        self.spec_path = os.path.join(self.project_root, 'specs', 'auth', 'login.md')
+        os.makedirs(os.path.dirname(self.spec_path))
+        self.index_path = os.path.join(
+            self.project_root, '.purlin', 'cache', 'spec_index.json')
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    def _write_spec(self, rule_text, age_seconds=60):
+        with open(self.spec_path, 'w') as f:
+            f.write('# Feature: login\n\n## Rules\n'
+                    f'- RULE-1: {rule_text}\n\n'
+                    '## Proof\n- PROOF-1 (RULE-1): POST valid creds\n')
+        # Age the file past the racy window so its signature is cacheable
+        old = os.path.getmtime(self.spec_path) - age_seconds
+        os.utime(self.spec_path, (old, old))
+
+    def _read_index(self):
+        with open(self.index_path) as f:
+            return json.load(f)
+
+    def _write_index(self, index):
+        with open(self.index_path, 'w') as f:
+            json.dump(index, f)
+
+    @pytest.mark.proof("sync_status", "PROOF-69", "RULE-39")
+    def test_unchanged_spec_reuses_index_entry(self):
+        self._write_spec('Return 200')
+        features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'Return 200'}
+
+        index = self._read_index()
+        assert index['version'] == purlin_server._SPEC_INDEX_VERSION
+        entry = index['entries'][os.path.join('specs', 'auth', 'login.md')]
+        st = os.stat(self.spec_path)
+        assert entry['sig'] == [st.st_mtime_ns, st.st_size]
+
+        # Tamper with the cached parse result: an unchanged stat signature
+        # means the spec is not re-read, so the tampered value is returned.
+        entry['info']['rules'] = {'RULE-1': 'from index'}
+        self._write_index(index)
+        purlin_server._RESIDENT.clear()  # fresh process: only the disk index
+        features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'from index'}
+        assert isinstance(features['login']['deferred_rules'], set)
+
+    @pytest.mark.proof("sync_status", "PROOF-69", "RULE-39")
+    def test_changed_signature_reparses_spec(self):
+        self._write_spec('Return 200')
+        purlin_server._scan_specs(self.project_root)
+
+        self._write_spec('Return 201 on create', age_seconds=30)
+        features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'Return 201 on create'}
+        entry = self._read_index()['entries'][os.path.join('specs', 'auth', 'login.md')]
+        assert entry['info']['rules'] == {'RULE-1': 'Return 201 on create'}
+
+    @pytest.mark.proof("sync_status", "PROOF-69", "RULE-39")
+    def test_version_mismatch_discards_index(self):
+        self._write_spec('Return 200')
+        purlin_server._scan_specs(self.project_root)
+        index = self._read_index()
+        index['version'] = purlin_server._SPEC_INDEX_VERSION - 1
+        for entry in index['entries'].values():
+            entry['info']['rules'] = {'RULE-1': 'old parser'}
+        self._write_index(index)
+        purlin_server._RESIDENT.clear()
+
+        features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'Return 200'}
+        assert self._read_index()['version'] == purlin_server._SPEC_INDEX_VERSION
+
+    @pytest.mark.proof("sync_status", "PROOF-69", "RULE-39")
+    def test_recently_modified_spec_is_not_indexed(self):
+        self._write_spec('Return 200', age_seconds=0)
+        features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'Return 200'}
+        assert self._read_index()['entries'] == {}
+
+
+class TestResidentModel:
+    """sync_status RULE-40: resident in-memory project model."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+        self.spec_dir = os.path.join(self.project_root, 'specs', 'auth')
+        os.makedirs(self.spec_dir)
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    def _write(self, name, content, age_seconds=60):
+        path = os.path.join(self.spec_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        old = os.path.getmtime(path) - age_seconds
+        os.utime(path, (old, old))
+        return path
+
+    def _write_proof(self, status, age_seconds=60):
+        return self._write('login.proofs-unit.json', json.dumps({
+            'tier': 'unit',
+            'proofs': [{'feature': 'login', 'id': 'PROOF-1', 'rule': 'RULE-1',
+                        'test_file': 't.py', 'test_name': 'test_x',
+                        'status': status, 'tier': 'unit'}],
+        }), age_seconds)
+
+    @pytest.mark.proof("sync_status", "PROOF-70", "RULE-40")
+    def test_unchanged_spec_served_from_memory(self):
+        self._write('login.md', '# Feature: login\n\n## Rules\n- RULE-1: Return 200\n')
+        purlin_server._scan_specs(self.project_root)
+
+        # Neither the disk index nor the parser is needed for an unchanged spec
+        os.remove(os.path.join(self.project_root, '.purlin', 'cache', 'spec_index.json'))
+        with patch.object(purlin_server, '_parse_spec', side_effect=AssertionError('re-parsed')):
+            features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'Return 200'}
+
+        # A changed spec is invalidated individually and re-parsed
+        self._write('login.md', '# Feature: login\n\n## Rules\n- RULE-1: Return 201\n',
+                    age_seconds=30)
+        features = purlin_server._scan_specs(self.project_root)
+        assert features['login']['rules'] == {'RULE-1': 'Return 201'}
+
+    @pytest.mark.proof("sync_status", "PROOF-70", "RULE-40")
+    def test_unchanged_proof_file_not_reread(self):
+        self._write('login.md', '# Feature: login\n\n## Rules\n- RULE-1: Return 200\n')
+        self._write_proof('pass')
+        assert purlin_server._read_proofs(self.project_root)['login'][0]['status'] == 'pass'
+
+        with patch('builtins.open', side_effect=AssertionError('file re-read')):
+            proofs = purlin_server._read_proofs(self.project_root)
+        assert proofs['login'][0]['status'] == 'pass'
+
+        self._write_proof('fail', age_seconds=30)
+        assert purlin_server._read_proofs(self.project_root)['login'][0]['status'] == 'fail'
+
+    @pytest.mark.proof("sync_status", "PROOF-70", "RULE-40")
+    def test_recently_written_file_always_reread(self):
+        self._write('login.md', '# Feature: login\n\n## Rules\n- RULE-1: Return 200\n')
+        self._write_proof('pass', age_seconds=0)
+        purlin_server._read_proofs(self.project_root)
+        self._write_proof('fail', age_seconds=0)
+        assert purlin_server._read_proofs(self.project_root)['login'][0]['status'] == 'fail'
+
+
+    def _write_audit_shard(self, assessments, age_seconds=60):
+        shard_dir = os.path.join(self.project_root, '.purlin', 'cache', 'audit_cache.d')
+        os.makedirs(shard_dir, exist_ok=True)
+        path = os.path.join(shard_dir, 'login.json')
+        with open(path, 'w') as f:
+            json.dump({f'h{n}': {'assessment': level, 'feature': 'login',
+                                 'proof_id': f'PROOF-{n}', 'rule_id': f'RULE-{n}',
+                                 'priority': 'HIGH', 'criterion': '', 'fix': '',
+                                 'cached_at': '2026-04-01T00:00:00+00:00'}
+                       for n, level in enumerate(assessments, 1)}, f)
+        old = os.path.getmtime(path) - age_seconds
+        os.utime(path, (old, old))
+
+    @pytest.mark.proof("sync_status", "PROOF-78", "RULE-48")
+    def test_audit_cache_indexed_once_per_change(self):
+        self._write('login.md', '# Feature: login\n\n## Rules\n'
+                                '- RULE-1: Return 200\n- RULE-2: Return 401\n')
+        self._write_audit_shard(['STRONG', 'WEAK'])
+
+        load = patch.object(purlin_server, '_read_audit_cache',
+                            wraps=purlin_server._read_audit_cache)
+        with load as read_cache:
+            summary = purlin_server._read_audit_summary(self.project_root)
+            by_feature = purlin_server._read_audit_cache_by_feature(self.project_root)
+            feature_audit, by_proof = purlin_server._audit_lookups(self.project_root)
+            purlin_server.sync_status(self.project_root)
+        assert read_cache.call_count == 1
+        assert (summary['strong'], summary['weak'], summary['integrity']) == (1, 1, 50)
+        assert len(by_feature['login']) == 2
+        assert feature_audit['login']['integrity'] == 50
+        assert [f['proof_id'] for f in feature_audit['login']['findings']] == ['PROOF-2']
+        assert by_proof[('login', 'PROOF-2')] == 'WEAK'
+
+        # A changed shard rebuilds the index
+        self._write_audit_shard(['STRONG', 'STRONG'], age_seconds=30)
+        assert purlin_server._read_audit_summary(self.project_root)['integrity'] == 100
+
+
+class TestReceiptIndex:
+    """sync_status RULE-42: receipts are located through one indexed tree walk."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        self.specs = os.path.join(self.project_root, 'specs')
+        for sub in ('auth', 'billing'):
+            os.makedirs(os.path.join(self.specs, sub))
+        self._write_receipt('auth', 'login', 'aaaa1111')
+        self._write_receipt('billing', 'invoice', 'bbbb2222')
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    def _write_receipt(self, sub, name, vhash):
+        with open(os.path.join(self.specs, sub, f'{name}.receipt.json'), 'w') as f:
+            json.dump({'feature': name, 'vhash': vhash}, f)
+
+    def _age_tree(self):
+        old = time.time() - 60
+        for root, dirs, files in os.walk(self.specs):
+            for entry in files:
+                os.utime(os.path.join(root, entry), (old, old))
+            os.utime(root, (old, old))
+
+    @pytest.mark.proof("sync_status", "PROOF-72", "RULE-42")
+    def test_one_walk_serves_all_receipt_lookups(self):
+        self._age_tree()
+        real_scandir = os.scandir
+        listed = []
+
+        def counting_scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+
+        with patch.object(purlin_server.os, 'scandir', side_effect=counting_scandir):
+            assert purlin_server._read_receipt(self.project_root, 'login')['vhash'] == 'aaaa1111'
+            assert purlin_server._read_receipt(self.project_root, 'invoice')['vhash'] == 'bbbb2222'
+            assert purlin_server._read_receipt(self.project_root, 'missing') is None
+        # specs/, auth/ and billing/ are each listed once in total
+        assert sorted(listed) == sorted([
+            self.specs, os.path.join(self.specs, 'auth'), os.path.join(self.specs, 'billing'),
+        ])
+
+    @pytest.mark.proof("sync_status", "PROOF-72", "RULE-42")
+    def test_added_receipt_invalidates_index(self):
+        self._age_tree()
+        assert purlin_server._read_receipt(self.project_root, 'signup') is None
+        self._write_receipt('auth', 'signup', 'cccc3333')
+        assert purlin_server._read_receipt(self.project_root, 'signup')['vhash'] == 'cccc3333'
+
+
+class TestSpecTree:
+    """sync_status RULE-43: one directory walk classifies specs, proofs and receipts."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        self.specs = os.path.join(self.project_root, 'specs')
+        files = {
+            'auth/login.md': '# Feature: login\n\n## Rules\n- RULE-1: Return 200\n',
+            'auth/login.proofs-unit.json': json.dumps({'tier': 'unit', 'proofs': [
+                {'feature': 'login', 'id': 'PROOF-1', 'rule': 'RULE-1',
+                 'test_file': 't.py', 'test_name': 'test_ok', 'status': 'pass', 'tier': 'unit'},
+            ]}),
+            'auth/login.receipt.json': json.dumps({'feature': 'login', 'vhash': 'aaaa1111'}),
+            'auth/.hidden.md': '# Feature: hidden\n',
+            '.drafts/draft.md': '# Feature: draft\n',
+            'notes.txt': 'not a spec',
+        }
+        for rel, content in files.items():
+            path = os.path.join(self.specs, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(content)
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    @pytest.mark.proof("sync_status", "PROOF-73", "RULE-43")
+    def test_single_walk_classifies_tree(self):
+        tree = purlin_server._spec_tree(self.project_root)
+        auth = os.path.join(self.specs, 'auth')
+        assert tree['specs'] == [os.path.join(auth, 'login.md')]
+        assert tree['proofs'] == [os.path.join(auth, 'login.proofs-unit.json')]
+        assert tree['receipts'] == {'login': [os.path.join(auth, 'login.receipt.json')]}
+
+    @pytest.mark.proof("sync_status", "PROOF-73", "RULE-43")
+    def test_scan_proofs_and_receipts_share_one_walk(self):
+        old = time.time() - 60
+        for root, dirs, files in os.walk(self.specs):
+            for entry in files:
+                os.utime(os.path.join(root, entry), (old, old))
+            os.utime(root, (old, old))
+        real_scandir = os.scandir
+        listed = []
+
+        def counting_scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+
+        with patch.object(purlin_server.os, 'scandir', side_effect=counting_scandir):
+            features = purlin_server._scan_specs(self.project_root)
+            proofs = purlin_server._read_proofs(self.project_root)
+            receipt = purlin_server._read_receipt(self.project_root, 'login')
+        assert set(features) == {'login'}
+        assert proofs['login'][0]['status'] == 'pass'
+        assert receipt['vhash'] == 'aaaa1111'
+        # Hidden directories are never entered; every other one is listed once
+        assert sorted(listed) == sorted([self.specs, os.path.join(self.specs, 'auth')])
+
+
+class TestAnchorStaleness:
+    """sync_status RULE-44: external anchor checks run concurrently and are TTL-cached."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+        self.calls = []
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    def _fake_ls_remote(self, heads, barrier=None):
+        lock = threading.Lock()
+
+        def fake(url, project_root=None):
+            with lock:
+                self.calls.append(url)
+            if barrier is not None:
+                barrier.wait()
+            return {'remote_sha': heads[url]}
+        return fake
+
+    @pytest.mark.proof("sync_status", "PROOF-74", "RULE-44")
+    def test_distinct_sources_queried_concurrently_once_each(self):
+        heads = {'git@example.com:a.git': 'aaaa' * 10, 'git@example.com:b.git': 'bbbb' * 10}
+        # Both lookups must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+        with patch.object(purlin_server, '_ls_remote_head',
+                          side_effect=self._fake_ls_remote(heads, barrier)):
+            results = purlin_server._check_anchors_staleness(self.project_root, [
+                ('git@example.com:a.git', 'aaaa'),
+                ('git@example.com:a.git', 'cccc'),
+                ('git@example.com:b.git', 'bbbb'),
+            ])
+        assert sorted(self.calls) == sorted(heads)
+        assert results[('git@example.com:a.git', 'aaaa')]['status'] == 'current'
+        assert results[('git@example.com:a.git', 'cccc')]['status'] == 'stale'
+        assert results[('git@example.com:b.git', 'bbbb')]['status'] == 'current'
+
+    @pytest.mark.proof("sync_status", "PROOF-74", "RULE-44")
+    def test_remote_heads_cached_for_ttl(self):
+        local = os.path.join(self.project_root, 'local.git')
+        heads = {'git@example.com:a.git': 'aaaa' * 10, local: 'dddd' * 10}
+        anchors = [('git@example.com:a.git', 'aaaa'), (local, 'dddd')]
+        with patch.object(purlin_server, '_ls_remote_head',
+                          side_effect=self._fake_ls_remote(heads)):
+            purlin_server._check_anchors_staleness(self.project_root, anchors)
+            self.calls.clear()
+            results = purlin_server._check_anchors_staleness(self.project_root, anchors)
+            # Remote served from cache; local paths are always re-queried
+            assert self.calls == [local]
+            assert results[anchors[0]]['status'] == 'current'
+
+            with open(os.path.join(self.project_root, '.purlin', 'config.json'), 'w') as f:
+                json.dump({'anchor_staleness_ttl': 0}, f)
+            self.calls.clear()
+            purlin_server._check_anchors_staleness(self.project_root, anchors)
+            assert sorted(self.calls) == sorted(heads)
+
+    @pytest.mark.proof("sync_status", "PROOF-74", "RULE-44")
+    def test_failed_lookup_not_cached(self):
+        url = 'git@example.com:down.git'
+        with patch.object(purlin_server, '_ls_remote_head',
+                          return_value={'error': 'Timeout reaching remote'}) as fake:
+            first = purlin_server._check_anchors_staleness(self.project_root, [(url, 'abc')])
+            purlin_server._check_anchors_staleness(self.project_root, [(url, 'abc')])
+        assert first[(url, 'abc')]['status'] == 'error'
+        assert fake.call_count == 2
+
+
+class TestManualStaleness:
+    """sync_status RULE-45: manual proof staleness is answered from one git log walk."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+        self._git('init', '-q')
+        self._git('config', 'user.email', 'dev@test.com')
+        self._git('config', 'user.name', 'dev')
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    def _git(self, *args):
+        return subprocess.run(['git'] + list(args), cwd=self.project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+
+    def _commit(self, message, files):
+        for rel, content in files.items():
+            path = os.path.join(self.project_root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(content)
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', message)
+        return self._git('rev-parse', '--short', 'HEAD')
+
+    def _info(self, scope, sha):
+        return {'scope': scope, 'manual_proofs': {
+            'PROOF-1': {'stamped': True, 'commit_sha': sha},
+        }}
+
+    def _count_git_logs(self, fn):
+        calls = []
+        real_run = subprocess.run
+
+        def recording_run(cmd, *args, **kwargs):
+            if cmd[:2] == ['git', 'log']:
+                calls.append(cmd)
+            return real_run(cmd, *args, **kwargs)
+        with patch.object(purlin_server.subprocess, 'run', side_effect=recording_run):
+            result = fn()
+        return result, len(calls)
+
+    @pytest.mark.proof("sync_status", "PROOF-75", "RULE-45")
+    def test_all_features_answered_from_one_walk_and_cached_by_head(self):
+        c1 = self._commit('c1', {'src/a.py': 'a1', 'src/b.py': 'b1', 'docs/x.md': 'x1'})
+        c2 = self._commit('c2', {'src/b.py': 'b2'})
+        self._git('checkout', '-q', '-b', 'side')
+        side = self._commit('side', {'docs/y.md': 'y1'})
+        self._git('checkout', '-q', '-')
+        self._commit('c3', {'docs/x.md': 'x2'})
+        self._git('merge', '-q', '--no-ff', '-m', 'merge side', 'side')
+
+        checks = {
+            ('src/a.py', c1): False,     # never touched again
+            ('src/', c1): True,          # directory: src/b.py changed in c2
+            ('src/*.py', c2): False,     # glob: only docs changed since c2
+            ('docs/x.md', c2): True,     # changed in c3
+            ('docs/y.md', side): False,  # side branch merged without later edits
+            ('src/a.py', 'deadbee'): False,  # unknown SHA is never stale
+        }
+        infos = [self._info([scope], sha) for scope, sha in checks]
+
+        results, logs = self._count_git_logs(
+            lambda: purlin_server._manual_staleness_map(self.project_root, infos))
+        assert logs == 1
+        assert {(scope[0], sha): stale for (scope, sha), stale in results.items()} == checks
+
+        # Unchanged HEAD: served from .purlin/cache without walking history
+        again, logs = self._count_git_logs(
+            lambda: purlin_server._manual_staleness_map(self.project_root, infos))
+        assert logs == 0
+        assert again == results
+
+        # HEAD moved: recomputed
+        self._commit('c4', {'src/a.py': 'a2'})
+        moved, logs = self._count_git_logs(
+            lambda: purlin_server._manual_staleness_map(self.project_root, infos))
+        assert logs == 1
+        assert moved[(('src/a.py',), c1)] is True
+
+
+class TestSyncStatusSelection:
+    """sync_status RULE-46: paginated, filtered and compact output."""
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+        # name -> (category, proof statuses for RULE-1 and RULE-2)
+        for name, category, statuses in [
+            ('alpha', 'auth', ['pass', 'pass']),
+            ('bravo', 'auth', ['fail', 'pass']),
+            ('charlie', 'auth', []),
+            ('delta', 'billing', ['pass']),
+            ('echo', 'billing', ['pass', 'pass']),
+        ]:
+            d = os.path.join(self.project_root, 'specs', category)
+            os.makedirs(d, exist_ok=True)
+            with open(os.path.join(d, f'{name}.md'), 'w') as f:
+                f.write(f'# Feature: {name}\n\n## Rules\n- RULE-1: one\n- RULE-2: two\n\n'
+                        '## Proof\n- PROOF-1 (RULE-1): a\n- PROOF-2 (RULE-2): b\n')
+            if statuses:
+                with open(os.path.join(d, f'{name}.proofs-unit.json'), 'w') as f:
+                    json.dump({'tier': 'unit', 'proofs': [
+                        {'feature': name, 'id': f'PROOF-{i}', 'rule': f'RULE-{i}',
+                         'test_file': 't.py', 'test_name': f't{i}', 'status': st, 'tier': 'unit'}
+                        for i, st in enumerate(statuses, 1)
+                    ]}, f)
+
+    def teardown_method(self):
+        shutil.rmtree(self.project_root)
+
+    @staticmethod
+    def _detailed(output):
+        return [line.split(':')[0] for line in output.splitlines()
+                if re.match(r'^[a-z]+: ', line)]
+
+    @staticmethod
+    def _table(output):
+        return [line.split()[1] for line in output.splitlines()
+                if line.startswith('\u2502 ') and 'Feature' not in line]
+
+    @pytest.mark.proof("sync_status", "PROOF-76", "RULE-46")
+    def test_cursor_pages_cover_every_spec_once(self):
+        seen = []
+        cursor = None
+        for _ in range(5):
+            output = purlin_server.sync_status(self.project_root, page_size=2, cursor=cursor)
+            page = self._detailed(output)
+            assert len(page) <= 2 and sorted(self._table(output)) == sorted(page)
+            seen.extend(page)
+            m = re.search(r'cursor "(\d+)"', output)
+            if not m:
+                break
+            cursor = m.group(1)
+        assert seen == ['alpha', 'bravo', 'charlie', 'delta', 'echo']
+        assert 'Showing specs 5\u20135 of 5' in output
+        assert purlin_server.sync_status(self.project_root, cursor='bogus').startswith('Error')
+
+    @pytest.mark.proof("sync_status", "PROOF-76", "RULE-46")
+    def test_status_and_category_filters(self):
+        output = purlin_server.sync_status(self.project_root, status=['FAILING', 'partial'])
+        assert sorted(self._table(output)) == ['bravo', 'delta']
+        output = purlin_server.sync_status(self.project_root, status='PASSING',
+                                           category='billing')
+        assert self._table(output) == ['echo']
+        assert self._detailed(output) == ['echo']
+
+    @pytest.mark.proof("sync_status", "PROOF-76", "RULE-46")
+    def test_compact_keeps_table_and_non_green_detail(self):
+        output = purlin_server.sync_status(self.project_root, compact=True)
+        assert sorted(self._table(output)) == ['alpha', 'bravo', 'charlie', 'delta', 'echo']
+        assert self._detailed(output) == ['bravo', 'charlie', 'delta']
+        # Without selection arguments the report is unchanged
+        full = purlin_server.sync_status(self.project_root)
+        assert self._detailed(full) == ['alpha', 'bravo', 'charlie', 'delta', 'echo']
+        assert 'Showing specs' not in full
+
+    @pytest.mark.proof("sync_status", "PROOF-77", "RULE-47")
+    def test_json_format_reports_status_and_rules(self):
+        with patch.object(purlin_server, '_report_feature') as report_feature:
+            result = json.loads(purlin_server.sync_status(self.project_root, output_format='json'))
+        # JSON mode never renders the text detail
+        assert report_feature.call_count == 0
+        by_name = {f['name']: f for f in result['features']}
+        assert sorted(by_name) == ['alpha', 'bravo', 'charlie', 'delta', 'echo']
+        assert by_name['bravo']['status'] == 'FAILING'
+        assert by_name['bravo']['failing_rules'] == ['RULE-1']
+        assert (by_name['delta']['proved'], by_name['delta']['total']) == (1, 2)
+        assert by_name['delta']['unproved_rules'] == ['RULE-2']
+        assert by_name['alpha']['type'] == 'feature' and by_name['alpha']['category'] == 'auth'
+        assert result['summary'] == {'total_features': 5, 'verified': 0, 'passing': 2,
+                                     'partial': 1, 'failing': 1, 'untested': 1}
+        assert result['next_cursor'] is None
+
+        page = json.loads(purlin_server.sync_status(
+            self.project_root, output_format='json', status='FAILING,PARTIAL', page_size=1))
+        assert [f['name'] for f in page['features']] == ['bravo']
+        assert (page['selected'], page['next_cursor']) == (2, '1')
+
 
 class TestIntegrityFormula:
     """sync_status RULE-33: integrity formula consistency."""
@@ -1102,6 +1876,81 @@ class TestDrift:
         assert 'login' in data['proof_status']
         assert data['proof_status']['login']['total'] == 4
 
+    @pytest.mark.proof("drift", "PROOF-20", "RULE-17")
+    def test_diff_data_fetched_in_batched_git_calls(self):
+        signup_dir = os.path.join(self.project_root, 'specs', 'onboarding')
+        os.makedirs(signup_dir)
+        with open(os.path.join(signup_dir, 'signup.md'), 'w') as f:
+            f.write('# Feature: signup\n\n## Rules\n- RULE-1: Create account\n\n'
+                    '## Proof\n- PROOF-1 (RULE-1): Test\n')
+        for i in range(5):
+            with open(os.path.join(self.project_root, 'tests', f'test_extra_{i}.py'), 'w') as f:
+                f.write('x = 1\ny = 2\n')
+        subprocess.run(['git', 'add', '.'], cwd=self.project_root,
+                       capture_output=True, check=True)
+        subprocess.run(['git', 'commit', '-m', 'feat: signup'],
+                       cwd=self.project_root, capture_output=True, check=True)
+
+        real_run = subprocess.run
+        diff_calls = []
+
+        def recording_run(cmd, *args, **kwargs):
+            if cmd[:1] == ['git'] and 'diff' in cmd:
+                diff_calls.append(cmd)
+            return real_run(cmd, *args, **kwargs)
+
+        with patch.object(purlin_server.subprocess, 'run', side_effect=recording_run):
+            data = purlin_server._compute_drift(self.project_root)
+
+        # One numstat call for the whole range + one diff for all specs
+        assert len(diff_calls) == 2
+        stats = {f['path']: f['diff_stat'] for f in data['files']}
+        assert stats['tests/test_extra_3.py'] == '+2 -0'
+        assert stats['README.md'] == '+1 -1'
+        changes = {c['spec']: c for c in data['spec_changes']}
+        assert changes['login']['new_rules'] == ['RULE-2']
+        assert changes['signup']['new_rules'] == ['RULE-1']
+        assert changes['login']['removed_rules'] == changes['signup']['removed_rules'] == []
+
+    @pytest.mark.proof("drift", "PROOF-21", "RULE-18")
+    def test_previous_base_limits_git_reads_to_new_commits(self):
+        base = {}
+        first = purlin_server._compute_drift(self.project_root, base=base)
+        assert base['since'] and base['head']
+
+        with open(os.path.join(self.project_root, 'specs', 'auth', 'login.md'), 'a') as f:
+            f.write('- RULE-3: Audit log\n')
+        with open(os.path.join(self.project_root, 'tests', 'test_audit.py'), 'w') as f:
+            f.write('x = 1\n')
+        subprocess.run(['git', 'add', 'specs', 'tests'], cwd=self.project_root,
+                       capture_output=True, check=True)
+        subprocess.run(['git', 'commit', '-m', 'feat: audit'],
+                       cwd=self.project_root, capture_output=True, check=True)
+
+        real_run = subprocess.run
+        ranges = []
+
+        def recording_run(cmd, *args, **kwargs):
+            if cmd[:1] == ['git'] and ('diff' in cmd or 'log' in cmd):
+                ranges.append([a for a in cmd if '..' in a] + [a for a in cmd if a.startswith(':(')])
+            return real_run(cmd, *args, **kwargs)
+
+        with patch.object(purlin_server.subprocess, 'run', side_effect=recording_run):
+            updated = purlin_server._compute_drift(
+                self.project_root, previous=(first, base))
+        # numstat and log over previous-HEAD..HEAD, then only the two
+        # touched paths over the since range
+        prev_range = base['head'] + '..HEAD'
+        assert [prev_range] in ranges
+        assert [r for r in ranges if r and r[0] != prev_range] == [
+            [base['since'] + '..HEAD', ':(literal)specs/auth/login.md',
+             ':(literal)tests/test_audit.py'],
+            [base['since'] + '..HEAD'],  # login spec diff only
+        ]
+        assert updated == purlin_server._compute_drift(self.project_root)
+        changes = {c['spec']: c for c in updated['spec_changes']}
+        assert changes['login']['new_rules'] == ['RULE-2', 'RULE-3']
+
 
 class TestDriftDetection:
     """drift RULE-6 through RULE-10: drift detection."""
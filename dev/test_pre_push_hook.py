@@ -1,4 +1,4 @@
-"""Tests for pre_push_hook — RULE-2 through RULE-9.
+"""Tests for pre_push_hook — RULE-2 through RULE-12.
 
 Each test creates an isolated temp git project, manipulates proof files, then
 runs scripts/hooks/pre-push.sh directly. Tests are tagged @integration because
@@ -42,7 +42,7 @@ def _create_test_project(tmpdir: str, num_rules: int = 3) -> None:
     _write_json(os.path.join(tmpdir, ".purlin", "config.json"), config)
 
     # Copy MCP server so sync_status works inside the temp project.
-    for fname in ("purlin_server.py", "config_engine.py"):
+    for fname in ("purlin_server.py", "config_engine.py", "spec_parser.py", "purlin_daemon.py"):
         src = os.path.join(PROJECT_ROOT, "scripts", "mcp", fname)
         dst = os.path.join(tmpdir, "scripts", "mcp", fname)
         if os.path.exists(src):
@@ -123,11 +123,15 @@ def _write_proof_file(
     _write_json(out_path, {"tier": "unit", "proofs": proofs})
 
 
-def _run_hook(tmpdir: str) -> tuple[int, str]:
-    """Run pre-push.sh inside tmpdir, return (exit_code, combined_output)."""
+def _run_hook(tmpdir: str, push_refs: str = "") -> tuple[int, str]:
+    """Run pre-push.sh inside tmpdir, return (exit_code, combined_output).
+
+    push_refs is fed to the hook's stdin, as git does on push.
+    """
     result = subprocess.run(
         ["bash", HOOK_SCRIPT],
         cwd=tmpdir,
+        input=push_refs,
         capture_output=True,
         text=True,
     )
@@ -623,3 +627,232 @@ class TestRule9HookInstalled:
         assert "PUSH BLOCKED" in output, (
             f"Expected 'PUSH BLOCKED' from installed hook:\n{output}"
         )
+
+
+# ---------------------------------------------------------------------------
+# RULE-10: Reads structured sync_status output in one process
+# ---------------------------------------------------------------------------
+
+class TestRule10StructuredStatus:
+
+    @pytest.mark.proof("pre_push_hook", "PROOF-18", "RULE-10", tier="unit")
+    def test_hook_consumes_json_status_without_per_row_forks(self):
+        with open(HOOK_SCRIPT) as f:
+            script = f.read()
+        status_section = script[script.index("# --- Check sync_status ---"):
+                                script.index("# --- Report and decide ---")]
+        assert "'format': 'json'" in status_section
+        assert status_section.count("python3") == 1
+        assert "awk" not in script and "sed " not in script
+
+
+# ---------------------------------------------------------------------------
+# RULE-11: only the tests of features the pushed commits touch run
+# ---------------------------------------------------------------------------
+
+def _git(tmpdir: str, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=tmpdir, check=True, capture_output=True, text=True,
+    )
+    return result.stdout.strip()
+
+
+def _create_scoped_project(tmpdir: str) -> str:
+    """Two scoped features, alpha and beta, each proved by its own test file
+    that drops a sentinel when it runs. Returns the base commit SHA."""
+    _create_test_project(tmpdir, num_rules=1)
+    _write_proof_file(tmpdir, "test_feature", [("PROOF-1", "RULE-1", "pass")])
+    open(os.path.join(tmpdir, "conftest.py"), "w").close()
+    os.makedirs(os.path.join(tmpdir, "src"))
+    for name in ("alpha", "beta"):
+        with open(os.path.join(tmpdir, "src", f"{name}.py"), "w") as fh:
+            fh.write("VALUE = 1\n")
+        with open(os.path.join(tmpdir, "specs", "hooks", f"{name}.md"), "w") as fh:
+            fh.write(
+                f"# Feature: {name}\n\n> Scope: src/{name}.py\n\n"
+                f"## Rules\n\n- RULE-1: {name} works\n\n"
+                f"## Proof\n\n- PROOF-1 (RULE-1): Run it\n"
+            )
+        with open(os.path.join(tmpdir, f"test_{name}.py"), "w") as fh:
+            fh.write(
+                f"def test_{name}():\n"
+                f"    open(\".ran_{name}\", \"w\").close()\n"
+            )
+        _write_json(
+            os.path.join(tmpdir, "specs", "hooks", f"{name}.proofs-unit.json"),
+            {"tier": "unit", "proofs": [{
+                "feature": name, "id": "PROOF-1", "rule": "RULE-1",
+                "test_file": f"test_{name}.py", "test_name": f"test_{name}",
+                "status": "pass", "tier": "unit",
+            }]},
+        )
+    _git(tmpdir, "add", "-A")
+    _git(tmpdir, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "features")
+    return _git(tmpdir, "rev-parse", "HEAD")
+
+
+def _commit_change(tmpdir: str, relpath: str) -> str:
+    with open(os.path.join(tmpdir, relpath), "a") as fh:
+        fh.write("# changed\n")
+    _git(tmpdir, "add", "-A")
+    _git(tmpdir, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "change")
+    return _git(tmpdir, "rev-parse", "HEAD")
+
+
+def _ran(tmpdir: str) -> set[str]:
+    ran = set()
+    for name in ("alpha", "beta"):
+        sentinel = os.path.join(tmpdir, f".ran_{name}")
+        if os.path.exists(sentinel):
+            ran.add(name)
+            os.remove(sentinel)
+    return ran
+
+
+class TestRule11SelectiveTests:
+
+    @pytest.mark.proof("pre_push_hook", "PROOF-19", "RULE-11", tier="integration")
+    def test_runs_only_tests_of_features_in_pushed_range(self, tmp_path):
+        tmpdir = str(tmp_path)
+        base = _create_scoped_project(tmpdir)
+        head = _commit_change(tmpdir, "src/alpha.py")
+
+        code, output = _run_hook(tmpdir, f"refs/heads/main {head} refs/heads/main {base}\n")
+        assert code == 0, output
+        assert _ran(tmpdir) == {"alpha"}
+        assert "1 unit-tier test file(s)" in output
+
+        # A file outside every spec's scope cannot be mapped: full unit tier.
+        unscoped = _commit_change(tmpdir, "conftest.py")
+        _run_hook(tmpdir, f"refs/heads/main {unscoped} refs/heads/main {head}\n")
+        assert _ran(tmpdir) == {"alpha", "beta"}
+
+        # "pre_push_tests": "full" and a push without refs run everything too.
+        _set_config_field(tmpdir, "pre_push_tests", "full")
+        _run_hook(tmpdir, f"refs/heads/main {head} refs/heads/main {base}\n")
+        assert _ran(tmpdir) == {"alpha", "beta"}
+        _set_config_field(tmpdir, "pre_push_tests", "selective")
+        _run_hook(tmpdir)
+        assert _ran(tmpdir) == {"alpha", "beta"}
+
+    @pytest.mark.proof("pre_push_hook", "PROOF-20", "RULE-11", tier="integration")
+    def test_select_tests_maps_scope_dependents_and_fallbacks(self, tmp_path):
+        import sys
+        sys.path.insert(0, SERVER_DIR)
+        import purlin_server
+
+        tmpdir = str(tmp_path)
+        base = _create_scoped_project(tmpdir)
+        spec = os.path.join(tmpdir, "specs", "hooks", "beta.md")
+        with open(spec) as fh:
+            content = fh.read()
+        with open(spec, "w") as fh:
+            fh.write(content.replace("> Scope:", "> Requires: alpha\n> Scope:"))
+        base = _commit_change(tmpdir, "README.md")  # NO_IMPACT file
+
+        head = _commit_change(tmpdir, "src/alpha.py")
+        result = purlin_server.select_tests(tmpdir, [f"refs/heads/main {head} refs/heads/main {base}"])
+        assert result["mode"] == "selected"
+        assert result["features"] == ["alpha", "beta"]
+        assert result["test_files"] == ["test_alpha.py", "test_beta.py"]
+
+        # Only documentation changed: nothing to run.
+        docs = _commit_change(tmpdir, "README.md")
+        result = purlin_server.select_tests(tmpdir, [f"refs/heads/main {docs} refs/heads/main {head}"])
+        assert result["mode"] == "none"
+
+        # Unknown remote SHA on a new branch falls back to commits not on any remote.
+        zero = "0" * 40
+        result = purlin_server.select_tests(tmpdir, [f"refs/heads/topic {head} refs/heads/topic {zero}"])
+        assert result["mode"] == "full"  # unscoped files across the whole history
+
+        assert purlin_server.select_tests(tmpdir, [])["mode"] == "full"
+        assert purlin_server.select_tests(tmpdir, ["garbage"])["mode"] == "full"
+
+
+class TestRule13SharedTestFiles:
+
+    @pytest.mark.proof("pre_push_hook", "PROOF-22", "RULE-13", tier="integration")
+    def test_shared_test_file_keeps_other_features_proofs(self, tmp_path):
+        tmpdir = str(tmp_path)
+        _create_test_project(tmpdir, num_rules=1)
+        _write_proof_file(tmpdir, "test_feature", [("PROOF-1", "RULE-1", "pass")])
+        proof_scripts = os.path.join(PROJECT_ROOT, "scripts", "proof")
+        with open(os.path.join(tmpdir, "conftest.py"), "w") as fh:
+            fh.write(f"import sys\nsys.path.insert(0, {proof_scripts!r})\n"
+                     "from pytest_purlin import pytest_configure  # noqa: F401\n")
+        with open(os.path.join(tmpdir, ".gitignore"), "w") as fh:
+            fh.write("__pycache__/\n.pytest_cache/\n.purlin/cache/\n")
+        os.makedirs(os.path.join(tmpdir, "src"))
+        for name, rules in (("a", 1), ("b", 2)):
+            with open(os.path.join(tmpdir, "src", f"{name}.py"), "w") as fh:
+                fh.write("VALUE = 1\n")
+            with open(os.path.join(tmpdir, "specs", "hooks", f"{name}.md"), "w") as fh:
+                fh.write(
+                    f"# Feature: {name}\n\n> Scope: src/{name}.py\n\n## Rules\n\n"
+                    + "".join(f"- RULE-{i}: {name} rule {i}\n" for i in range(1, rules + 1))
+                    + "\n## Proof\n\n"
+                    + "".join(f"- PROOF-{i} (RULE-{i}): check {i}\n" for i in range(1, rules + 1))
+                )
+        with open(os.path.join(tmpdir, "test_shared.py"), "w") as fh:
+            fh.write(
+                "import pytest\n\n"
+                "@pytest.mark.proof(\"a\", \"PROOF-1\", \"RULE-1\")\n"
+                "def test_a():\n    assert 1 + 1 == 2\n\n"
+                "@pytest.mark.proof(\"b\", \"PROOF-1\", \"RULE-1\")\n"
+                "def test_b_shared():\n    assert 2 + 2 == 4\n"
+            )
+        with open(os.path.join(tmpdir, "test_b_only.py"), "w") as fh:
+            fh.write(
+                "import pytest\n\n"
+                "@pytest.mark.proof(\"b\", \"PROOF-2\", \"RULE-2\")\n"
+                "def test_b_only():\n"
+                "    open(\".ran_b_only\", \"w\").close()\n"
+                "    assert 3 + 3 == 6\n"
+            )
+        subprocess.run(["python3", "-m", "pytest", "-q", "-p", "no:cacheprovider"],
+                       cwd=tmpdir, check=True, capture_output=True)
+        os.remove(os.path.join(tmpdir, ".ran_b_only"))
+        _git(tmpdir, "add", "-A")
+        _git(tmpdir, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "features")
+        base = _git(tmpdir, "rev-parse", "HEAD")
+        head = _commit_change(tmpdir, "src/a.py")
+
+        code, output = _run_hook(tmpdir, f"refs/heads/main {head} refs/heads/main {base}\n")
+        assert code == 0, output
+        assert "2 unit-tier test file(s)" in output
+        assert os.path.exists(os.path.join(tmpdir, ".ran_b_only"))
+        with open(os.path.join(tmpdir, "specs", "hooks", "b.proofs-unit.json")) as fh:
+            proofs = json.load(fh)["proofs"]
+        assert sorted((e["id"], e["test_file"]) for e in proofs) == [
+            ("PROOF-1", "test_shared.py"), ("PROOF-2", "test_b_only.py")]
+        assert _git(tmpdir, "status", "--porcelain", "--", "specs") == ""
+
+
+# ---------------------------------------------------------------------------
+# RULE-12: pre_push_jobs runs the unit tier through the shard runner
+# ---------------------------------------------------------------------------
+
+class TestRule12ParallelShards:
+
+    @pytest.mark.proof("pre_push_hook", "PROOF-21", "RULE-12", tier="integration")
+    def test_parallel_mode_runs_tests_in_shards(self, tmp_path):
+        tmpdir = str(tmp_path)
+        _create_test_project(tmpdir, num_rules=1)
+        _write_proof_file(tmpdir, "test_feature", [("PROOF-1", "RULE-1", "pass")])
+        os.makedirs(os.path.join(tmpdir, "scripts", "hooks"))
+        shutil.copy2(os.path.join(PROJECT_ROOT, "scripts", "hooks", "shard_runner.py"),
+                     os.path.join(tmpdir, "scripts", "hooks", "shard_runner.py"))
+        open(os.path.join(tmpdir, "conftest.py"), "w").close()
+        for name in ("one", "two"):
+            with open(os.path.join(tmpdir, f"test_{name}.py"), "w") as fh:
+                fh.write(f"def test_{name}():\n    open(\".ran_{name}\", \"w\").close()\n")
+        _set_config_field(tmpdir, "test_framework", "pytest")
+        _set_config_field(tmpdir, "pre_push_jobs", 2)
+
+        code, output = _run_hook(tmpdir)
+        assert code == 0, output
+        assert os.path.exists(os.path.join(tmpdir, ".ran_one"))
+        assert os.path.exists(os.path.join(tmpdir, ".ran_two"))
+        assert "2 shard(s) on 2 worker(s)" in output
+        assert "slowest shards:" in output
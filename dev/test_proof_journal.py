@@ -0,0 +1,327 @@
+"""Tests for the proof journal — fragment emission and compaction.
+
+Covers compact_proof_journal in purlin_server and the PURLIN_PROOF_RUN_ID
+journal mode every proof emitter implements.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PROOF_SCRIPTS = os.path.join(PROJECT_ROOT, "scripts", "proof")
+SERVER = os.path.join(PROJECT_ROOT, "scripts", "mcp", "purlin_server.py")
+
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts", "mcp"))
+import purlin_server
+
+
+def _entry(feature, proof_id, status="pass", tier="unit", test_file="test_x.py"):
+    return {"feature": feature, "id": proof_id, "rule": "RULE-1", "test_file": test_file,
+            "test_name": f"test_{proof_id.lower()}", "status": status, "tier": tier}
+
+
+def _project(tmp_path, features=("alpha",)):
+    spec_dir = tmp_path / "specs" / "core"
+    spec_dir.mkdir(parents=True)
+    for feature in features:
+        (spec_dir / f"{feature}.md").write_text(
+            f"# Feature: {feature}\n\n## Rules\n\n- RULE-1: works\n\n"
+            "## Proof\n\n- PROOF-1 (RULE-1): check @unit\n"
+        )
+    return spec_dir
+
+
+_seq = iter(range(1, 1_000_000))
+
+
+def _fragment(root, run_id, entries, lines=None):
+    """Write a fragment the way an emitter does; mtimes increase per call."""
+    journal = root / ".purlin" / "proof-journal"
+    journal.mkdir(parents=True, exist_ok=True)
+    n = next(_seq)
+    path = journal / f"{run_id}.{os.getpid()}.{n}.jsonl"
+    body = lines if lines is not None else [json.dumps(e) for e in entries]
+    path.write_text("".join(line + "\n" for line in body))
+    stamp = time.time() - 1000 + n
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def _fragments(root):
+    journal = root / ".purlin" / "proof-journal"
+    return sorted(p.name for p in journal.glob("*.jsonl")) if journal.is_dir() else []
+
+
+def _proofs(path):
+    return json.loads(path.read_text())["proofs"]
+
+
+class TestCompaction:
+
+    @pytest.mark.proof("proof_journal", "PROOF-1", "RULE-1")
+    def test_fragments_of_one_run_act_as_one_emitter_run(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        proof_file = spec_dir / "alpha.proofs-unit.json"
+        proof_file.write_text(json.dumps({"tier": "unit", "proofs": [_entry("alpha", "PROOF-9")]}))
+
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1")])
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-2")])
+        assert purlin_server.compact_proof_journal(str(tmp_path)) == 2
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-3")])
+        assert purlin_server.compact_proof_journal(str(tmp_path)) == 1
+
+        assert [e["id"] for e in _proofs(proof_file)] == ["PROOF-1", "PROOF-2", "PROOF-3"]
+
+    @pytest.mark.proof("proof_journal", "PROOF-2", "RULE-2")
+    def test_later_run_replaces_only_its_features(self, tmp_path):
+        spec_dir = _project(tmp_path, features=("alpha", "beta"))
+        proof_file = spec_dir / "alpha.proofs-unit.json"
+        # A beta entry sharing alpha's file must survive alpha's runs
+        proof_file.write_text(json.dumps({"tier": "unit", "proofs": [_entry("beta", "PROOF-7")]}))
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1"), _entry("alpha", "PROOF-2"),
+                                   _entry("beta", "PROOF-1")])
+        purlin_server.compact_proof_journal(str(tmp_path))
+
+        _fragment(tmp_path, "r2", [_entry("alpha", "PROOF-1", status="fail")])
+        purlin_server.compact_proof_journal(str(tmp_path))
+
+        assert [(e["feature"], e["id"], e["status"]) for e in _proofs(proof_file)] == \
+            [("beta", "PROOF-7", "pass"), ("alpha", "PROOF-1", "fail")]
+        assert [e["id"] for e in _proofs(spec_dir / "beta.proofs-unit.json")] == ["PROOF-1"]
+
+    @pytest.mark.proof("proof_journal", "PROOF-3", "RULE-3")
+    def test_files_written_fragments_removed_bad_lines_skipped(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        _fragment(tmp_path, "r1", None, lines=[
+            json.dumps(_entry("alpha", "PROOF-1")),
+            "{not json",
+            json.dumps(["not", "an", "entry"]),
+            json.dumps(_entry("orphan", "PROOF-1")),
+        ])
+        assert purlin_server.compact_proof_journal(str(tmp_path)) == 1
+
+        assert [e["id"] for e in _proofs(spec_dir / "alpha.proofs-unit.json")] == ["PROOF-1"]
+        assert [e["id"] for e in _proofs(tmp_path / "specs" / "orphan.proofs-unit.json")] == ["PROOF-1"]
+        assert _fragments(tmp_path) == []
+        assert not list(tmp_path.rglob("*.tmp"))
+        assert purlin_server.compact_proof_journal(str(tmp_path)) == 0
+
+    @pytest.mark.proof("proof_journal", "PROOF-4", "RULE-4")
+    def test_sync_status_compacts_before_reading(self, tmp_path):
+        _project(tmp_path)
+        (tmp_path / ".purlin").mkdir(exist_ok=True)
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1")])
+
+        data = json.loads(purlin_server.sync_status(str(tmp_path), output_format="json"))
+        alpha = next(f for f in data["features"] if f["name"] == "alpha")
+        assert alpha["proved"] == 1
+        assert _fragments(tmp_path) == []
+
+    @pytest.mark.proof("proof_journal", "PROOF-5", "RULE-5")
+    def test_concurrent_compactions_apply_each_fragment_once(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        for n in range(40):
+            _fragment(tmp_path, "r1", [_entry("alpha", f"PROOF-{n}")])
+
+        counts = []
+        threads = [threading.Thread(
+            target=lambda: counts.append(purlin_server.compact_proof_journal(str(tmp_path))))
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(counts) == 40
+        assert len(_proofs(spec_dir / "alpha.proofs-unit.json")) == 40
+
+    @pytest.mark.proof("proof_journal", "PROOF-6", "RULE-6", tier="integration")
+    def test_cli_compacts_and_exits(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1")])
+        result = subprocess.run([sys.executable, SERVER, "--compact-proofs", str(tmp_path)],
+                                capture_output=True, text=True, stdin=subprocess.DEVNULL, timeout=30)
+        assert result.returncode == 0, result.stderr
+        assert "compacted 1 proof fragment(s)" in result.stdout
+        assert [e["id"] for e in _proofs(spec_dir / "alpha.proofs-unit.json")] == ["PROOF-1"]
+
+    @pytest.mark.proof("proof_journal", "PROOF-7", "RULE-7")
+    def test_reused_run_id_does_not_duplicate_entries(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1"), _entry("alpha", "PROOF-2")])
+        purlin_server.compact_proof_journal(str(tmp_path))
+        # The same run id reused for a re-run of PROOF-1
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1", status="fail")])
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1", status="fail")])
+        purlin_server.compact_proof_journal(str(tmp_path))
+
+        assert [(e["id"], e["status"]) for e in _proofs(spec_dir / "alpha.proofs-unit.json")] == \
+            [("PROOF-2", "pass"), ("PROOF-1", "fail")]
+
+    @pytest.mark.proof("proof_journal", "PROOF-8", "RULE-8")
+    def test_run_id_reused_after_its_window_overwrites_again(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        proof_file = spec_dir / "alpha.proofs-unit.json"
+        start = time.time()
+
+        def compact_at(hours, entries):
+            _fragment(tmp_path, "dev", entries)
+            with mock.patch.object(purlin_server.time, "time", return_value=start + hours * 3600):
+                purlin_server.compact_proof_journal(str(tmp_path))
+            return sorted(e["id"] for e in _proofs(proof_file))
+
+        assert compact_at(0, [_entry("alpha", "PROOF-1"), _entry("alpha", "PROOF-2")]) == \
+            ["PROOF-1", "PROOF-2"]
+        # Within the window "dev" is still the same run and appends
+        assert compact_at(23, [_entry("alpha", "PROOF-1")]) == ["PROOF-1", "PROOF-2"]
+        # Past it, counted from the first compaction, "dev" is a new run
+        assert compact_at(25, [_entry("alpha", "PROOF-1")]) == ["PROOF-1"]
+
+    @pytest.mark.proof("proof_journal", "PROOF-9", "RULE-9")
+    def test_failed_compaction_still_reads_existing_proofs(self, tmp_path, capsys):
+        spec_dir = _project(tmp_path)
+        (spec_dir / "alpha.proofs-unit.json").write_text(
+            json.dumps({"tier": "unit", "proofs": [_entry("alpha", "PROOF-1")]}))
+        _fragment(tmp_path, "r1", [_entry("alpha", "PROOF-1", status="fail")])
+
+        with mock.patch.object(purlin_server, "_replace_file", return_value=False):
+            data = json.loads(purlin_server.sync_status(str(tmp_path), output_format="json"))
+
+        alpha = next(f for f in data["features"] if f["name"] == "alpha")
+        assert alpha["proved"] == 1
+        assert "proof journal not compacted" in capsys.readouterr().err
+        assert len(_fragments(tmp_path)) == 1
+
+
+# ---------------------------------------------------------------------------
+# Emitter journal mode — each emitter runs for real with PURLIN_PROOF_RUN_ID
+# ---------------------------------------------------------------------------
+
+def _emit_pytest(root, env):
+    (root / "conftest.py").write_text(
+        f"import sys\nsys.path.insert(0, {PROOF_SCRIPTS!r})\n"
+        "from pytest_purlin import pytest_configure  # noqa: F401\n"
+    )
+    (root / "test_alpha.py").write_text(textwrap.dedent("""\
+        import pytest
+
+        @pytest.mark.proof("alpha", "PROOF-1", "RULE-1")
+        def test_ok():
+            assert True
+
+        @pytest.mark.proof("alpha", "PROOF-2", "RULE-1")
+        def test_bad():
+            assert False
+    """))
+    subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_alpha.py"],
+                   cwd=str(root), capture_output=True, env=env)
+
+
+def _emit_shell(root, env):
+    (root / "alpha.test.sh").write_text(textwrap.dedent(f"""\
+        source {os.path.join(PROOF_SCRIPTS, 'shell_purlin.sh')}
+        purlin_proof "alpha" "PROOF-1" "RULE-1" pass "ok"
+        purlin_proof "alpha" "PROOF-2" "RULE-1" fail "bad"
+        purlin_proof_finish
+    """))
+    subprocess.run(["bash", "alpha.test.sh"], cwd=str(root), capture_output=True, check=True, env=env)
+
+
+def _emit_c(root, env):
+    payload = {"proofs": [
+        dict(_entry("alpha", "PROOF-1", test_file="test_alpha.c")),
+        dict(_entry("alpha", "PROOF-2", status="fail", test_file="test_alpha.c")),
+    ]}
+    subprocess.run([sys.executable, os.path.join(PROOF_SCRIPTS, "c_purlin_emit.py")],
+                   input=json.dumps(payload), text=True, cwd=str(root),
+                   capture_output=True, check=True, env=env)
+
+
+def _emit_sql(root, env):
+    db_file = root / "test.db"
+    subprocess.run(["sqlite3", str(db_file)], input="CREATE TABLE IF NOT EXISTS t (id INTEGER);",
+                   text=True, capture_output=True, check=True)
+    (root / "test_alpha.sql").write_text(
+        "-- @purlin alpha PROOF-1 RULE-1 unit\n"
+        "SELECT CASE WHEN (SELECT count(*) FROM t) = 0 THEN 'PASS' ELSE 'FAIL' END;\n\n"
+        "-- @purlin alpha PROOF-2 RULE-1 unit\n"
+        "SELECT CASE WHEN (SELECT count(*) FROM t) = 9 THEN 'PASS' ELSE 'FAIL' END;\n"
+    )
+    subprocess.run(["bash", os.path.join(PROOF_SCRIPTS, "sql_purlin.sh"),
+                    "test_alpha.sql", str(db_file)],
+                   cwd=str(root), capture_output=True, check=True, env=env)
+
+
+def _emit_jest(root, env):
+    glob_dir = root / "node_modules" / "glob"
+    glob_dir.mkdir(parents=True, exist_ok=True)
+    (glob_dir / "index.js").write_text(
+        "const fs = require('fs'), path = require('path');\n"
+        "function walk(d, out) { for (const e of fs.readdirSync(d, {withFileTypes: true})) {\n"
+        "  const f = path.join(d, e.name);\n"
+        "  if (e.isDirectory()) walk(f, out); else if (e.name.endsWith('.md')) out.push(f); } }\n"
+        "module.exports = { globSync: (p) => { const out = []; walk(p.split('/**/')[0], out); return out; } };\n"
+    )
+    shutil.copy(os.path.join(PROOF_SCRIPTS, "jest_purlin.js"), str(root / "jest_purlin.js"))
+    (root / "run.js").write_text(textwrap.dedent("""\
+        const Reporter = require("./jest_purlin.js");
+        const r = new Reporter({ rootDir: process.cwd() });
+        r.onTestResult({}, {
+          testFilePath: process.cwd() + "/alpha.test.js",
+          testResults: [
+            { title: "ok [proof:alpha:PROOF-1:RULE-1]", status: "passed" },
+            { title: "bad [proof:alpha:PROOF-2:RULE-1]", status: "failed" },
+          ],
+        });
+        r.onRunComplete();
+    """))
+    subprocess.run(["node", "run.js"], cwd=str(root), capture_output=True, check=True, env=env)
+
+
+_EMITTERS = [
+    pytest.param(_emit_pytest, id="pytest"),
+    pytest.param(_emit_shell, id="shell"),
+    pytest.param(_emit_c, id="c"),
+    pytest.param(_emit_sql, id="sql", marks=pytest.mark.skipif(
+        not shutil.which("sqlite3"), reason="sqlite3 not available")),
+    pytest.param(_emit_jest, id="jest", marks=pytest.mark.skipif(
+        not shutil.which("node"), reason="node not available")),
+]
+
+
+class TestEmitterJournalMode:
+
+    @pytest.mark.parametrize("emit", _EMITTERS)
+    @pytest.mark.proof("proof_common", "PROOF-14", "RULE-11", tier="integration")
+    def test_emitter_writes_one_fragment_instead_of_proof_files(self, tmp_path, emit):
+        spec_dir = _project(tmp_path)
+        env = {k: v for k, v in os.environ.items()
+               if k not in ("PURLIN_PROOF_SHARD_DIR", "PURLIN_PROOF_RUN_ID")}
+
+        emit(tmp_path, dict(env, PURLIN_PROOF_RUN_ID="push/42"))
+        assert not list(tmp_path.rglob("*.proofs-*.json"))
+        fragments = _fragments(tmp_path)
+        assert len(fragments) == 1 and re.fullmatch(r"push_42\.\d+\.[0-9a-f]{8}\.jsonl", fragments[0])
+        lines = (tmp_path / ".purlin" / "proof-journal" / fragments[0]).read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert all(set(e) == {"feature", "id", "rule", "test_file", "test_name", "status", "tier"}
+                   for e in entries)
+
+        purlin_server.compact_proof_journal(str(tmp_path))
+        journaled = sorted((e["id"], e["status"]) for e in _proofs(spec_dir / "alpha.proofs-unit.json"))
+        assert journaled == [("PROOF-1", "pass"), ("PROOF-2", "fail")]
+
+        (spec_dir / "alpha.proofs-unit.json").unlink()
+        emit(tmp_path, env)
+        direct = sorted((e["id"], e["status"]) for e in _proofs(spec_dir / "alpha.proofs-unit.json"))
+        assert direct == journaled
@@ -7,7 +7,7 @@ authoritative feature/rule mapping). Covers:
   proof_common         — file naming, fallback, no-op, glob discovery,
                          stderr warning, purge-on-rerun
   proof_plugins_pytest — marker signature, short-arg skip, relative test_file,
-                         pytest_configure registration
+                         pytest_configure registration, pytest-xdist runs
   proof_plugins_jest   — title marker parse, no-marker ignore, relative
                          test_file, status mapping
   proof_plugins_shell  — 5-arg + PURLIN_PROOF_TIER, BASH_SOURCE, finish-to-write,
@@ -369,6 +369,73 @@ def test_pytest_configure_marker_recognized_in_session(tmp_path):
     assert "PytestUnknownMarkWarning" not in result.stderr
 
 
+# ---------------------------------------------------------------------------
+# proof_plugins_pytest RULE-6: pytest-xdist workers' proofs reach the controller
+# ---------------------------------------------------------------------------
+
+@pytest.mark.proof("proof_plugins_pytest", "PROOF-6", "RULE-6")
+def test_proofs_survive_report_transport_and_workers_write_nothing(tmp_path, monkeypatch):
+    """Entries attached to a worker's report survive xdist's report
+    serialization and are collected on the controller; a worker session
+    writes no proof file."""
+    from _pytest.reports import (
+        TestReport, pytest_report_from_serializable, pytest_report_to_serializable,
+    )
+    sys.path.insert(0, PROOF_SCRIPTS)
+    try:
+        from pytest_purlin import ProofCollector
+    finally:
+        sys.path.remove(PROOF_SCRIPTS)
+    spec_dir = _make_spec(tmp_path, "a", "feat_x")
+    monkeypatch.chdir(tmp_path)
+    entry = {"feature": "feat_x", "id": "PROOF-1", "rule": "RULE-1",
+             "test_file": "test_x.py", "test_name": "test_x", "status": "pass", "tier": "unit"}
+    report = TestReport("test_x.py::test_x", ("test_x.py", 0, "test_x"), {}, "passed", None,
+                        "call", purlin_proofs=[entry])
+    received = pytest_report_from_serializable(
+        json.loads(json.dumps(pytest_report_to_serializable(report))))
+
+    class Session:
+        class config:
+            workerinput = {"workerid": "gw0"}
+
+    worker = ProofCollector()
+    worker.pytest_runtest_logreport(report)
+    worker.pytest_sessionfinish(Session)
+    assert not (spec_dir / "feat_x.proofs-unit.json").exists()
+
+    controller = ProofCollector()
+    controller.pytest_runtest_logreport(received)
+    controller.pytest_sessionfinish(type("Session", (), {"config": object()}))
+    assert json.loads((spec_dir / "feat_x.proofs-unit.json").read_text())["proofs"] == [entry]
+
+
+@pytest.mark.proof("proof_plugins_pytest", "PROOF-7", "RULE-6", tier="integration")
+def test_xdist_run_writes_every_workers_proofs(tmp_path):
+    """`pytest -n 4` over four files proving one feature writes all four entries."""
+    pytest.importorskip("xdist")
+    spec_dir = _make_spec(tmp_path, "a", "feat_par", extra_rules=4)
+    for n in range(1, 5):
+        (tmp_path / f"test_par{n}.py").write_text(textwrap.dedent(f"""\
+            import pytest
+
+            @pytest.mark.proof("feat_par", "PROOF-{n}", "RULE-{n}")
+            def test_par{n}():
+                assert {n} != 3
+        """))
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-n", "4", "-p", "pytest_purlin",
+         f"--override-ini=pythonpath={PROOF_SCRIPTS}", "-q", "--no-header",
+         "-p", "no:cacheprovider"],
+        capture_output=True, text=True, cwd=str(tmp_path),
+    )
+    assert result.returncode == 1, result.stdout + result.stderr
+    proofs = json.loads((spec_dir / "feat_par.proofs-unit.json").read_text())["proofs"]
+    assert sorted((p["id"], p["status"]) for p in proofs) == [
+        ("PROOF-1", "pass"), ("PROOF-2", "pass"), ("PROOF-3", "fail"), ("PROOF-4", "pass"),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # RULE-12: Jest marker parsed from test title
 # ---------------------------------------------------------------------------
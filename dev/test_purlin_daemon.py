@@ -0,0 +1,229 @@
+"""Tests for purlin_daemon — the optional socket daemon behind the git hooks."""
+
+import json
+import os
+import shutil
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'mcp'))
+import purlin_daemon
+import purlin_server
+
+HOOKS_DIR = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'hooks')
+
+SPEC = (
+    '# Feature: widget\n\n'
+    '> Scope: src/widget.py\n\n'
+    '## What it does\n\nMakes widgets.\n\n'
+    '## Rules\n\n- RULE-1: Makes a widget\n\n'
+    '## Proof\n\n- PROOF-1 (RULE-1): Make one @unit\n'
+)
+
+
+class _DaemonCase:
+
+    def setup_method(self):
+        self.project_root = tempfile.mkdtemp()
+        self.run_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.project_root, '.purlin'))
+        os.makedirs(os.path.join(self.project_root, 'specs', 'core'))
+        with open(os.path.join(self.project_root, 'specs', 'core', 'widget.md'), 'w') as f:
+            f.write(SPEC)
+        self.env = mock.patch.dict(os.environ, {'XDG_RUNTIME_DIR': self.run_dir})
+        self.env.start()
+        self.threads = []
+
+    def teardown_method(self):
+        purlin_daemon.stop(self.project_root)
+        for thread in self.threads:
+            thread.join(timeout=10)
+        self.env.stop()
+        shutil.rmtree(self.project_root)
+        shutil.rmtree(self.run_dir)
+
+    def _config(self, **values):
+        with open(os.path.join(self.project_root, '.purlin', 'config.json'), 'w') as f:
+            json.dump(values, f)
+
+    def _serve(self, idle_timeout=30):
+        """Run serve() on a thread and wait until it answers."""
+        result = {}
+
+        def run():
+            result['code'] = purlin_daemon.serve(self.project_root, idle_timeout=idle_timeout)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.threads.append(thread)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if purlin_daemon._query_daemon(self.project_root, 'ping', timeout=1) \
+                    is not purlin_daemon._UNAVAILABLE:
+                return thread, result
+            time.sleep(0.02)
+        raise AssertionError("daemon did not start")
+
+
+class TestCallTool(_DaemonCase):
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-1", "RULE-1", tier="integration")
+    def test_running_daemon_serves_the_call(self):
+        self._serve()
+        run_tool = purlin_daemon._run_tool
+        callers = []
+
+        def recording(*args):
+            callers.append(threading.current_thread())
+            return run_tool(*args)
+
+        with mock.patch.object(purlin_daemon, '_run_tool', side_effect=recording):
+            result = purlin_daemon.call_tool(self.project_root, 'sync_status', {'format': 'json'})
+        data = json.loads(result)
+        assert [f['name'] for f in data['features']] == ['widget']
+        assert len(callers) == 1
+        assert callers[0] is not threading.current_thread()
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-2", "RULE-2", tier="integration")
+    def test_falls_back_in_process_and_starts_daemon_only_when_enabled(self):
+        expected = purlin_server.sync_status(self.project_root)
+
+        self._config(daemon=False)
+        with mock.patch.object(purlin_daemon, 'start_daemon') as start:
+            assert purlin_daemon.call_tool(self.project_root, 'sync_status') == expected
+        start.assert_not_called()
+
+        self._config(daemon=True)
+        with mock.patch.object(purlin_daemon, 'start_daemon') as start:
+            assert purlin_daemon.call_tool(self.project_root, 'sync_status') == expected
+        start.assert_called_once_with(self.project_root)
+
+
+class TestDaemonLifecycle(_DaemonCase):
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-3", "RULE-3", tier="integration")
+    def test_socket_path_and_permissions(self):
+        link = os.path.join(self.run_dir, 'link')
+        os.symlink(self.project_root, link)
+        path = purlin_daemon.socket_path(self.project_root)
+        assert purlin_daemon.socket_path(link) == path
+        assert os.path.basename(os.path.dirname(path)) == f'purlin-{os.getuid()}'
+
+        self._serve()
+        mode = os.stat(path).st_mode
+        assert stat.S_ISSOCK(mode)
+        assert stat.S_IMODE(mode) == 0o600
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-4", "RULE-4", tier="integration")
+    def test_idle_timeout_and_stop_remove_socket(self):
+        path = purlin_daemon.socket_path(self.project_root)
+        thread, result = self._serve(idle_timeout=0.2)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert result['code'] == 0
+        assert not os.path.exists(path)
+
+        thread, result = self._serve()
+        assert purlin_daemon.stop(self.project_root) is True
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert not os.path.exists(path)
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-5", "RULE-5", tier="integration")
+    def test_second_daemon_exits_immediately(self):
+        self._serve()
+        assert purlin_daemon.serve(self.project_root, idle_timeout=30) == 1
+        response = purlin_daemon._query_daemon(self.project_root, 'ping', timeout=1)
+        assert response['result'] == 'pong'
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-6", "RULE-6", tier="integration")
+    def test_changed_sources_fall_back_and_exit(self):
+        with mock.patch.object(purlin_daemon, '_source_mtimes',
+                               side_effect=[{}, {}, {'purlin_server': -1}]):
+            # startup snapshot, the readiness ping, then the changed call
+            thread, _ = self._serve()
+            callers = []
+            run_tool = purlin_daemon._run_tool
+
+            def recording(*args):
+                callers.append(threading.current_thread())
+                return run_tool(*args)
+
+            with mock.patch.object(purlin_daemon, '_run_tool', side_effect=recording):
+                result = purlin_daemon.call_tool(self.project_root, 'sync_status')
+            thread.join(timeout=5)
+        assert result == purlin_server.sync_status(self.project_root)
+        assert callers == [threading.current_thread()]
+        assert not thread.is_alive()
+
+
+class TestDaemonSecurity(_DaemonCase):
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-8", "RULE-8", tier="integration")
+    def test_runtime_dir_is_private_and_lock_never_follows_symlinks(self):
+        path = purlin_daemon.socket_path(self.project_root)
+        run_dir = os.path.dirname(path)
+        os.mkdir(run_dir, 0o700)
+        victim = os.path.join(self.project_root, 'victim.txt')
+        with open(victim, 'w') as f:
+            f.write('keep me')
+        os.symlink(victim, path + '.lock')
+        assert purlin_daemon.serve(self.project_root, idle_timeout=30) == 1
+        with open(victim) as f:
+            assert f.read() == 'keep me'
+
+        os.unlink(path + '.lock')
+        os.chmod(run_dir, 0o777)
+        assert purlin_daemon.serve(self.project_root, idle_timeout=30) == 1
+        assert purlin_daemon._query_daemon(self.project_root, 'ping', timeout=1) \
+            is purlin_daemon._UNAVAILABLE
+
+        os.chmod(run_dir, 0o700)
+        self._serve()
+        assert stat.S_IMODE(os.lstat(run_dir).st_mode) == 0o700
+        with mock.patch.object(purlin_daemon, '_peer_is_owner', return_value=False):
+            assert purlin_daemon._query_daemon(self.project_root, 'ping', timeout=1) \
+                is purlin_daemon._UNAVAILABLE
+        assert purlin_daemon._query_daemon(self.project_root, 'ping', timeout=1)['result'] == 'pong'
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-9", "RULE-9", tier="integration")
+    def test_client_hanging_up_mid_call_does_not_stop_daemon(self):
+        self._serve()
+        finished = threading.Event()
+
+        def slow_tool(*args):
+            time.sleep(0.3)
+            finished.set()
+            return 'x' * (1 << 20)
+
+        with mock.patch.object(purlin_daemon, '_run_tool', side_effect=slow_tool):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(purlin_daemon.socket_path(self.project_root))
+            purlin_daemon._send(sock, {'root': os.path.realpath(self.project_root),
+                                       'tool': 'sync_status', 'arguments': {}})
+            sock.close()
+            assert finished.wait(5)
+        response = purlin_daemon._query_daemon(self.project_root, 'ping', timeout=5)
+        assert response['result'] == 'pong'
+
+
+class TestHookIntegration:
+
+    @pytest.mark.proof("purlin_daemon", "PROOF-7", "RULE-7")
+    def test_hooks_go_through_call_tool(self):
+        with open(os.path.join(HOOKS_DIR, 'pre-commit.sh')) as f:
+            pre_commit = f.read()
+        with open(os.path.join(HOOKS_DIR, 'pre-push.sh')) as f:
+            pre_push = f.read()
+        assert 'from purlin_daemon import call_tool' in pre_commit
+        assert "call_tool('$ROOT', 'generate_digest'" in pre_commit
+        assert 'from purlin_daemon import call_tool' in pre_push
+        assert "call_tool(sys.argv[2], 'sync_status'" in pre_push
+        assert 'from purlin_server import' not in pre_commit + pre_push
@@ -7,6 +7,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
+from unittest import mock
 
 import pytest
 
@@ -993,3 +995,218 @@ class TestReportDataStructure:
         assert rule['status'] == 'NONE', \
             f"Expected rule status NONE, got '{rule['status']}'"
         assert rule['proofs'][0]['status'] == 'planned'
+
+
+class TestReportFingerprint:
+    """RULE-23: Unchanged inputs skip the report rebuild."""
+
+    def setup_method(self):
+        self.tmp = tempfile.mkdtemp()
+        purlin_server._RESIDENT.clear()
+
+    def teardown_method(self):
+        shutil.rmtree(self.tmp)
+
+    def _age(self, *paths):
+        old = time.time() - 60
+        for path in paths:
+            os.utime(path, (old, old))
+
+    def _report_bytes(self):
+        with open(os.path.join(self.tmp, '.purlin', 'report-data.js'), 'rb') as f:
+            return f.read()
+
+    @pytest.mark.proof("report_data", "PROOF-24", "RULE-23")
+    def test_unchanged_inputs_skip_rebuild(self):
+        _git_init(self.tmp)
+        _make_project(self.tmp)
+        spec = _write_spec(self.tmp, 'feature', _minimal_spec_content())
+        proofs = _write_proofs(self.tmp, 'feature', _minimal_proofs())
+        self._age(spec, proofs, os.path.dirname(spec), os.path.dirname(os.path.dirname(spec)))
+
+        purlin_server.sync_status(self.tmp)
+        first = _read_report(self.tmp)
+        assert re.fullmatch(r'[0-9a-f]{16}', first['fingerprint'])
+        before = self._report_bytes()
+
+        with mock.patch.object(purlin_server, '_build_report_data',
+                               wraps=purlin_server._build_report_data) as build:
+            purlin_server.sync_status(self.tmp)
+        assert build.call_count == 0
+        assert self._report_bytes() == before
+
+        # An old but unchanged report only has its timestamp refreshed
+        stale = '2000-01-01T00:00:00+00:00'
+        report_path = os.path.join(self.tmp, '.purlin', 'report-data.js')
+        with open(report_path, 'w') as f:
+            f.write(before.decode().replace(first['timestamp'], stale, 1))
+        with mock.patch.object(purlin_server, '_build_report_data',
+                               wraps=purlin_server._build_report_data) as build:
+            purlin_server.sync_status(self.tmp)
+        assert build.call_count == 0
+        restamped = _read_report(self.tmp)
+        assert restamped['timestamp'] > first['timestamp']
+        assert dict(restamped, timestamp=None) == dict(first, timestamp=None)
+
+        failing = _minimal_proofs()
+        failing[0]['status'] = 'fail'
+        _write_proofs(self.tmp, 'feature', failing)
+        self._age(proofs)
+        purlin_server.sync_status(self.tmp)
+        rebuilt = _read_report(self.tmp)
+        assert rebuilt['fingerprint'] != first['fingerprint']
+        assert rebuilt['features'][0]['status'] == 'FAILING'
+
+
+class TestIncrementalDigest:
+    """RULE-24: generate_digest patches only the features a commit touches."""
+
+    def setup_method(self):
+        self.tmp = tempfile.mkdtemp()
+        purlin_server._RESIDENT.clear()
+
+    def teardown_method(self):
+        shutil.rmtree(self.tmp)
+
+    def _git(self, *args):
+        subprocess.run(['git'] + list(args), cwd=self.tmp, capture_output=True, check=True)
+
+    def _age_tree(self):
+        old = time.time() - 60
+        for dirpath, dirnames, filenames in os.walk(os.path.join(self.tmp, 'specs')):
+            for name in filenames + ['.']:
+                os.utime(os.path.join(dirpath, name), (old, old))
+        cache = os.path.join(self.tmp, '.purlin', 'cache')
+        if os.path.isdir(cache):
+            for name in os.listdir(cache):
+                os.utime(os.path.join(cache, name), (old, old))
+
+    def _setup(self):
+        _git_init(self.tmp)
+        _make_project(self.tmp)
+        for name in ('alpha', 'beta', 'gamma'):
+            content = _minimal_spec_content(name)
+            if name == 'gamma':
+                content = content.replace('> Description:', '> Requires: beta\n> Description:')
+            _write_spec(self.tmp, name, content)
+            _write_proofs(self.tmp, name, _minimal_proofs(name))
+        self._git('add', '-A')
+        self._git('commit', '-m', 'verify: baseline')
+        self._age_tree()
+
+    def _digest(self, staged=None):
+        purlin_server._RESIDENT.clear()
+        return purlin_server.generate_digest(self.tmp, staged=staged)
+
+    @pytest.mark.proof("report_data", "PROOF-25", "RULE-24")
+    def test_staged_digest_matches_full_rebuild(self):
+        self._setup()
+        assert self._digest() is not None
+        first = _read_report(self.tmp)
+        assert 'state' not in first
+
+        # Commit one change, then stage a failing proof for beta
+        with open(os.path.join(self.tmp, 'notes.txt'), 'w') as f:
+            f.write('change\n')
+        self._git('add', 'notes.txt', '.purlin/report-data.js')
+        self._git('commit', '-m', 'notes')
+        failing = _minimal_proofs('beta')
+        failing[0]['status'] = 'fail'
+        proofs = _write_proofs(self.tmp, 'beta', failing)
+        os.utime(proofs, (time.time() - 30, time.time() - 30))
+        staged = [os.path.relpath(proofs, self.tmp)]
+
+        with mock.patch.object(purlin_server, '_build_report_data',
+                               wraps=purlin_server._build_report_data) as build, \
+             mock.patch.object(purlin_server, '_feature_coverage',
+                               wraps=purlin_server._feature_coverage) as coverage, \
+             mock.patch.object(purlin_server, '_get_diff_stats',
+                               wraps=purlin_server._get_diff_stats) as diff_stats:
+            self._digest(staged=staged)
+        assert build.call_count == 0
+        # beta and gamma (which requires beta) only
+        assert sorted(c.args[1] for c in coverage.call_args_list) == ['beta', 'gamma']
+        # drift re-reads only the files committed since the last digest
+        touched = [c.args[2] for c in diff_stats.call_args_list if len(c.args) > 2]
+        assert touched == [['.purlin/report-data.js', 'notes.txt']]
+        patched = _read_report(self.tmp)
+
+        # A full rebuild of the same inputs gives the same payload
+        with mock.patch.object(purlin_server, '_read_report_head', return_value=None):
+            self._digest()
+        full = _read_report(self.tmp)
+        # (the report file itself is now uncommitted)
+        assert dict(patched, timestamp=None, uncommitted=None) == \
+            dict(full, timestamp=None, uncommitted=None)
+        statuses = {f['name']: f['status'] for f in patched['features']}
+        assert statuses == {'alpha': 'PASSING', 'beta': 'FAILING', 'gamma': 'FAILING'}
+        assert patched['summary']['failing'] == 2
+        assert [f['path'] for f in patched['drift']['files']] == [
+            '.purlin/report-data.js', 'notes.txt']
+
+    @pytest.mark.proof("report_data", "PROOF-26", "RULE-24")
+    def test_config_change_falls_back_to_full_rebuild(self):
+        self._setup()
+        self._digest()
+        with open(os.path.join(self.tmp, '.purlin', 'config.json'), 'w') as f:
+            json.dump({'report': True, 'version': '2.0'}, f)
+        with mock.patch.object(purlin_server, '_build_report_data',
+                               wraps=purlin_server._build_report_data) as build:
+            self._digest(staged=['.purlin/config.json'])
+        assert build.call_count == 1
+        assert _read_report(self.tmp)['version'] == '2.0'
+
+    @pytest.mark.proof("report_data", "PROOF-27", "RULE-25")
+    def test_state_kept_in_cache_not_in_committed_report(self):
+        self._setup()
+        self._digest()
+        report = _read_report(self.tmp)
+        assert 'state' not in report
+        state_path = os.path.join(self.tmp, '.purlin', 'cache', 'report_state.json')
+        with open(state_path) as f:
+            state = json.load(f)
+        assert state['fingerprint'] == report['fingerprint']
+        assert 'specs/app/beta.proofs-unit.json' in state['inputs']
+
+        # A report-data.js from another checkout (different fingerprint)
+        # is never patched with this checkout's state.
+        state['fingerprint'] = '0' * 16
+        with open(state_path, 'w') as f:
+            json.dump(state, f)
+        failing = _minimal_proofs('beta')
+        failing[0]['status'] = 'fail'
+        proofs = _write_proofs(self.tmp, 'beta', failing)
+        os.utime(proofs, (time.time() - 30, time.time() - 30))
+        with mock.patch.object(purlin_server, '_build_report_data',
+                               wraps=purlin_server._build_report_data) as build:
+            self._digest(staged=[os.path.relpath(proofs, self.tmp)])
+        assert build.call_count == 1
+        with open(state_path) as f:
+            assert json.load(f)['fingerprint'] == _read_report(self.tmp)['fingerprint']
+
+    @pytest.mark.proof("report_data", "PROOF-28", "RULE-26")
+    def test_feature_removed_from_proof_file_is_rebuilt(self):
+        self._setup()
+        _write_spec(self.tmp, 'delta', _minimal_spec_content('delta'))
+        _write_proofs(self.tmp, 'beta', _minimal_proofs('beta') + _minimal_proofs('delta'))
+        self._age_tree()
+        self._digest()
+        before = {f['name']: f['status'] for f in _read_report(self.tmp)['features']}
+        assert before['delta'] == 'PASSING'
+
+        proofs = _write_proofs(self.tmp, 'beta', _minimal_proofs('beta'))
+        os.utime(proofs, (time.time() - 30, time.time() - 30))
+        with mock.patch.object(purlin_server, '_build_report_data',
+                               wraps=purlin_server._build_report_data) as build:
+            self._digest(staged=[os.path.relpath(proofs, self.tmp)])
+        assert build.call_count == 0
+        patched = _read_report(self.tmp)
+        after = {f['name']: f for f in patched['features']}
+        assert after['delta']['status'] != 'PASSING'
+        assert after['delta']['proved'] == 0
+
+        with mock.patch.object(purlin_server, '_read_report_head', return_value=None):
+            self._digest()
+        full = _read_report(self.tmp)
+        assert dict(patched, timestamp=None, uncommitted=None) == \
+            dict(full, timestamp=None, uncommitted=None)
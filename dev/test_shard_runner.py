@@ -0,0 +1,198 @@
+"""Tests for shard_runner — parallel unit-tier runs with merged proof files.
+
+Also covers the PURLIN_PROOF_SHARD_DIR redirect the pytest and shell proof
+plugins implement for it.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PROOF_SCRIPTS = os.path.join(PROJECT_ROOT, "scripts", "proof")
+SHELL_HARNESS = os.path.join(PROOF_SCRIPTS, "shell_purlin.sh")
+
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts", "hooks"))
+import shard_runner
+
+
+def _project(tmp_path, features=("alpha",)):
+    """Temp project whose conftest loads the pytest proof plugin."""
+    spec_dir = tmp_path / "specs" / "core"
+    spec_dir.mkdir(parents=True)
+    for feature in features:
+        (spec_dir / f"{feature}.md").write_text(
+            f"# Feature: {feature}\n\n## Rules\n\n- RULE-1: works\n- RULE-2: still works\n"
+        )
+    (tmp_path / "conftest.py").write_text(
+        f"import sys\nsys.path.insert(0, {PROOF_SCRIPTS!r})\n"
+        "from pytest_purlin import pytest_configure  # noqa: F401\n"
+    )
+    return spec_dir
+
+
+def _proofs(path):
+    return json.loads(path.read_text())["proofs"]
+
+
+def _shell_test(tmp_path, name, feature, proof_id, sleep=0):
+    script = tmp_path / name
+    script.write_text(textwrap.dedent(f"""\
+        #!/usr/bin/env bash
+        set -euo pipefail
+        source {SHELL_HARNESS}
+        sleep {sleep}
+        echo "$PURLIN_PROOF_SHARD_DIR" > "{name}.shard"
+        purlin_proof "{feature}" "{proof_id}" "RULE-1" pass "{name}"
+        purlin_proof_finish
+    """))
+    return name
+
+
+class TestSharding:
+
+    @pytest.mark.proof("shard_runner", "PROOF-1", "RULE-1")
+    def test_files_split_into_balanced_shards(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        sizes = {"test_big.py": 5000, "test_a.py": 1500, "test_b.py": 1400,
+                 "test_c.py": 1300, "test_d.py": 100}
+        for name, size in sizes.items():
+            (tmp_path / name).write_text("#" * size)
+
+        shards = shard_runner.make_shards("pytest", list(sizes), 2)
+        assert len(shards) == 2
+        assert sorted(f for shard in shards for f in shard) == sorted(sizes)
+        assert ["test_big.py"] in shards
+
+        assert shard_runner.make_shards("shell", ["a.test.sh", "b.test.sh"], 1) == \
+            [["a.test.sh"], ["b.test.sh"]]
+        assert shard_runner.make_shards("pytest", ["test_a.py"], 8) == [["test_a.py"]]
+
+    @pytest.mark.proof("shard_runner", "PROOF-2", "RULE-2", tier="integration")
+    def test_shards_run_concurrently_with_own_proof_dirs(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _project(tmp_path)
+        files = [_shell_test(tmp_path, f"{n}.test.sh", "alpha", f"PROOF-{i}", sleep=1)
+                 for i, n in enumerate(("one", "two"), 1)]
+
+        start = time.monotonic()
+        results = shard_runner.run("shell", files, jobs=2)
+        assert time.monotonic() - start < 1.9
+        assert [r["status"] for r in results] == ["passed", "passed"]
+        dirs = {(tmp_path / f"{name}.shard").read_text().strip() for name in files}
+        assert len(dirs) == 2 and "" not in dirs
+
+    @pytest.mark.proof("shard_runner", "PROOF-3", "RULE-3", tier="integration")
+    def test_merged_proofs_match_a_serial_run(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        spec_dir = _project(tmp_path)
+        for n in (1, 2):
+            (tmp_path / f"test_part{n}.py").write_text(textwrap.dedent(f"""\
+                import pytest
+
+                @pytest.mark.proof("alpha", "PROOF-{n}", "RULE-{n}")
+                def test_part{n}():
+                    assert True
+            """))
+        proof_file = spec_dir / "alpha.proofs-unit.json"
+        stale = {"feature": "alpha", "id": "PROOF-9", "rule": "RULE-9",
+                 "test_file": "test_gone.py", "test_name": "test_gone",
+                 "status": "fail", "tier": "unit"}
+        proof_file.write_text(json.dumps({"tier": "unit", "proofs": [stale]}))
+
+        results = shard_runner.run("pytest", ["test_part1.py", "test_part2.py"], jobs=2)
+        assert len(results) == 2
+        sharded = sorted((e["id"], e["test_file"], e["status"]) for e in _proofs(proof_file))
+        assert sharded == [("PROOF-1", "test_part1.py", "pass"),
+                           ("PROOF-2", "test_part2.py", "pass")]
+
+        proof_file.write_text(json.dumps({"tier": "unit", "proofs": [stale]}))
+        env = {k: v for k, v in os.environ.items() if k != "PURLIN_PROOF_SHARD_DIR"}
+        subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+                        "test_part1.py", "test_part2.py"],
+                       cwd=str(tmp_path), capture_output=True, check=True, env=env)
+        serial = sorted((e["id"], e["test_file"], e["status"]) for e in _proofs(proof_file))
+        assert serial == sharded
+
+    @pytest.mark.proof("shard_runner", "PROOF-4", "RULE-4", tier="integration")
+    def test_time_budget_stops_slow_shards_and_keeps_their_proofs(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        spec_dir = _project(tmp_path)
+        fast = _shell_test(tmp_path, "fast.test.sh", "alpha", "PROOF-1")
+        slow = _shell_test(tmp_path, "slow.test.sh", "alpha", "PROOF-2", sleep=30)
+        proof_file = spec_dir / "alpha.proofs-unit.json"
+        old = [
+            {"feature": "alpha", "id": "PROOF-1", "rule": "RULE-1", "test_file": fast,
+             "test_name": "old", "status": "fail", "tier": "unit"},
+            {"feature": "alpha", "id": "PROOF-2", "rule": "RULE-1", "test_file": slow,
+             "test_name": "old", "status": "pass", "tier": "unit"},
+        ]
+        proof_file.write_text(json.dumps({"tier": "unit", "proofs": old}))
+
+        start = time.monotonic()
+        results = shard_runner.run("shell", [fast, slow], jobs=2, budget=1)
+        assert time.monotonic() - start < 10
+        assert [r["status"] for r in results] == ["passed", "timeout"]
+        by_id = {e["id"]: e for e in _proofs(proof_file)}
+        assert by_id["PROOF-1"]["status"] == "pass"
+        assert by_id["PROOF-1"]["test_name"] == fast
+        assert by_id["PROOF-2"] == old[1]
+
+
+class TestReport:
+
+    @pytest.mark.proof("shard_runner", "PROOF-5", "RULE-5")
+    def test_summary_lists_slowest_shards_and_budget_overrun(self, capsys):
+        results = [
+            {"files": ["test_a.py"], "status": "passed", "seconds": 1.0, "output": ""},
+            {"files": ["test_b.py", "test_c.py"], "status": "failed", "seconds": 4.0, "output": "1 failed"},
+            {"files": ["test_d.py"], "status": "passed", "seconds": 2.5, "output": ""},
+            {"files": ["test_e.py"], "status": "skipped", "seconds": 0.0, "output": ""},
+        ]
+        shard_runner.report(results, 4.2, 2, budget=5)
+        out = capsys.readouterr().out
+        assert "4 shard(s) on 2 worker(s) in 4.2s" in out
+        slowest = out[out.index("slowest shards:"):out.index("time budget")]
+        assert slowest.index("test_b.py +1 more") < slowest.index("test_d.py") \
+            < slowest.index("test_a.py")
+        assert "test_e.py" not in slowest
+        assert "time budget of 5s exceeded" in out
+        assert "test_e.py (skipped)" in out
+        assert "1 failed" in out
+
+
+class TestPluginShardDir:
+
+    @pytest.mark.proof("proof_plugins_pytest", "PROOF-5", "RULE-5", tier="integration")
+    def test_pytest_plugin_writes_to_shard_dir(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        (tmp_path / "test_s.py").write_text(textwrap.dedent("""\
+            import pytest
+
+            @pytest.mark.proof("alpha", "PROOF-1", "RULE-1")
+            def test_it():
+                assert True
+        """))
+        shard_dir = tmp_path / "shard"
+        shard_dir.mkdir()
+        subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_s.py"],
+                       cwd=str(tmp_path), capture_output=True, check=True,
+                       env=dict(os.environ, PURLIN_PROOF_SHARD_DIR=str(shard_dir)))
+        assert not (spec_dir / "alpha.proofs-unit.json").exists()
+        assert _proofs(shard_dir / "alpha.proofs-unit.json")[0]["id"] == "PROOF-1"
+
+    @pytest.mark.proof("proof_plugins_shell", "PROOF-5", "RULE-5", tier="integration")
+    def test_shell_harness_writes_to_shard_dir(self, tmp_path):
+        spec_dir = _project(tmp_path)
+        name = _shell_test(tmp_path, "one.test.sh", "alpha", "PROOF-1")
+        shard_dir = tmp_path / "shard"
+        shard_dir.mkdir()
+        subprocess.run(["bash", name], cwd=str(tmp_path), capture_output=True, check=True,
+                       env=dict(os.environ, PURLIN_PROOF_SHARD_DIR=str(shard_dir)))
+        assert not (spec_dir / "alpha.proofs-unit.json").exists()
+        assert _proofs(shard_dir / "alpha.proofs-unit.json")[0]["id"] == "PROOF-1"
@@ -0,0 +1,134 @@
+"""Tests for spec_parser — the single-pass spec tokenizer."""
+
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'mcp'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'audit'))
+import purlin_server
+import spec_parser
+import static_checks
+from spec_parser import tokenize_spec
+
+
+class TestMetadata:
+
+    @pytest.mark.proof("spec_parser", "PROOF-1", "RULE-1")
+    def test_first_field_wins_and_indented_lines_ignored(self):
+        tokens = tokenize_spec(
+            '# Feature: x\n\n'
+            '> Scope: a.py, b.py  \n'
+            '> Scope: c.py\n'
+            '  > Stack: python\n'
+        )
+        assert tokens['fields'] == {'Scope': 'a.py, b.py'}
+
+    @pytest.mark.proof("spec_parser", "PROOF-2", "RULE-2")
+    def test_description_continuation(self):
+        tokens = tokenize_spec(
+            '# Feature: x\n\n'
+            '> Description: First line\n'
+            '>   second line\n'
+            '\n'
+            '> third line\n'
+            '> Scope: a.py\n'
+            '> not continued\n'
+        )
+        assert tokens['description'] == 'First line second line third line'
+        assert tokens['fields']['Scope'] == 'a.py'
+
+
+class TestRules:
+
+    SPEC = (
+        '# Feature: x\n\n'
+        '## Rules\n\n'
+        '- RULE-1: First\n'
+        '- missing number\n'
+        '- RULE-2: Second (deferred)\n\n'
+        '## Notes\n\n'
+        '- RULE-7: Mentioned in notes\n\n'
+        '## Rules\n\n'
+        '- RULE-9: Second section\n'
+    )
+
+    @pytest.mark.proof("spec_parser", "PROOF-3", "RULE-3")
+    def test_rules_from_first_rules_section_only(self):
+        tokens = tokenize_spec(self.SPEC)
+        assert tokens['has_rules_section'] is True
+        assert tokens['rules'] == [('RULE-1', 'First'), ('RULE-2', 'Second (deferred)')]
+        assert [r for r, _ in tokens['all_rules']] == ['RULE-1', 'RULE-2', 'RULE-7', 'RULE-9']
+
+    @pytest.mark.proof("spec_parser", "PROOF-4", "RULE-4")
+    def test_unnumbered_rule_lines_reported(self):
+        tokens = tokenize_spec(self.SPEC)
+        assert tokens['unnumbered_rules'] == ['- missing number']
+
+
+class TestProofs:
+
+    @pytest.mark.proof("spec_parser", "PROOF-5", "RULE-5")
+    def test_proof_lines_parsed(self):
+        tokens = tokenize_spec(
+            '# Feature: x\n\n'
+            '## Rules\n\n- RULE-1: a\n- RULE-3: b\n\n'
+            '## Proof\n\n'
+            '- PROOF-2 (RULE-1,RULE-3): checks it @integration\n'
+            '- PROOF-3 (RULE-1): untagged\n'
+        )
+        assert tokens['has_proof_section'] is True
+        first, second = tokens['proofs']
+        assert first['proof_id'] == 'PROOF-2'
+        assert first['rule_ids'] == ['RULE-1', 'RULE-3']
+        assert first['description'] == 'checks it @integration'
+        assert first['clean_description'] == 'checks it'
+        assert first['tier'] == 'integration'
+        assert (second['proof_id'], second['tier']) == ('PROOF-3', 'unit')
+
+
+class TestSharedConsumers:
+
+    TOKENS = {
+        'fields': {'Scope': 'from_tokens.py'},
+        'is_global': False,
+        'description': 'from tokens',
+        'has_rules_section': True,
+        'has_proof_section': True,
+        'rules': [('RULE-4', 'tokenized rule')],
+        'unnumbered_rules': [],
+        'all_rules': [('RULE-4', 'tokenized rule'), ('RULE-5', 'elsewhere')],
+        'proofs': [{
+            'proof_id': 'PROOF-8', 'rule_ids': ['RULE-4'],
+            'description': 'tokenized proof @e2e', 'clean_description': 'tokenized proof',
+            'tier': 'e2e', 'line': '- PROOF-8 (RULE-4): tokenized proof @e2e',
+        }],
+    }
+
+    def setup_method(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.spec_path = os.path.join(self.tmpdir, 'x.md')
+        with open(self.spec_path, 'w') as f:
+            f.write('# Feature: x\n')
+
+    def teardown_method(self):
+        shutil.rmtree(self.tmpdir)
+
+    @pytest.mark.proof("spec_parser", "PROOF-6", "RULE-6")
+    def test_server_and_static_checks_use_tokenizer(self):
+        with mock.patch.object(purlin_server, 'tokenize_spec', return_value=self.TOKENS):
+            info = purlin_server._parse_spec('# Feature: x\n', os.path.join('specs', 'mcp', 'x.md'))
+        assert info['rules'] == {'RULE-4': 'tokenized rule'}
+        assert info['scope'] == ['from_tokens.py']
+        assert info['proof_tier_by_id'] == {'PROOF-8': 'e2e'}
+
+        with mock.patch.object(spec_parser, 'tokenize_spec', return_value=self.TOKENS):
+            rules = static_checks._read_rule_descriptions(self.spec_path)
+            proofs = static_checks._read_proof_descriptions(self.spec_path)
+        assert rules == {'RULE-4': 'tokenized rule', 'RULE-5': 'elsewhere'}
+        assert proofs == [{'proof_id': 'PROOF-8', 'rule_ids': 'RULE-4',
+                           'description': 'tokenized proof'}]
@@ -11,6 +11,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
 from unittest import mock
 
 import pytest
@@ -487,7 +488,8 @@ class TestAuditCache:
             with mock.patch.object(static_checks.os, 'replace', side_effect=spy_replace):
                 write_audit_cache(tmpdir, data)
 
-            cache_path = os.path.join(tmpdir, '.purlin', 'cache', 'audit_cache.json')
+            # An entry without a feature lands in the '_' shard
+            cache_path = os.path.join(tmpdir, '.purlin', 'cache', 'audit_cache.d', '_.json')
             assert replace_calls, "write is not atomic — os.replace was never called"
             src, dst = replace_calls[-1]
             assert src.endswith('.tmp'), f"expected rename from a .tmp file, got {src!r}"
@@ -497,7 +499,7 @@ class TestAuditCache:
             result = read_audit_cache(tmpdir)
             assert result == data
             # No .tmp file left behind after the rename
-            assert not os.path.exists(cache_path + '.tmp')
+            assert not [n for n in os.listdir(os.path.dirname(cache_path)) if n.endswith('.tmp')]
 
 
 class TestWriteCacheMerge:
@@ -1102,12 +1104,12 @@ class TestWriteCacheLocking:
 
     @pytest.mark.proof("static_checks", "PROOF-40", "RULE-25")
     def test_lock_file_created_alongside_cache(self):
-        """write_audit_cache creates audit_cache.json.lock adjacent to the cache file."""
+        """write_audit_cache creates <feature>.json.lock adjacent to the feature's shard."""
         import fcntl
         import unittest.mock as mock
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            lock_path = os.path.join(tmpdir, '.purlin', 'cache', 'audit_cache.json.lock')
+            lock_path = os.path.join(tmpdir, '.purlin', 'cache', 'audit_cache.d', 'feat_a.json.lock')
             lock_seen = []
 
             original_flock = fcntl.flock
@@ -1237,6 +1239,72 @@ class TestWriteCacheCLI:
             assert "new_hash" in after, "new entry not written by --write-cache"
 
 
+class TestShardedCache:
+    """RULE-29/RULE-30: per-feature shards over the legacy single-file cache."""
+
+    def _make_entry(self, assessment, feature, proof_id):
+        return {
+            "assessment": assessment,
+            "criterion": "matches rule intent",
+            "why": "test exercises the rule correctly",
+            "fix": "none",
+            "feature": feature,
+            "proof_id": proof_id,
+            "rule_id": "RULE-1",
+            "priority": "LOW",
+            "cached_at": "2026-04-01T00:00:00+00:00",
+        }
+
+    @pytest.mark.proof("static_checks", "PROOF-44", "RULE-29")
+    def test_write_touches_only_its_feature_and_supersedes_legacy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, '.purlin', 'cache')
+            os.makedirs(cache_dir)
+            with open(os.path.join(cache_dir, 'audit_cache.json'), 'w') as f:
+                json.dump({
+                    "old_a1": self._make_entry("HOLLOW", "feature_a", "PROOF-1"),
+                    "old_a2": self._make_entry("WEAK", "feature_a", "PROOF-2"),
+                    "old_b1": self._make_entry("STRONG", "feature_b", "PROOF-1"),
+                }, f)
+
+            write_audit_cache(tmpdir, {"new_a1": self._make_entry("STRONG", "feature_a", "PROOF-1")})
+
+            assert sorted(os.listdir(os.path.join(cache_dir, 'audit_cache.d'))) == \
+                ['feature_a.json', 'feature_a.json.lock']
+            after = read_audit_cache(tmpdir)
+            assert sorted(after) == ["new_a1", "old_a2", "old_b1"]
+            assert after["new_a1"]["assessment"] == "STRONG"
+
+    @pytest.mark.proof("static_checks", "PROOF-45", "RULE-30")
+    def test_read_single_feature_reads_one_shard(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_audit_cache(tmpdir, {
+                "a1": self._make_entry("STRONG", "feature_a", "PROOF-1"),
+                "a2": self._make_entry("WEAK", "feature_a", "PROOF-2"),
+                "b1": self._make_entry("STRONG", "feature_b", "PROOF-1"),
+            })
+
+            real_read = static_checks._read_cache_file
+            read_paths = []
+
+            def spy_read(path):
+                read_paths.append(os.path.basename(path))
+                return real_read(path)
+
+            with mock.patch.object(static_checks, '_read_cache_file', side_effect=spy_read):
+                result = read_audit_cache(tmpdir, feature='feature_a')
+            assert sorted(result) == ["a1", "a2"]
+            assert 'feature_b.json' not in read_paths
+
+            cli = subprocess.run(
+                [sys.executable, STATIC_CHECKS_PY, '--read-cache', '--project-root', tmpdir,
+                 '--feature', 'feature_a'],
+                capture_output=True, text=True,
+            )
+            assert cli.returncode == 0, cli.stderr
+            assert json.loads(cli.stdout) == result
+
+
 class TestCheckJs:
     """check_js JS/TS structural checks, exercised through the real CLI."""
 
@@ -1315,3 +1383,221 @@ describe("repro", () => {
         assert proofs["PROOF-1"]["status"] == "pass", proofs["PROOF-1"]
         assert proofs["PROOF-1"].get("check") != "no_assertions"
         assert proofs["PROOF-2"]["status"] == "pass"
+
+
+class TestBatchMode:
+
+    def _project(self, tmp_path):
+        """Two features proved from one shared Python file, plus a shell test."""
+        specs = tmp_path / "specs"
+        specs.mkdir()
+        for feature in ("alpha", "beta"):
+            _write_spec_file(specs, feature, {"RULE-1": "does the thing", "RULE-2": "does another thing"})
+        (tmp_path / "test_shared.py").write_text('''
+import pytest
+
+@pytest.mark.proof("alpha", "PROOF-1", "RULE-1")
+def test_alpha_tautology():
+    assert True
+
+@pytest.mark.proof("alpha", "PROOF-2", "RULE-2")
+def test_alpha_real():
+    assert 2 + 2 == 4
+
+@pytest.mark.proof("beta", "PROOF-1", "RULE-1")
+def test_beta_real():
+    assert "b".upper() == "B"
+''')
+        (tmp_path / "beta.test.sh").write_text(
+            'purlin_proof "beta" "PROOF-2" "RULE-2" pass "hardcoded"\n'
+        )
+        _write_proof_json(specs, "alpha", "unit", [
+            {"feature": "alpha", "id": "PROOF-1", "rule": "RULE-1", "test_file": "test_shared.py",
+             "test_name": "test_alpha_tautology", "status": "pass", "tier": "unit"},
+            {"feature": "alpha", "id": "PROOF-2", "rule": "RULE-9", "test_file": "test_shared.py",
+             "test_name": "test_alpha_real", "status": "pass", "tier": "unit"},
+        ])
+        _write_proof_json(specs, "beta", "unit", [
+            {"feature": "beta", "id": "PROOF-1", "rule": "RULE-1", "test_file": "test_shared.py",
+             "test_name": "test_beta_real", "status": "pass", "tier": "unit"},
+            {"feature": "beta", "id": "PROOF-2", "rule": "RULE-2", "test_file": "beta.test.sh",
+             "test_name": "hardcoded", "status": "pass", "tier": "unit"},
+            {"feature": "beta", "id": "PROOF-3", "rule": "RULE-2", "test_file": "gone.test.sh",
+             "test_name": "gone", "status": "pass", "tier": "unit"},
+        ])
+
+    @pytest.mark.proof("static_checks", "PROOF-46", "RULE-31")
+    def test_batch_matches_per_file_checks(self, tmp_path):
+        self._project(tmp_path)
+        result = subprocess.run(
+            [sys.executable, STATIC_CHECKS_PY, '--batch', '--project-root', str(tmp_path)],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout)
+
+        assert sorted(report["features"]) == ["alpha", "beta"]
+        alpha = report["features"]["alpha"]
+        assert alpha["coverage"] == {"rule_count": 2, "proof_count": 2}
+        assert [(f["check"], f["proof_file"]) for f in alpha["proof_file_findings"]] == \
+            [("proof_rule_orphan", os.path.join("specs", "alpha.proofs-unit.json"))]
+
+        spec = str(tmp_path / "specs" / "alpha.md")
+        single = check_python(str(tmp_path / "test_shared.py"), "alpha",
+                              _read_rule_descriptions(spec))
+        assert [{k: v for k, v in p.items() if k != "test_file"} for p in alpha["proofs"]] == single
+        assert {p["test_file"] for p in alpha["proofs"]} == {"test_shared.py"}
+
+        beta = {p["proof_id"]: p for p in report["features"]["beta"]["proofs"]}
+        assert beta["PROOF-1"]["status"] == "pass"
+        assert beta["PROOF-2"]["check"] == "assert_true"
+        assert beta["PROOF-2"]["test_file"] == "beta.test.sh"
+        assert report["errors"] == [{"test_file": "gone.test.sh", "error": "file not found"}]
+        assert report["files_checked"] == 2
+
+    @pytest.mark.proof("static_checks", "PROOF-47", "RULE-32")
+    def test_batch_reads_and_parses_each_file_once(self, tmp_path):
+        self._project(tmp_path)
+        manifest = static_checks.build_batch_manifest(str(tmp_path))
+        assert [m["feature"] for m in manifest] == ["alpha", "beta"]
+        assert manifest[1]["test_files"] == ["beta.test.sh", "gone.test.sh", "test_shared.py"]
+
+        real_parse = static_checks.ast.parse
+        with mock.patch.object(static_checks.ast, "parse", side_effect=real_parse) as parse:
+            report = static_checks.run_batch(str(tmp_path), manifest, jobs=1)
+        assert parse.call_count == 1
+        assert len(report["features"]["alpha"]["proofs"]) == 2
+        assert len(report["features"]["beta"]["proofs"]) == 2
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps([{
+            "feature": "beta", "spec_path": "specs/beta.md",
+            "proof_files": [], "test_files": ["test_shared.py"],
+        }]))
+        result = subprocess.run(
+            [sys.executable, STATIC_CHECKS_PY, '--batch', '--project-root', str(tmp_path),
+             '--manifest', str(manifest_path), '--jobs', '1'],
+            capture_output=True, text=True,
+        )
+        report = json.loads(result.stdout)
+        assert list(report["features"]) == ["beta"]
+        assert [p["test_name"] for p in report["features"]["beta"]["proofs"]] == ["test_beta_real"]
+
+    @pytest.mark.proof("static_checks", "PROOF-48", "RULE-33")
+    def test_batch_pool_matches_serial_order(self, tmp_path):
+        self._project(tmp_path)
+        # Many files whose creation order differs from sorted order.
+        proofs = []
+        for n in range(12, 0, -1):
+            name = f"test_gen_{n:02d}.py"
+            body = "    assert True\n" if n % 3 == 0 else f"    assert {n} + 1 == {n + 1}\n"
+            (tmp_path / name).write_text(
+                f'import pytest\n\n@pytest.mark.proof("alpha", "PROOF-{n + 10}", "RULE-1")\n'
+                f"def test_gen_{n}():\n" + body
+            )
+            proofs.append({"feature": "alpha", "id": f"PROOF-{n + 10}", "rule": "RULE-1",
+                           "test_file": name, "test_name": f"test_gen_{n}",
+                           "status": "pass", "tier": "unit"})
+        _write_proof_json(tmp_path / "specs", "alpha", "integration", proofs)
+
+        serial = static_checks.run_batch(str(tmp_path), jobs=1, use_cache=False)
+        with mock.patch.object(static_checks, "ProcessPoolExecutor",
+                               wraps=static_checks.ProcessPoolExecutor) as pool:
+            parallel = static_checks.run_batch(str(tmp_path), jobs=4, use_cache=False)
+        assert pool.call_args.kwargs["max_workers"] == 4
+        assert parallel == serial
+
+        files = [p["test_file"] for p in parallel["features"]["alpha"]["proofs"]]
+        assert files == sorted(files)
+        hollow = {p["proof_id"] for p in parallel["features"]["alpha"]["proofs"]
+                  if p.get("check") == "assert_true"}
+        assert hollow == {"PROOF-1", "PROOF-13", "PROOF-16", "PROOF-19", "PROOF-22"}
+
+        result = subprocess.run(
+            [sys.executable, STATIC_CHECKS_PY, '--batch', '--project-root', str(tmp_path),
+             '--jobs', '3', '--no-cache'],
+            capture_output=True, text=True,
+        )
+        assert json.loads(result.stdout) == serial
+
+
+class TestPass1Cache:
+
+    def _run_counting_parses(self, root, **kwargs):
+        real_parse = static_checks.ast.parse
+        with mock.patch.object(static_checks.ast, "parse", side_effect=real_parse) as parse:
+            report = static_checks.run_batch(root, jobs=1, **kwargs)
+        return report, parse.call_count
+
+    @pytest.mark.proof("static_checks", "PROOF-49", "RULE-34")
+    def test_unchanged_files_skip_parsing(self, tmp_path):
+        TestBatchMode()._project(tmp_path)
+        (tmp_path / "test_other.py").write_text(
+            'import pytest\n\n@pytest.mark.proof("alpha", "PROOF-3", "RULE-1")\n'
+            'def test_other():\n    assert 1 + 1 == 2\n'
+        )
+        _write_proof_json(tmp_path / "specs", "alpha", "integration", [
+            {"feature": "alpha", "id": "PROOF-3", "rule": "RULE-1", "test_file": "test_other.py",
+             "test_name": "test_other", "status": "pass", "tier": "integration"},
+        ])
+        root = str(tmp_path)
+
+        first, parses = self._run_counting_parses(root)
+        assert (parses, first["cache_hits"]) == (2, 0)
+        cache_dir = tmp_path / ".purlin" / "cache" / "pass1_cache.d"
+        assert len(list(cache_dir.glob("*.json"))) == 3
+
+        second, parses = self._run_counting_parses(root)
+        assert (parses, second["cache_hits"]) == (0, 4)
+        assert second["features"] == first["features"]
+
+        # Editing one file re-checks only that file.
+        shared = tmp_path / "test_shared.py"
+        shared.write_text(shared.read_text().replace("assert 2 + 2 == 4", "assert True"))
+        third, parses = self._run_counting_parses(root)
+        assert (parses, third["cache_hits"]) == (1, 2)
+        alpha = {p["proof_id"]: p for p in third["features"]["alpha"]["proofs"]}
+        assert alpha["PROOF-2"]["check"] == "assert_true"
+
+        # --no-cache re-checks everything and leaves the cache alone.
+        _, parses = self._run_counting_parses(root, use_cache=False)
+        assert parses == 2
+
+    @pytest.mark.proof("static_checks", "PROOF-50", "RULE-35")
+    def test_rule_text_and_checker_version_invalidate(self, tmp_path):
+        TestBatchMode()._project(tmp_path)
+        root = str(tmp_path)
+        self._run_counting_parses(root)
+
+        spec = tmp_path / "specs" / "beta.md"
+        spec.write_text(spec.read_text().replace("does the thing", "does the new thing"))
+        report, parses = self._run_counting_parses(root)
+        assert parses == 1
+        assert report["cache_hits"] == 1  # only alpha's entry; both beta entries re-check
+
+        with mock.patch.object(static_checks, "_checks_version", "0000000000000000"):
+            report, parses = self._run_counting_parses(root)
+        assert (parses, report["cache_hits"]) == (1, 0)
+
+    @pytest.mark.proof("static_checks", "PROOF-51", "RULE-36")
+    def test_concurrent_writes_to_one_file_do_not_collide(self, tmp_path):
+        path = str(tmp_path / "pass1_cache.json")
+        payloads = [{"writer": n, "entries": list(range(2000))} for n in range(8)]
+        for _ in range(5):
+            errors = []
+
+            def write(data):
+                try:
+                    static_checks._write_cache_file(path, data)
+                except Exception as exc:  # collected and asserted below
+                    errors.append(exc)
+
+            threads = [threading.Thread(target=write, args=(data,)) for data in payloads]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == []
+            with open(path) as f:
+                assert json.load(f) in payloads
+        assert os.listdir(str(tmp_path)) == ["pass1_cache.json"]
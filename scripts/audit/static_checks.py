@@ -6,6 +6,7 @@ bare except, mock-target match) using Python's ast module and regex.
 
 Usage:
     python3 scripts/audit/static_checks.py <test_file> <feature_name> [--spec-path <path>]
+    python3 scripts/audit/static_checks.py --batch [--project-root <path>] [--manifest <path>] [--jobs N|auto] [--no-cache]
 
 Exit code 0 = all proofs passed, 1 = at least one failed.
 Output: JSON to stdout with per-proof results.
@@ -19,6 +20,14 @@ import json
 import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mcp'))
+
+from config_engine import parse_jobs
+from spec_parser import tokenize_spec_file
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -45,9 +54,13 @@ _JEST_PROOF_RE = re.compile(
 # Python checks (ast-based)
 # ---------------------------------------------------------------------------
 
-def _get_python_proofs_and_functions(source, feature_name):
-    """Parse Python file, return list of (proof_id, rule_id, test_name, func_node)."""
-    tree = ast.parse(source)
+def _get_python_proofs_and_functions(source, feature_name, tree=None):
+    """Parse Python file, return list of (proof_id, rule_id, test_name, func_node).
+
+    Pass an already-parsed `tree` to skip re-parsing the same source.
+    """
+    if tree is None:
+        tree = ast.parse(source)
     results = []
     for node in ast.walk(tree):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -254,10 +267,15 @@ def _check_mock_target_match(node, source, rule_desc):
 
 def check_python(filepath, feature_name, rule_descs=None):
     """Run all Python checks. Returns list of proof result dicts."""
-    rule_descs = rule_descs or {}
     with open(filepath) as f:
         source = f.read()
-    proofs = _get_python_proofs_and_functions(source, feature_name)
+    return check_python_source(source, feature_name, rule_descs)
+
+
+def check_python_source(source, feature_name, rule_descs=None, tree=None):
+    """check_python over source text; `tree` reuses an existing parse."""
+    rule_descs = rule_descs or {}
+    proofs = _get_python_proofs_and_functions(source, feature_name, tree=tree)
     results = []
     for proof_id, rule_id, test_name, func_node in proofs:
         checks_failed = []
@@ -301,6 +319,11 @@ def check_shell(filepath, feature_name):
     """Run shell test checks. Returns list of proof result dicts."""
     with open(filepath) as f:
         content = f.read()
+    return check_shell_source(content, feature_name)
+
+
+def check_shell_source(content, feature_name):
+    """check_shell over source text."""
     lines = content.splitlines()
     results = []
     proof_locations = []
@@ -556,6 +579,11 @@ def check_js(filepath, feature_name):
     """Run JS/TS test checks. Returns list of proof result dicts."""
     with open(filepath) as f:
         content = f.read()
+    return check_js_source(content, feature_name)
+
+
+def check_js_source(content, feature_name):
+    """check_js over source text."""
     results = []
     call_re = re.compile(r'\b(?:it|test)\s*\(')
     marker_re = re.compile(
@@ -619,23 +647,14 @@ def check_js(filepath, feature_name):
 # Spec reading (for mock_target_match)
 # ---------------------------------------------------------------------------
 
-_RULE_LINE_RE = re.compile(r'^-\s+(RULE-\d+):\s*(.+)', re.MULTILINE)
-
 def _read_rule_descriptions(spec_path):
     """Read rule descriptions from a spec file."""
     if not spec_path or not os.path.isfile(spec_path):
         return {}
-    with open(spec_path) as f:
-        content = f.read()
-    return {m.group(1): m.group(2).strip() for m in _RULE_LINE_RE.finditer(content)}
-
-
-_PROOF_DESC_RE = re.compile(
-    r'^-\s+(PROOF-\d+)\s*\((RULE-\d+(?:,\s*RULE-\d+)*)\):\s*(.+)',
-    re.MULTILINE,
-)
-
-_TIER_TAG_RE = re.compile(r'\s*@\w+(?:\([^)]*\))?\s*$')
+    tokens = tokenize_spec_file(spec_path)
+    if tokens is None:
+        return {}
+    return dict(tokens['all_rules'])
 
 
 def _read_proof_descriptions(spec_path):
@@ -645,24 +664,14 @@ def _read_proof_descriptions(spec_path):
     """
     if not spec_path or not os.path.isfile(spec_path):
         return []
-    with open(spec_path) as f:
-        content = f.read()
-    proof_section_match = re.search(
-        r'^## Proof\s*\n(.*?)(?=^## |\Z)',
-        content, re.MULTILINE | re.DOTALL,
-    )
-    if not proof_section_match:
+    tokens = tokenize_spec_file(spec_path)
+    if tokens is None:
         return []
-    proof_section = proof_section_match.group(1)
-    results = []
-    for m in _PROOF_DESC_RE.finditer(proof_section):
-        desc = _TIER_TAG_RE.sub('', m.group(3)).strip()
-        results.append({
-            'proof_id': m.group(1),
-            'rule_ids': m.group(2),
-            'description': desc,
-        })
-    return results
+    return [{
+        'proof_id': p['proof_id'],
+        'rule_ids': ', '.join(p['rule_ids']),
+        'description': p['clean_description'],
+    } for p in tokens['proofs']]
 
 
 def check_spec_coverage(spec_path):
@@ -741,6 +750,238 @@ def check_proof_file(proof_json_path, spec_path=None):
     return findings
 
 
+# ---------------------------------------------------------------------------
+# Batch mode (Pass 0.5 + Pass 1 for a whole project in one process)
+# ---------------------------------------------------------------------------
+
+_PROOF_FILE_RE = re.compile(r'^(.+)\.proofs-(.+)\.json$')
+
+_JS_EXTENSIONS = ('.js', '.ts', '.jsx', '.tsx')
+
+
+def build_batch_manifest(project_root):
+    """Derive a batch manifest from the `*.proofs-*.json` files under specs/.
+
+    Returns a list of {feature, spec_path, proof_files, test_files} dicts,
+    sorted by feature, with paths relative to project_root.
+    """
+    specs_dir = os.path.join(project_root, 'specs')
+    by_feature = {}
+    for dirpath, dirnames, filenames in os.walk(specs_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            m = _PROOF_FILE_RE.match(name)
+            if not m:
+                continue
+            feature = m.group(1)
+            proof_path = os.path.join(dirpath, name)
+            rel_dir = os.path.relpath(dirpath, project_root)
+            item = by_feature.setdefault(feature, {
+                'feature': feature, 'spec_path': None,
+                'proof_files': [], 'test_files': [],
+            })
+            spec_path = os.path.join(dirpath, feature + '.md')
+            if item['spec_path'] is None and os.path.isfile(spec_path):
+                item['spec_path'] = os.path.join(rel_dir, feature + '.md')
+            item['proof_files'].append(os.path.join(rel_dir, name))
+            try:
+                with open(proof_path) as f:
+                    proofs = json.load(f).get('proofs', [])
+            except (OSError, ValueError, AttributeError):
+                continue
+            for entry in proofs:
+                test_file = entry.get('test_file')
+                if test_file and test_file not in item['test_files']:
+                    item['test_files'].append(test_file)
+    for item in by_feature.values():
+        item['test_files'].sort()
+    return [by_feature[name] for name in sorted(by_feature)]
+
+
+def _check_source(ext, source, feature_name, rule_descs, tree=None):
+    """Dispatch Pass 1 checks for already-read source by file extension."""
+    if ext == '.py':
+        return check_python_source(source, feature_name, rule_descs, tree=tree)
+    if ext == '.sh':
+        return check_shell_source(source, feature_name)
+    if ext in _JS_EXTENSIONS:
+        return check_js_source(source, feature_name)
+    return []
+
+
+# Pass 1 result cache: one JSON file per test file under
+# .purlin/cache/pass1_cache.d/, holding the results of every feature checked
+# against the file's current content. An entry is keyed by (content hash,
+# feature, checker version, spec rule-text hash), so any edit to the test,
+# the spec's rules or this script misses and is re-checked; files whose
+# entries all hit are never parsed.
+_PASS1_CACHE_DIR = 'pass1_cache.d'
+
+_checks_version = None
+
+
+def _pass1_version():
+    """Hash of this script's source — changes whenever the checks change."""
+    global _checks_version
+    if _checks_version is None:
+        with open(os.path.abspath(__file__), 'rb') as f:
+            _checks_version = hashlib.sha256(f.read()).hexdigest()[:16]
+    return _checks_version
+
+
+def _rules_hash(rule_descs):
+    """Hash of a feature's rule text, the only spec input Pass 1 reads."""
+    text = json.dumps(sorted((rule_descs or {}).items()))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _pass1_cache_path(project_root, test_file):
+    name = hashlib.sha256(test_file.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(_audit_cache_dir(project_root), _PASS1_CACHE_DIR, name + '.json')
+
+
+def _pass1_key(content_hash, feature, rules_hash):
+    raw = '\0'.join((content_hash, feature, _pass1_version(), rules_hash))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def _batch_check_file(item):
+    """Pass 1 for one test file and every feature proved in it.
+
+    Module-level so a process pool can pickle it. `cache_path` (or None to
+    bypass the cache) is this file's Pass 1 cache; the file is parsed only
+    when some feature misses. Returns {'results': [(feature, [proof
+    results])], 'cache_hits': N} or {'error': message}.
+    """
+    test_file, path, feature_descs, cache_path = item
+    ext = os.path.splitext(test_file)[1].lower()
+    if not os.path.isfile(path):
+        return {'error': 'file not found'}
+    try:
+        with open(path) as f:
+            source = f.read()
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        return {'error': str(exc)}
+
+    cached = {}
+    content_hash = hashlib.sha256(source.encode('utf-8', 'surrogatepass')).hexdigest()
+    if cache_path:
+        data = _read_cache_file(cache_path)
+        if data.get('content_hash') == content_hash:
+            cached = data.get('entries', {})
+
+    keys = [_pass1_key(content_hash, feature, rules_hash)
+            for feature, _, rules_hash in feature_descs]
+    misses = [i for i, key in enumerate(keys) if key not in cached]
+    tree = None
+    if misses and ext == '.py':
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError) as exc:
+            return {'error': str(exc)}
+    results = []
+    for i, (feature, descs, _) in enumerate(feature_descs):
+        if keys[i] not in cached:
+            cached[keys[i]] = _check_source(ext, source, feature, descs, tree)
+        results.append((feature, cached[keys[i]]))
+    if cache_path and misses:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            _write_cache_file(cache_path, {
+                'test_file': test_file, 'content_hash': content_hash, 'entries': cached,
+            })
+        except OSError:
+            pass  # an unwritable cache only costs the next run a re-check
+    return {'results': results, 'cache_hits': len(keys) - len(misses)}
+
+
+def _map_batch_files(items, jobs):
+    """Run _batch_check_file over items, in item order.
+
+    Fans out over a process pool when there is more than one worker and
+    more than one file; Executor.map keeps results in submission order,
+    so the report is identical to a serial run. Falls back to serial when
+    the platform cannot start worker processes.
+    """
+    jobs = parse_jobs(jobs)
+    if jobs > 1 and len(items) > 1:
+        workers = min(jobs, len(items))
+        chunksize = max(1, len(items) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_batch_check_file, items, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass
+    return [_batch_check_file(item) for item in items]
+
+
+def run_batch(project_root, manifest=None, jobs=None, use_cache=True):
+    """Run Pass 0.5 and Pass 1 for every feature in the manifest.
+
+    Each test file is read (and, for Python, parsed) once, then checked
+    for every feature that proves rules in it. Files are spread over
+    `jobs` worker processes (default: one per CPU); results come back in
+    sorted test-file order regardless of which worker finished first.
+    Pass 1 results are reused from .purlin/cache/pass1_cache.d/ for
+    unchanged files unless `use_cache` is False. `manifest` defaults to
+    build_batch_manifest(project_root). Returns one report dict:
+    {'features': {name: {spec_path, coverage, proof_file_findings, proofs}},
+     'errors': [...], 'files_checked': N, 'cache_hits': N}.
+    """
+    if manifest is None:
+        manifest = build_batch_manifest(project_root)
+
+    def _abs(path):
+        return path if os.path.isabs(path) else os.path.join(project_root, path)
+
+    features = {}
+    rule_descs = {}
+    file_features = {}
+    for item in manifest:
+        feature = item['feature']
+        spec_path = item.get('spec_path')
+        spec_abs = _abs(spec_path) if spec_path else None
+        findings = []
+        for proof_file in item.get('proof_files', []):
+            for finding in check_proof_file(_abs(proof_file), spec_path=spec_abs):
+                finding['proof_file'] = proof_file
+                findings.append(finding)
+        features[feature] = {
+            'spec_path': spec_path,
+            'coverage': check_spec_coverage(spec_abs),
+            'proof_file_findings': findings,
+            'proofs': [],
+        }
+        rule_descs[feature] = _read_rule_descriptions(spec_abs)
+        for test_file in item.get('test_files', []):
+            file_features.setdefault(test_file, [])
+            if feature not in file_features[test_file]:
+                file_features[test_file].append(feature)
+
+    rules_hashes = {feature: _rules_hash(descs) for feature, descs in rule_descs.items()}
+    items = [(test_file, _abs(test_file),
+              [(feature, rule_descs[feature], rules_hashes[feature])
+               for feature in file_features[test_file]],
+              _pass1_cache_path(project_root, test_file) if use_cache else None)
+             for test_file in sorted(file_features)]
+    errors = []
+    files_checked = 0
+    cache_hits = 0
+    for test_file, outcome in zip((item[0] for item in items), _map_batch_files(items, jobs)):
+        if 'error' in outcome:
+            errors.append({'test_file': test_file, 'error': outcome['error']})
+            continue
+        files_checked += 1
+        cache_hits += outcome['cache_hits']
+        for feature, results in outcome['results']:
+            for result in results:
+                result['test_file'] = test_file
+                features[feature]['proofs'].append(result)
+
+    return {'features': features, 'errors': errors,
+            'files_checked': files_checked, 'cache_hits': cache_hits}
+
+
 # ---------------------------------------------------------------------------
 # Audit cache helpers
 # ---------------------------------------------------------------------------
@@ -753,94 +994,161 @@ def compute_proof_hash(spec_rule_text, proof_description, test_code):
     return hashlib.sha256(payload.encode()).hexdigest()[:16]
 
 
-def read_audit_cache(project_root):
-    """Read .purlin/cache/audit_cache.json. Returns dict of proof_hash → assessment."""
-    cache_path = os.path.join(project_root, '.purlin', 'cache', 'audit_cache.json')
-    if os.path.isfile(cache_path):
+# The cache is one JSON shard per feature under audit_cache.d/, so writers
+# for different features never contend and a single feature is one file
+# read. audit_cache.json, the pre-shard single-file cache, is still read as a
+# base layer: its entries hold until a shard supersedes their
+# (feature, proof_id), and clear/prune empty it.
+_AUDIT_CACHE_FILE = 'audit_cache.json'
+_AUDIT_SHARD_DIR = 'audit_cache.d'
+
+
+def _audit_cache_dir(project_root):
+    return os.path.join(project_root, '.purlin', 'cache')
+
+
+def _audit_shard_path(project_root, feature):
+    """Return the shard file holding one feature's cache entries."""
+    name = re.sub(r'[^A-Za-z0-9_-]', '_', feature) or '_'
+    return os.path.join(_audit_cache_dir(project_root), _AUDIT_SHARD_DIR, name + '.json')
+
+
+def _read_cache_file(path):
+    """Read one cache JSON file. Returns {} when missing, corrupt or not a dict."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache_file(path, data):
+    """Write one cache JSON file atomically (unique tmp + os.replace).
+
+    The temp file is unique per writer, so concurrent writers of the same
+    path never truncate each other's half-written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
         try:
-            with open(cache_path) as f:
-                data = json.load(f)
-            if not isinstance(data, dict):
-                return {}
-            return data
-        except (json.JSONDecodeError, OSError):
-            return {}
-    return {}
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _audit_shard_paths(project_root):
+    shard_dir = os.path.join(_audit_cache_dir(project_root), _AUDIT_SHARD_DIR)
+    try:
+        names = sorted(os.listdir(shard_dir))
+    except OSError:
+        return []
+    return [os.path.join(shard_dir, n) for n in names if n.endswith('.json')]
+
+
+def _dedup_key(entry):
+    return (entry.get('feature', ''), entry.get('proof_id', ''))
+
+
+def read_audit_cache(project_root, feature=None):
+    """Read the audit cache. Returns dict of proof_hash → assessment.
+
+    Merges the per-feature shards over the legacy audit_cache.json: a base
+    entry is dropped once a shard holds an entry for its (feature, proof_id).
+    With `feature`, only that feature's entries are returned, reading its
+    shard and the base file alone.
+    """
+    base = _read_cache_file(os.path.join(_audit_cache_dir(project_root), _AUDIT_CACHE_FILE))
+    if feature is not None:
+        shards = [_read_cache_file(_audit_shard_path(project_root, feature))]
+        base = {k: v for k, v in base.items()
+                if isinstance(v, dict) and v.get('feature', '') == feature}
+    else:
+        shards = [_read_cache_file(path) for path in _audit_shard_paths(project_root)]
+
+    merged = {}
+    superseded = set()
+    for shard in shards:
+        for hash_key, entry in shard.items():
+            merged[hash_key] = entry
+            if isinstance(entry, dict):
+                superseded.add(_dedup_key(entry))
+    for hash_key, entry in base.items():
+        if hash_key in merged:
+            continue
+        if isinstance(entry, dict) and _dedup_key(entry) in superseded:
+            continue
+        merged[hash_key] = entry
+    if feature is not None:
+        merged = {k: v for k, v in merged.items()
+                  if isinstance(v, dict) and v.get('feature', '') == feature}
+    return merged
 
 
 def write_audit_cache(project_root, cache):
-    """Merge new entries into audit cache atomically, pruning stale duplicates.
+    """Upsert entries into the per-feature audit cache shards.
 
-    Reads the existing cache from disk first, merges the new entries on top,
-    then deduplicates by (feature, proof_id) keeping the latest cached_at.
-    This ensures concurrent or sequential writers for different features
-    don't overwrite each other's data.
+    Entries are grouped by feature and each group is merged into that
+    feature's shard: new entries replace the shard's entry for the same
+    (feature, proof_id), and duplicates within the batch keep the latest
+    cached_at. Shards of other features are not read or written, so
+    concurrent writers for different features proceed in parallel.
 
-    Stamps every entry with the real current UTC time so the dashboard shows
-    accurate "last audit" regardless of what the caller passed.
+    Stamps every entry of a written shard with the real current UTC time so
+    the dashboard shows accurate "last audit" regardless of what the caller
+    passed.
 
-    The entire read→merge→write sequence is protected by an exclusive file lock
-    (audit_cache.json.lock) so that concurrent subagent writers serialize
-    correctly and no writer's entries are clobbered by a racing write.
+    Each shard's read→merge→write sequence is protected by an exclusive
+    file lock (<shard>.json.lock) so that concurrent subagent writers for
+    the same feature serialize correctly and no entries are clobbered.
     """
-    cache_dir = os.path.join(project_root, '.purlin', 'cache')
-    os.makedirs(cache_dir, exist_ok=True)
-    cache_path = os.path.join(cache_dir, 'audit_cache.json')
-    lock_path = cache_path + '.lock'
+    by_feature = {}
+    for hash_key, entry in cache.items():
+        if not isinstance(entry, dict):
+            continue
+        by_feature.setdefault(entry.get('feature', ''), {})[hash_key] = entry
+    if not by_feature:
+        return
 
-    with open(lock_path, 'w') as lock_file:
-        fcntl.flock(lock_file, fcntl.LOCK_EX)
-        try:
-            now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-
-            # Read existing cache from disk
-            on_disk = read_audit_cache(project_root)
-
-            # Dedup in two phases: on-disk first, then new entries override.
-            # This ensures new entries always win over on-disk for same (feature, proof_id),
-            # while intra-batch dedup within each source uses timestamps.
-            latest = {}  # (feature, proof_id) -> (hash_key, entry)
-
-            # Phase 1: seed with on-disk entries
-            for hash_key, entry in on_disk.items():
-                if not isinstance(entry, dict):
-                    continue
-                dedup_key = (entry.get('feature', ''), entry.get('proof_id', ''))
-                existing_entry = latest.get(dedup_key)
-                if existing_entry is None or entry.get('cached_at', '') > existing_entry[1].get('cached_at', ''):
-                    latest[dedup_key] = (hash_key, entry)
-
-            # Phase 2: new entries always override on-disk for same (feature, proof_id);
-            # intra-batch duplicates use timestamp
-            new_keys = set()
-            for hash_key, entry in cache.items():
-                if not isinstance(entry, dict):
-                    continue
-                dedup_key = (entry.get('feature', ''), entry.get('proof_id', ''))
-                existing_entry = latest.get(dedup_key)
-                if existing_entry is None:
-                    latest[dedup_key] = (hash_key, entry)
-                    new_keys.add(dedup_key)
-                elif dedup_key not in new_keys:
-                    # First new entry for this (feature, proof_id) — always beats on-disk
-                    latest[dedup_key] = (hash_key, entry)
-                    new_keys.add(dedup_key)
-                elif entry.get('cached_at', '') > existing_entry[1].get('cached_at', ''):
-                    # Intra-batch duplicate — use timestamp
-                    latest[dedup_key] = (hash_key, entry)
-
-            # Stamp real write time so dashboard shows accurate "last audit"
-            pruned = {}
-            for hk, ent in latest.values():
-                ent['cached_at'] = now_iso
-                pruned[hk] = ent
-
-            tmp_path = cache_path + '.tmp'
-            with open(tmp_path, 'w') as f:
-                json.dump(pruned, f, indent=2)
-            os.replace(tmp_path, cache_path)
-        finally:
-            fcntl.flock(lock_file, fcntl.LOCK_UN)
+    os.makedirs(os.path.join(_audit_cache_dir(project_root), _AUDIT_SHARD_DIR), exist_ok=True)
+    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+    for feature, entries in sorted(by_feature.items()):
+        shard_path = _audit_shard_path(project_root, feature)
+        with open(shard_path + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                latest = {}  # (feature, proof_id) -> (hash_key, entry)
+                for hash_key, entry in _read_cache_file(shard_path).items():
+                    if isinstance(entry, dict):
+                        latest[_dedup_key(entry)] = (hash_key, entry)
+
+                # New entries always override the shard for the same
+                # (feature, proof_id); intra-batch duplicates use timestamps
+                new_keys = set()
+                for hash_key, entry in entries.items():
+                    dedup_key = _dedup_key(entry)
+                    existing_entry = latest.get(dedup_key)
+                    if dedup_key not in new_keys:
+                        latest[dedup_key] = (hash_key, entry)
+                        new_keys.add(dedup_key)
+                    elif entry.get('cached_at', '') > existing_entry[1].get('cached_at', ''):
+                        latest[dedup_key] = (hash_key, entry)
+
+                # Stamp real write time so dashboard shows accurate "last audit"
+                shard = {}
+                for hk, ent in latest.values():
+                    ent['cached_at'] = now_iso
+                    shard[hk] = ent
+                _write_cache_file(shard_path, shard)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 def _find_plugin_root():
@@ -901,14 +1209,17 @@ def load_criteria(project_root, extra_path=None):
 
 
 def clear_audit_cache(project_root):
-    """Atomically replace the audit cache with an empty dict."""
-    cache_dir = os.path.join(project_root, '.purlin', 'cache')
+    """Empty the audit cache: remove every shard and atomically replace
+    audit_cache.json with an empty dict."""
+    cache_dir = _audit_cache_dir(project_root)
     os.makedirs(cache_dir, exist_ok=True)
-    cache_path = os.path.join(cache_dir, 'audit_cache.json')
-    tmp_path = cache_path + '.tmp'
-    with open(tmp_path, 'w') as f:
-        json.dump({}, f)
-    os.replace(tmp_path, cache_path)
+    for shard_path in _audit_shard_paths(project_root):
+        try:
+            os.unlink(shard_path)
+        except OSError:
+            pass
+    cache_path = os.path.join(cache_dir, _AUDIT_CACHE_FILE)
+    _write_cache_file(cache_path, {})
     return cache_path
 
 
@@ -918,22 +1229,37 @@ def prune_audit_cache(project_root, live_keys):
     Called after a full audit to sweep orphaned entries from deleted or
     renamed features.  Entries whose key IS in live_keys are preserved
     with all fields intact.  An empty live_keys set produces an empty
-    cache (full sweep).
+    cache (full sweep).  Each shard is filtered under its own lock and
+    removed once empty.
     """
-    cache = read_audit_cache(project_root)
-    pruned = {k: v for k, v in cache.items() if k in live_keys}
-    removed = len(cache) - len(pruned)
-
-    # Write atomically
-    cache_dir = os.path.join(project_root, '.purlin', 'cache')
-    os.makedirs(cache_dir, exist_ok=True)
-    cache_path = os.path.join(cache_dir, 'audit_cache.json')
-    tmp_path = cache_path + '.tmp'
-    with open(tmp_path, 'w') as f:
-        json.dump(pruned, f, indent=2)
-    os.replace(tmp_path, cache_path)
-
-    return {'pruned': removed, 'kept': len(pruned)}
+    removed = 0
+    kept = 0
+    for shard_path in _audit_shard_paths(project_root):
+        with open(shard_path + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                shard = _read_cache_file(shard_path)
+                pruned = {k: v for k, v in shard.items() if k in live_keys}
+                if len(pruned) != len(shard):
+                    if pruned:
+                        _write_cache_file(shard_path, pruned)
+                    else:
+                        os.unlink(shard_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        removed += len(shard) - len(pruned)
+        kept += len(pruned)
+
+    base_path = os.path.join(_audit_cache_dir(project_root), _AUDIT_CACHE_FILE)
+    if os.path.isfile(base_path):
+        base = _read_cache_file(base_path)
+        pruned = {k: v for k, v in base.items() if k in live_keys}
+        if len(pruned) != len(base):
+            _write_cache_file(base_path, pruned)
+        removed += len(base) - len(pruned)
+        kept += len(pruned)
+
+    return {'pruned': removed, 'kept': kept}
 
 
 # ---------------------------------------------------------------------------
@@ -983,7 +1309,12 @@ def main():
             idx = sys.argv.index('--project-root')
             if idx + 1 < len(sys.argv):
                 project_root = sys.argv[idx + 1]
-        cache = read_audit_cache(project_root)
+        feature = None
+        if '--feature' in sys.argv:
+            idx = sys.argv.index('--feature')
+            if idx + 1 < len(sys.argv):
+                feature = sys.argv[idx + 1]
+        cache = read_audit_cache(project_root, feature=feature)
         print(json.dumps(cache, indent=2))
         sys.exit(0)
 
@@ -1064,12 +1395,39 @@ def main():
         print(json.dumps(result, indent=2))
         sys.exit(0)
 
+    # --batch mode: Pass 0.5 + Pass 1 for the whole project in one process
+    if '--batch' in sys.argv:
+        project_root = os.getcwd()
+        if '--project-root' in sys.argv:
+            idx = sys.argv.index('--project-root')
+            if idx + 1 < len(sys.argv):
+                project_root = sys.argv[idx + 1]
+        manifest = None
+        if '--manifest' in sys.argv:
+            idx = sys.argv.index('--manifest')
+            manifest_path = sys.argv[idx + 1] if idx + 1 < len(sys.argv) else None
+            if not manifest_path or not os.path.isfile(manifest_path):
+                print(json.dumps({'error': '--manifest requires a path to a JSON manifest'}))
+                sys.exit(2)
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        jobs = None
+        if '--jobs' in sys.argv:
+            idx = sys.argv.index('--jobs')
+            if idx + 1 < len(sys.argv):
+                jobs = sys.argv[idx + 1]
+        use_cache = '--no-cache' not in sys.argv
+        print(json.dumps(run_batch(project_root, manifest, jobs=jobs, use_cache=use_cache),
+                         indent=2))
+        sys.exit(0)
+
     if len(sys.argv) < 3:
         print(f"Usage: {sys.argv[0]} <test_file> <feature_name> [--spec-path <path>]", file=sys.stderr)
         print(f"       {sys.argv[0]} --check-proof-file --proof-path <path> [--spec-path <path>]", file=sys.stderr)
         print(f"       {sys.argv[0]} --check-spec-coverage --spec-path <path>", file=sys.stderr)
+        print(f"       {sys.argv[0]} --batch [--project-root <path>] [--manifest <path>] [--jobs N|auto] [--no-cache]", file=sys.stderr)
         print(f"       {sys.argv[0]} --compute-proof-hash --rule <text> --proof-desc <text> --test-code <text>", file=sys.stderr)
-        print(f"       {sys.argv[0]} --read-cache [--project-root <path>]", file=sys.stderr)
+        print(f"       {sys.argv[0]} --read-cache [--project-root <path>] [--feature <name>]", file=sys.stderr)
         sys.exit(2)
 
     test_file = sys.argv[1]
@@ -46,10 +46,14 @@ if [[ "$MODE" == "auto" ]]; then
   echo "purlin: generating project digest (coverage + drift)..."
   echo "purlin: NOTE — does NOT trigger audit (cached data only)"
 
-  RESULT=$(python3 -c "
+  # The staged paths let the digest patch only what this commit touches.
+  # call_tool asks the project's Purlin daemon when one is running, else
+  # generates the digest in-process.
+  RESULT=$(git diff --cached --name-only -z | python3 -c "
 import sys; sys.path.insert(0, '$SERVER_DIR')
-from purlin_server import generate_digest
-path = generate_digest('$ROOT')
+from purlin_daemon import call_tool
+staged = [p for p in sys.stdin.read().split(chr(0)) if p]
+path = call_tool('$ROOT', 'generate_digest', {'staged': staged})
 print(path or '')
 " 2>/dev/null) || { echo "purlin: digest generation failed, continuing"; exit 0; }
 
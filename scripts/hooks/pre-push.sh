@@ -5,6 +5,17 @@
 #   "warn"   — block on FAILING, allow VERIFIED+PARTIAL (default)
 #   "strict" — block on anything not VERIFIED (requires verification receipt)
 #   "off"    — disable hook
+#
+# Unit-tier tests (set in .purlin/config.json → "pre_push_tests"):
+#   "selective" — run only the tests of features the pushed commits touch,
+#                 mapped through spec > Scope:; falls back to the full
+#                 unit tier when a change cannot be mapped (default)
+#   "full"      — always run the full unit tier
+#
+# Parallel runs (set in .purlin/config.json → "pre_push_jobs"):
+#   1 runs tests serially (default); N or "auto" (one per CPU) runs pytest
+#   and shell tests in parallel shards and merges their proofs.
+#   "pre_push_time_budget" (seconds) stops shards that run past it.
 set -euo pipefail
 
 # --- Locate project root ---
@@ -13,25 +24,31 @@ if [[ ! -d "$ROOT/.purlin" ]]; then
   exit 0  # Not a Purlin project
 fi
 
-# --- Read mode from config ---
+# --- Read mode, test framework and test scope from config (one interpreter start) ---
 MODE="warn"
+FRAMEWORK="auto"
+TEST_MODE="selective"
+JOBS="1"
+BUDGET="0"
 if [[ -f "$ROOT/.purlin/config.json" ]]; then
-  MODE=$(python3 -c "import json,sys; print(json.load(open(sys.argv[1])).get('pre_push','warn'))" "$ROOT/.purlin/config.json" 2>/dev/null || echo "warn")
+  read -r MODE FRAMEWORK TEST_MODE JOBS BUDGET < <(python3 -c "import json,sys; c=json.load(open(sys.argv[1])); print(c.get('pre_push','warn'), c.get('test_framework','auto'), c.get('pre_push_tests','selective'), c.get('pre_push_jobs',1), c.get('pre_push_time_budget',0))" "$ROOT/.purlin/config.json" 2>/dev/null || echo "warn auto selective 1 0")
 fi
 if [[ "$MODE" == "off" ]]; then
   exit 0
 fi
 
+# --- Read the pushed refs (git writes one line per ref to stdin) ---
+PUSH_REFS=""
+if [[ ! -t 0 ]]; then
+  PUSH_REFS="$(cat)"
+fi
+
 SPEC_DIR="$ROOT/specs"
 if [[ ! -d "$SPEC_DIR" ]] || [[ -z "$(find "$SPEC_DIR" -maxdepth 2 -name '*.md' 2>/dev/null | head -1)" ]]; then
   exit 0  # No specs yet
 fi
 
 # --- Run unit-tier tests ---
-FRAMEWORK="auto"
-if [[ -f "$ROOT/.purlin/config.json" ]]; then
-  FRAMEWORK=$(python3 -c "import json,sys; print(json.load(open(sys.argv[1])).get('test_framework','auto'))" "$ROOT/.purlin/config.json" 2>/dev/null || echo "auto")
-fi
 if [[ "$FRAMEWORK" == "auto" ]]; then
   if [[ -f "$ROOT/conftest.py" ]] || grep -q '\[tool\.pytest\]' "$ROOT/pyproject.toml" 2>/dev/null; then
     FRAMEWORK="pytest"
@@ -42,73 +59,142 @@ if [[ "$FRAMEWORK" == "auto" ]]; then
   fi
 fi
 
-echo "purlin: running unit-tier tests ($FRAMEWORK)..."
-case "$FRAMEWORK" in
-  pytest) (cd "$ROOT" && python3 -m pytest -m "not integration" -q 2>&1) || true ;;
-  jest)   (cd "$ROOT" && npx jest --testPathPattern=unit 2>&1) || true ;;
-  shell)  for t in "$ROOT"/*.test.sh; do [[ -f "$t" ]] && bash "$t" 2>&1; done || true ;;
-esac
-
-# --- Check sync_status ---
+# --- Locate the Purlin server ---
 SERVER="$ROOT/scripts/mcp/purlin_server.py"
 if [[ ! -f "$SERVER" ]]; then
   if [[ -n "${CLAUDE_PLUGIN_ROOT:-}" && -f "$CLAUDE_PLUGIN_ROOT/scripts/mcp/purlin_server.py" ]]; then
     SERVER="$CLAUDE_PLUGIN_ROOT/scripts/mcp/purlin_server.py"
   else
-    echo "purlin: sync_status not available, skipping coverage check"
-    exit 0
+    SERVER=""
   fi
 fi
+SERVER_DIR=""
+[[ -n "$SERVER" ]] && SERVER_DIR="$(dirname "$SERVER")"
 
-SERVER_DIR="$(dirname "$SERVER")"
-STATUS=$(python3 -c "
-import sys; sys.path.insert(0, '$SERVER_DIR')
-from purlin_server import sync_status
-print(sync_status('$ROOT'))
-" 2>/dev/null) || { echo "purlin: could not run sync_status, allowing push"; exit 0; }
-
-# --- Parse summary table ---
-# The summary table uses │-delimited rows: │ name │ N/M │ STATUS │
-# Parsing the table avoids false positives from rule descriptions that
-# contain status keywords (e.g. "RULE-8: FAIL status badge...").
+# --- Select tests for the pushed changes ---
+# select_tests maps the files the pushed commits change to features through
+# spec > Scope: and lists the test files their unit-tier proofs name. The
+# first output line is "<mode>\t<reason>" (mode: selected, none or full),
+# then one test file per line. Any failure runs the full unit tier.
+TEST_SCOPE="full"
+SCOPE_REASON=""
+SELECTED=()
+if [[ "$TEST_MODE" != "full" && -n "$SERVER_DIR" && -n "$PUSH_REFS" ]]; then
+  SELECTION=$(python3 - "$SERVER_DIR" "$ROOT" "$PUSH_REFS" <<'PY' 2>/dev/null
+import sys
+sys.path.insert(0, sys.argv[1])
+from purlin_daemon import call_tool
+result = call_tool(sys.argv[2], 'select_tests', {'push_refs': sys.argv[3].splitlines()})
+print(f"{result['mode']}\t{result['reason']}")
+for path in result['test_files']:
+    print(path)
+PY
+  ) || SELECTION=""
+  if [[ -n "$SELECTION" ]]; then
+    IFS=$'\t' read -r TEST_SCOPE SCOPE_REASON <<< "$(head -n 1 <<< "$SELECTION")"
+    while IFS= read -r T; do
+      case "$FRAMEWORK:$T" in
+        pytest:*.py|jest:*.js|jest:*.jsx|jest:*.ts|jest:*.tsx|shell:*.sh) SELECTED+=("$T") ;;
+      esac
+    done < <(tail -n +2 <<< "$SELECTION")
+    if [[ "$TEST_SCOPE" == "selected" && ${#SELECTED[@]} -eq 0 ]]; then
+      TEST_SCOPE="none"
+    fi
+  fi
+fi
+
+# --- Run unit-tier tests ---
+# In parallel mode shard_runner.py runs pytest or shell tests in shards and
+# merges each shard's proof files before sync_status reads them.
+RUNNER=""
+if [[ "$JOBS" != "1" && ( "$FRAMEWORK" == "pytest" || "$FRAMEWORK" == "shell" ) && -n "$SERVER_DIR" ]]; then
+  RUNNER="$(dirname "$SERVER_DIR")/hooks/shard_runner.py"
+  [[ -f "$RUNNER" ]] || RUNNER=""
+fi
+
+case "$TEST_SCOPE" in
+  none)
+    echo "purlin: no unit-tier tests cover the pushed changes ($SCOPE_REASON)"
+    ;;
+  selected)
+    echo "purlin: running ${#SELECTED[@]} unit-tier test file(s) for the pushed changes ($FRAMEWORK; $SCOPE_REASON)..."
+    if [[ -n "$RUNNER" ]]; then
+      (cd "$ROOT" && python3 "$RUNNER" --framework "$FRAMEWORK" --jobs "$JOBS" --budget "$BUDGET" "${SELECTED[@]}" 2>&1) || true
+    else
+      case "$FRAMEWORK" in
+        pytest) (cd "$ROOT" && python3 -m pytest -m "not integration" -q "${SELECTED[@]}" 2>&1) || true ;;
+        jest)   (cd "$ROOT" && npx jest --runTestsByPath "${SELECTED[@]}" 2>&1) || true ;;
+        shell)  for t in "${SELECTED[@]}"; do bash "$ROOT/$t" 2>&1; done || true ;;
+      esac
+    fi
+    ;;
+  *)
+    if [[ -n "$SCOPE_REASON" ]]; then
+      echo "purlin: running unit-tier tests ($FRAMEWORK; $SCOPE_REASON)..."
+    else
+      echo "purlin: running unit-tier tests ($FRAMEWORK)..."
+    fi
+    if [[ -n "$RUNNER" ]]; then
+      (cd "$ROOT" && python3 "$RUNNER" --framework "$FRAMEWORK" --jobs "$JOBS" --budget "$BUDGET" 2>&1) || true
+    else
+      case "$FRAMEWORK" in
+        pytest) (cd "$ROOT" && python3 -m pytest -m "not integration" -q 2>&1) || true ;;
+        jest)   (cd "$ROOT" && npx jest --testPathPattern=unit 2>&1) || true ;;
+        shell)  for t in "$ROOT"/*.test.sh; do [[ -f "$t" ]] && bash "$t" 2>&1; done || true ;;
+      esac
+    fi
+    ;;
+esac
+
+# --- Check sync_status ---
+if [[ -z "$SERVER_DIR" ]]; then
+  echo "purlin: sync_status not available, skipping coverage check"
+  exit 0
+fi
+
+# One Python process reads sync_status's JSON result and emits one
+# tab-separated row per summary-table entry: STATUS, feature, proved/total.
+# Reading structured status (not the text report) avoids false positives
+# from rule descriptions that contain status keywords. call_tool asks the
+# project's Purlin daemon when one is running, else runs in-process.
+ROWS=$(python3 - "$SERVER_DIR" "$ROOT" <<'PY' 2>/dev/null
+import json, sys
+sys.path.insert(0, sys.argv[1])
+from purlin_daemon import call_tool
+for f in json.loads(call_tool(sys.argv[2], 'sync_status', {'format': 'json'}))['features']:
+    print(f"{f['status']}\t{f['name']}\t{f['proved']}/{f['total']}")
+PY
+) || { echo "purlin: could not run sync_status, allowing push"; exit 0; }
+
+# --- Classify features ---
 FAILS=""
 FAIL_FEATURES=""
 PASSES=""
 NON_READY=""
-while IFS= read -r line; do
-  # Match summary table rows: │ feature_name │ N/M │ STATUS │
-  if [[ "$line" == *"│"* ]]; then
-    # Extract fields by splitting on │
-    FEAT=$(echo "$line" | awk -F'│' '{gsub(/^[ \t]+|[ \t]+$/, "", $2); print $2}')
-    STAT=$(echo "$line" | awk -F'│' '{gsub(/^[ \t]+|[ \t]+$/, "", $4); print $4}')
-    COVERAGE=$(echo "$line" | awk -F'│' '{gsub(/^[ \t]+|[ \t]+$/, "", $3); print $3}')
-    # Skip header/border rows
-    [[ -z "$FEAT" || "$FEAT" == "Feature" || "$FEAT" == *"─"* ]] && continue
-    # Strip "(anchor)" suffix for feature name
-    FEAT_NAME=$(echo "$FEAT" | sed 's/ *(anchor)$//')
-    case "$STAT" in
-      FAILING)
-        FAILS="${FAILS}  ${FEAT_NAME} (${COVERAGE})\n"
-        if [[ "$FAIL_FEATURES" != *"$FEAT_NAME"* ]]; then
-          FAIL_FEATURES="${FAIL_FEATURES} ${FEAT_NAME}"
-        fi
-        ;;
-      VERIFIED)
-        PASSES="${PASSES}  ${FEAT_NAME}\n"
-        ;;
-      PASSING)
-        PASSES="${PASSES}  ${FEAT_NAME}\n"
-        ;;
-      PARTIAL)
-        PASSES="${PASSES}  ${FEAT_NAME}\n"
-        NON_READY="${NON_READY}  ${FEAT_NAME} (${COVERAGE}, needs purlin:verify)\n"
-        ;;
-      UNTESTED)
-        NON_READY="${NON_READY}  ${FEAT_NAME} (${COVERAGE}, untested)\n"
-        ;;
-    esac
-  fi
-done <<< "$STATUS"
+while IFS=$'\t' read -r STAT FEAT_NAME COVERAGE; do
+  [[ -z "$FEAT_NAME" ]] && continue
+  case "$STAT" in
+    FAILING)
+      FAILS="${FAILS}  ${FEAT_NAME} (${COVERAGE})\n"
+      if [[ " $FAIL_FEATURES " != *" $FEAT_NAME "* ]]; then
+        FAIL_FEATURES="${FAIL_FEATURES} ${FEAT_NAME}"
+      fi
+      ;;
+    VERIFIED)
+      PASSES="${PASSES}  ${FEAT_NAME}\n"
+      ;;
+    PASSING)
+      PASSES="${PASSES}  ${FEAT_NAME}\n"
+      ;;
+    PARTIAL)
+      PASSES="${PASSES}  ${FEAT_NAME}\n"
+      NON_READY="${NON_READY}  ${FEAT_NAME} (${COVERAGE}, needs purlin:verify)\n"
+      ;;
+    UNTESTED)
+      NON_READY="${NON_READY}  ${FEAT_NAME} (${COVERAGE}, untested)\n"
+      ;;
+  esac
+done <<< "$ROWS"
 
 # --- Report and decide ---
 if [[ -n "$PASSES" ]]; then
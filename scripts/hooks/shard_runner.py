@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Purlin shard runner — run a test tier in parallel and merge the proofs.
+
+Splits the tests into shards, runs up to `--jobs` shards at once, and merges
+the per-shard proof files into the spec directories with the usual
+feature-scoped overwrite, so the proof files match a single serial run.
+
+  pytest — test files are grouped into at most `jobs` shards balanced by
+           file size; each shard is one `pytest -m "not integration"` run
+  shell  — each test script is its own shard
+
+Every shard gets its own PURLIN_PROOF_SHARD_DIR. The pytest and shell proof
+plugins write there instead of the spec directories, so concurrent shards
+never race on a proof file. With `--budget`, shards still running at the
+deadline are killed and unstarted ones are skipped; earlier proof entries
+from their test files are kept. A summary naming the slowest shards is
+printed at the end.
+
+Usage (from the project root):
+    python3 scripts/hooks/shard_runner.py --framework pytest|shell
+        [--jobs N|auto] [--budget SECONDS] [test_file ...]
+
+Uses Python stdlib only.
+"""
+
+import glob
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mcp'))
+
+from config_engine import parse_jobs
+
+FRAMEWORKS = ('pytest', 'shell')
+
+_SLOWEST = 3
+
+
+def _pytest_files():
+    """Test files pytest collects for the unit tier, in collection order."""
+    result = subprocess.run(
+        [sys.executable, '-m', 'pytest', '--collect-only', '-q',
+         '-m', 'not integration', '-p', 'no:cacheprovider'],
+        capture_output=True, text=True,
+    )
+    files = {}
+    for line in result.stdout.splitlines():
+        if '::' in line:
+            files[line.split('::', 1)[0]] = None
+    return list(files)
+
+
+def _discover(framework):
+    if framework == 'pytest':
+        return _pytest_files()
+    return sorted(glob.glob('*.test.sh'))
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path) + 1
+    except OSError:
+        return 1
+
+
+def make_shards(framework, files, jobs):
+    """Group test files into shards (lists of files).
+
+    Shell scripts run one per shard. pytest files go largest-first into the
+    least loaded of `jobs` shards, using file size as the cost estimate.
+    """
+    if framework == 'shell':
+        return [[path] for path in files]
+    count = min(jobs, len(files))
+    shards = [[] for _ in range(count)]
+    loads = [0] * count
+    for path in sorted(files, key=_size, reverse=True):
+        i = loads.index(min(loads))
+        shards[i].append(path)
+        loads[i] += _size(path)
+    return [shard for shard in shards if shard]
+
+
+def _command(framework, shard):
+    if framework == 'pytest':
+        # No cache plugin: concurrent shards would race on .pytest_cache.
+        return [sys.executable, '-m', 'pytest', '-m', 'not integration', '-q',
+                '-p', 'no:cacheprovider', *shard]
+    return ['bash', shard[0]]
+
+
+def _kill(proc):
+    """Kill a shard and everything it started (it leads its own session)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _run_shard(framework, shard, shard_dir, deadline, procs):
+    """Run one shard. Returns its result dict (files, status, seconds, output)."""
+    start = time.monotonic()
+    result = {'files': shard, 'status': 'skipped', 'seconds': 0.0, 'output': ''}
+    if deadline is not None and start >= deadline:
+        return result
+    os.makedirs(shard_dir, exist_ok=True)
+    env = dict(os.environ, PURLIN_PROOF_SHARD_DIR=shard_dir)
+    proc = subprocess.Popen(
+        _command(framework, shard), env=env, text=True,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, start_new_session=True,
+    )
+    procs.append(proc)
+    try:
+        output, _ = proc.communicate(
+            timeout=None if deadline is None else max(deadline - start, 0.001))
+    except subprocess.TimeoutExpired:
+        _kill(proc)
+        output, _ = proc.communicate()
+        result['status'] = 'timeout'
+    else:
+        # pytest exits 5 when every test in the shard is deselected.
+        ok = proc.returncode == 0 or (framework == 'pytest' and proc.returncode == 5)
+        result['status'] = 'passed' if ok else 'failed'
+    result.update(output=output or '', seconds=time.monotonic() - start)
+    return result
+
+
+def _norm(path):
+    return os.path.normpath(os.path.relpath(os.path.abspath(path)))
+
+
+def merge_shard_proofs(shard_dirs, keep_files=()):
+    """Merge per-shard proof files into the spec directories.
+
+    Entries are grouped by (feature, tier) across all shards and written
+    with the feature-scoped overwrite, as one serial run would write them.
+    Existing entries whose test_file is in keep_files (tests that did not
+    finish) are carried over. Returns the number of proof files written.
+    """
+    grouped = {}
+    for shard_dir in shard_dirs:
+        for path in sorted(glob.glob(os.path.join(shard_dir, '*.proofs-*.json'))):
+            with open(path) as f:
+                data = json.load(f)
+            for entry in data.get('proofs', []):
+                key = (entry.get('feature'), entry.get('tier', data.get('tier', 'unit')))
+                grouped.setdefault(key, []).append(entry)
+    if not grouped:
+        return 0
+
+    # Build feature -> spec directory mapping
+    spec_dirs = {}
+    for spec in glob.glob('specs/**/*.md', recursive=True):
+        stem = os.path.splitext(os.path.basename(spec))[0]
+        spec_dirs[stem] = os.path.dirname(spec)
+
+    keep = {_norm(path) for path in keep_files}
+    for (feature, tier), new_entries in sorted(grouped.items()):
+        spec_dir = spec_dirs.get(feature)
+        if spec_dir is None:
+            print(f'WARNING: No spec found for feature "{feature}" — writing proofs to specs/{feature}.proofs-{tier}.json. Create a spec with: purlin:spec {feature}', file=sys.stderr)
+            spec_dir = 'specs'
+        path = os.path.join(spec_dir, f'{feature}.proofs-{tier}.json')
+        existing = []
+        if os.path.exists(path):
+            with open(path) as f:
+                existing = json.load(f).get('proofs', [])
+        kept = [e for e in existing
+                if e.get('feature') != feature or _norm(e.get('test_file', '')) in keep]
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'tier': tier, 'proofs': kept + new_entries}, f, indent=2)
+            f.write('\n')
+        os.replace(tmp_path, path)
+    return len(grouped)
+
+
+def run(framework, files, jobs, budget=0):
+    """Run `files` in shards and merge their proofs.
+
+    budget is a wall-clock limit in seconds (0 for none). Returns the
+    per-shard results in shard order.
+    """
+    shards = make_shards(framework, files, jobs)
+    deadline = time.monotonic() + budget if budget and budget > 0 else None
+    work_dir = tempfile.mkdtemp(prefix='purlin-shards-')
+    try:
+        shard_dirs = [os.path.join(work_dir, str(i)) for i in range(len(shards))]
+        procs = []
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            futures = [pool.submit(_run_shard, framework, shard, shard_dir, deadline, procs)
+                       for shard, shard_dir in zip(shards, shard_dirs)]
+            try:
+                results = [future.result() for future in futures]
+            except BaseException:
+                # Interrupted (e.g. Ctrl-C on git push): stop every shard.
+                for future in futures:
+                    future.cancel()
+                for proc in procs:
+                    _kill(proc)
+                raise
+        unfinished = [path for r in results if r['status'] in ('timeout', 'skipped')
+                      for path in r['files']]
+        merge_shard_proofs(shard_dirs, keep_files=unfinished)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def _label(result):
+    files = result['files']
+    return files[0] + (f' +{len(files) - 1} more' if len(files) > 1 else '')
+
+
+def report(results, elapsed, jobs, budget=0):
+    """Print shard output and a summary naming the slowest shards."""
+    for i, result in enumerate(results, 1):
+        if result['output']:
+            print(f"--- shard {i}/{len(results)}: {_label(result)} ({result['status']})")
+            print(result['output'].rstrip('\n'))
+    print(f"purlin: {len(results)} shard(s) on {jobs} worker(s) in {elapsed:.1f}s")
+    ran = [r for r in results if r['status'] != 'skipped']
+    slowest = sorted(ran, key=lambda r: r['seconds'], reverse=True)[:_SLOWEST]
+    if slowest:
+        print("purlin: slowest shards:")
+        for result in slowest:
+            print(f"  {result['seconds']:7.1f}s  {_label(result)} ({result['status']})")
+    unfinished = [r for r in results if r['status'] in ('timeout', 'skipped')]
+    if unfinished:
+        print(f"purlin: time budget of {budget:g}s exceeded — {len(unfinished)} shard(s) "
+              f"did not finish; their earlier proofs are kept:")
+        for result in unfinished:
+            print(f"  {_label(result)} ({result['status']})")
+
+
+def main():
+    args = sys.argv[1:]
+    options = {'--framework': None, '--jobs': 'auto', '--budget': '0'}
+    for name in options:
+        if name in args:
+            idx = args.index(name)
+            if idx + 1 >= len(args):
+                print(f"{name} needs a value", file=sys.stderr)
+                sys.exit(2)
+            options[name] = args[idx + 1]
+            del args[idx:idx + 2]
+    framework = options['--framework']
+    if framework not in FRAMEWORKS:
+        print("Usage: shard_runner.py --framework pytest|shell [--jobs N|auto] "
+              "[--budget SECONDS] [test_file ...]", file=sys.stderr)
+        sys.exit(2)
+    jobs = parse_jobs(options['--jobs'])
+    try:
+        budget = float(options['--budget'])
+    except ValueError:
+        budget = 0
+
+    files = args or _discover(framework)
+    if not files:
+        print("purlin: no tests to run")
+        return
+    start = time.monotonic()
+    results = run(framework, files, jobs, budget)
+    report(results, time.monotonic() - start, jobs, budget)
+    if any(r['status'] != 'passed' for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -122,6 +122,16 @@ def update_config(project_root, key, value):
             os.remove(tmp_path)
 
 
+def parse_jobs(value):
+    """Worker count from a `pre_push_jobs` or `--jobs` value: a positive int or "auto"."""
+    if value in (None, '', 'auto'):
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
 def main():
     project_root = find_project_root()
 
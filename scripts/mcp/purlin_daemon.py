@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""Optional Purlin daemon — a warm project model for hooks and the CLI.
+
+Keeps one purlin_server process (and its resident spec model and caches)
+alive per project and serves sync_status, drift, generate_digest and
+select_tests over a Unix domain socket. Each connection carries one
+request and one response, both a single JSON line:
+
+  request:  {"root": "<project root>", "tool": "sync_status", "arguments": {...}}
+  response: {"result": <tool result>}  or  {"error": "<message>"}
+
+Hooks and the CLI go through call_tool(), which asks a running daemon and
+otherwise runs the tool in-process. When `"daemon": true` is set in
+.purlin/config.json, a missed daemon is started in the background so the
+next call finds it warm. The daemon exits after `daemon_idle_timeout`
+seconds without a request (default 600) and as soon as its own source
+files change, so it never serves stale code.
+
+Usage:
+    python3 scripts/mcp/purlin_daemon.py serve [project_root]
+    python3 scripts/mcp/purlin_daemon.py stop [project_root]
+    python3 scripts/mcp/purlin_daemon.py status [project_root]
+    python3 scripts/mcp/purlin_daemon.py call <tool> [json arguments] [project_root]
+
+Uses Python stdlib only.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from config_engine import find_project_root, resolve_config
+
+TOOLS = ('sync_status', 'drift', 'generate_digest', 'select_tests')
+
+_DEFAULT_IDLE_TIMEOUT = 600
+_CONNECT_TIMEOUT = 1.0
+_REQUEST_TIMEOUT = 10.0   # daemon side: time allowed to read one request line
+_RESPONSE_TIMEOUT = 600.0  # client side: time allowed for the tool to run
+_MAX_LINE = 1 << 20
+
+_UNAVAILABLE = object()
+
+
+def _runtime_dir():
+    """Per-user directory holding the daemons' sockets and lock files.
+
+    A `purlin-<uid>` directory inside XDG_RUNTIME_DIR when set, otherwise
+    inside the system temp directory.
+    """
+    base = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(base, f'purlin-{os.getuid()}')
+
+
+def _private_dir(directory, create=False):
+    """True when directory is a real directory owned by this user with mode 0700.
+
+    With create=True a missing directory is created first. A symlink, a
+    directory owned by someone else or one others can write into is
+    refused: in a shared temp directory another user could otherwise plant
+    the socket or a symlinked lock file.
+    """
+    if create:
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+        except OSError:
+            return False
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return False
+    return (stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid()
+            and stat.S_IMODE(st.st_mode) & 0o077 == 0)
+
+
+def socket_path(project_root):
+    """Per-user, per-project socket path.
+
+    Keyed on the real project path so every worktree and symlinked checkout
+    gets its own daemon. Lives in the user's private runtime directory.
+    """
+    real = os.path.realpath(project_root)
+    digest = hashlib.sha1(real.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(_runtime_dir(), f'{digest}.sock')
+
+
+def _peer_is_owner(sock, path):
+    """True when the listener on sock runs as this user.
+
+    Uses SO_PEERCRED where the platform has it; elsewhere falls back to the
+    owner of the socket file, which sits in a directory only we can write.
+    """
+    if hasattr(socket, 'SO_PEERCRED'):
+        try:
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                    struct.calcsize('3i'))
+        except OSError:
+            return False
+        _, uid, _ = struct.unpack('3i', creds)
+        return uid == os.getuid()
+    try:
+        return os.lstat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _daemon_enabled(project_root):
+    try:
+        return resolve_config(project_root).get('daemon') is True
+    except Exception:
+        return False
+
+
+def _idle_timeout(project_root):
+    """Configured idle timeout in seconds (`daemon_idle_timeout`)."""
+    try:
+        value = float(resolve_config(project_root).get('daemon_idle_timeout', _DEFAULT_IDLE_TIMEOUT))
+    except (TypeError, ValueError):
+        return _DEFAULT_IDLE_TIMEOUT
+    return value if value > 0 else _DEFAULT_IDLE_TIMEOUT
+
+
+def _run_tool(project_root, tool, arguments):
+    """Run a tool in this process.
+
+    sync_status and drift go through the MCP request handler so arguments
+    are interpreted exactly as for MCP clients; generate_digest takes an
+    optional `staged` path list and returns the digest path (or None);
+    select_tests takes the pre-push `push_refs` lines and returns its
+    selection dict.
+    """
+    import purlin_server
+    if tool == 'generate_digest':
+        return purlin_server.generate_digest(project_root, staged=(arguments or {}).get('staged'))
+    if tool == 'select_tests':
+        return purlin_server.select_tests(project_root, (arguments or {}).get('push_refs'))
+    if tool not in TOOLS:
+        raise ValueError(f"Unknown tool: {tool}")
+    response = purlin_server.handle_request({
+        'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call',
+        'params': {'name': tool, 'arguments': arguments or {}},
+    }, project_root)
+    return response['result']['content'][0]['text']
+
+
+def _read_line(conn):
+    """Read one newline-terminated line from a socket; '' on EOF."""
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        newline = chunk.find(b'\n')
+        if newline >= 0:
+            chunks.append(chunk[:newline])
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > _MAX_LINE:
+            raise ValueError("request too large")
+    return b''.join(chunks).decode('utf-8')
+
+
+def _send(conn, payload):
+    conn.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+
+
+def _reply(conn, payload):
+    """Send a daemon response; a client that already hung up is ignored.
+
+    A client interrupted mid-call (Ctrl-C on `git push`) closes its end
+    while the tool runs, and the daemon must keep serving the next one.
+    """
+    try:
+        _send(conn, payload)
+    except OSError:
+        pass
+
+
+def _query_daemon(project_root, tool, arguments=None, timeout=_RESPONSE_TIMEOUT):
+    """Send one request to the project's daemon.
+
+    Returns the decoded response dict, or _UNAVAILABLE when no daemon is
+    listening (or the platform has no Unix sockets).
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return _UNAVAILABLE
+    path = socket_path(project_root)
+    if not _private_dir(os.path.dirname(path)):
+        return _UNAVAILABLE
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        try:
+            sock.connect(path)
+        except OSError:
+            return _UNAVAILABLE
+        if not _peer_is_owner(sock, path):
+            return _UNAVAILABLE
+        sock.settimeout(timeout)
+        _send(sock, {
+            'root': os.path.realpath(project_root),
+            'tool': tool,
+            'arguments': arguments or {},
+        })
+        line = _read_line(sock)
+    except (OSError, ValueError):
+        return _UNAVAILABLE
+    finally:
+        sock.close()
+    if not line:
+        return _UNAVAILABLE
+    try:
+        response = json.loads(line)
+    except json.JSONDecodeError:
+        return _UNAVAILABLE
+    if response.get('unavailable'):
+        return _UNAVAILABLE
+    return response
+
+
+def start_daemon(project_root):
+    """Start a detached daemon for project_root. Returns the Popen handle."""
+    with open(os.devnull, 'r+b') as devnull:
+        return subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), 'serve', os.path.abspath(project_root)],
+            stdin=devnull, stdout=devnull, stderr=devnull,
+            cwd=project_root, close_fds=True, start_new_session=True,
+        )
+
+
+def call_tool(project_root, tool, arguments=None):
+    """Run tool against project_root, preferring a running daemon.
+
+    Falls back to running in-process when no daemon answers. With
+    `"daemon": true` in config, a missing daemon is started in the
+    background for subsequent calls.
+    """
+    response = _query_daemon(project_root, tool, arguments)
+    if response is not _UNAVAILABLE:
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response.get('result')
+    if hasattr(socket, 'AF_UNIX') and _daemon_enabled(project_root):
+        try:
+            start_daemon(project_root)
+        except OSError:
+            pass
+    return _run_tool(project_root, tool, arguments)
+
+
+def _source_mtimes():
+    """Source mtimes of the server modules plus this file."""
+    import purlin_server
+    mtimes = purlin_server._module_mtimes()
+    try:
+        mtimes['purlin_daemon'] = os.stat(os.path.abspath(__file__)).st_mtime_ns
+    except OSError:
+        mtimes['purlin_daemon'] = None
+    return mtimes
+
+
+def _handle_connection(conn, project_root):
+    """Serve one request. Returns False when the daemon should stop."""
+    conn.settimeout(_REQUEST_TIMEOUT)
+    try:
+        request = json.loads(_read_line(conn))
+    except (OSError, ValueError):
+        return True
+    if not isinstance(request, dict):
+        return True
+    if request.get('root') != os.path.realpath(project_root):
+        # Socket names are per project; a mismatch means a hash collision or
+        # a moved checkout. Let the client fall back rather than answer for
+        # the wrong tree.
+        _reply(conn, {'unavailable': True})
+        return True
+    tool = request.get('tool')
+    if tool == 'stop':
+        _reply(conn, {'result': 'stopping'})
+        return False
+    if tool == 'ping':
+        _reply(conn, {'result': 'pong', 'pid': os.getpid()})
+        return True
+    conn.settimeout(None)
+    try:
+        result = _run_tool(project_root, tool, request.get('arguments'))
+    except Exception as e:
+        _reply(conn, {'error': str(e)})
+    else:
+        _reply(conn, {'result': result})
+    return True
+
+
+def serve(project_root, idle_timeout=None):
+    """Run the daemon for project_root until idle, stopped, or outdated.
+
+    Only one daemon runs per project: a lock file next to the socket is held
+    for the daemon's lifetime, and a second instance exits immediately.
+    Returns 0 after a normal shutdown, 1 when another daemon owns the socket
+    or the runtime directory is not private to this user.
+    """
+    import fcntl
+    project_root = os.path.realpath(project_root)
+    if idle_timeout is None:
+        idle_timeout = _idle_timeout(project_root)
+    path = socket_path(project_root)
+    if not _private_dir(os.path.dirname(path), create=True):
+        return 1
+
+    try:
+        lock = os.open(path + '.lock', os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    except OSError:
+        return 1
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(lock)
+        return 1
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if os.path.exists(path):
+            os.unlink(path)  # stale: we hold the lock, so no daemon owns it
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(path)
+        finally:
+            os.umask(old_umask)
+        sock.listen(8)
+        sock.settimeout(idle_timeout)
+
+        mtimes = _source_mtimes()
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                break
+            with conn:
+                if _source_mtimes() != mtimes:
+                    # Code changed since start-up: hand this call back to the
+                    # client to run in-process and make way for a fresh daemon.
+                    conn.settimeout(_REQUEST_TIMEOUT)
+                    _reply(conn, {'unavailable': True})
+                    break
+                if not _handle_connection(conn, project_root):
+                    break
+    finally:
+        sock.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        os.close(lock)
+    return 0
+
+
+def stop(project_root):
+    """Ask a running daemon to exit. Returns True if one was running."""
+    return _query_daemon(project_root, 'stop', timeout=_CONNECT_TIMEOUT) is not _UNAVAILABLE
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] not in ('serve', 'stop', 'status', 'call'):
+        print("Usage: purlin_daemon.py serve|stop|status [project_root]\n"
+              "       purlin_daemon.py call <tool> [json arguments] [project_root]",
+              file=sys.stderr)
+        sys.exit(2)
+    command = args.pop(0)
+
+    if command == 'call':
+        if not args:
+            print("Usage: purlin_daemon.py call <tool> [json arguments] [project_root]",
+                  file=sys.stderr)
+            sys.exit(2)
+        tool = args.pop(0)
+        arguments = json.loads(args.pop(0)) if args and args[0].startswith('{') else {}
+        project_root = args[0] if args else find_project_root()
+        result = call_tool(project_root, tool, arguments)
+        print(result if result is not None else '')
+        return
+
+    project_root = args[0] if args else find_project_root()
+    if command == 'serve':
+        sys.exit(serve(project_root))
+    if command == 'stop':
+        print('stopped' if stop(project_root) else 'not running')
+        return
+    response = _query_daemon(project_root, 'ping', timeout=_CONNECT_TIMEOUT)
+    if response is _UNAVAILABLE:
+        print('not running')
+        sys.exit(1)
+    print(f"running (pid {response.get('pid')}) on {socket_path(project_root)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,19 +11,25 @@ The server reads JSON-RPC requests from stdin and writes responses to stdout.
 It is started automatically by Claude Code when the plugin is enabled.
 """
 
+import concurrent.futures
 import datetime
-import glob
+import fcntl
+import fnmatch
 import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
 from config_engine import find_project_root, resolve_config, update_config
+from spec_parser import tokenize_spec
 
 # ---------------------------------------------------------------------------
 # sync_status — the core coverage tool
@@ -33,225 +39,551 @@ _RULE_RE = re.compile(r'^-\s+(RULE-\d+):\s*(.+)', re.MULTILINE)
 _DEFERRED_TAG_RE = re.compile(r'\(deferred\)\s*$', re.IGNORECASE)
 _ASSUMED_TAG_RE = re.compile(r'\(assumed\s*—\s*.+?\)\s*$', re.IGNORECASE)
 _CONFIRMED_TAG_RE = re.compile(r'\(confirmed\)\s*$', re.IGNORECASE)
-_REQUIRES_RE = re.compile(r'^>\s*Requires:\s*(.+)', re.MULTILINE)
-_SCOPE_RE = re.compile(r'^>\s*Scope:\s*(.+)', re.MULTILINE)
 _MANUAL_STAMPED_RE = re.compile(
     r'@manual\(([^,]+),\s*(\d{4}-\d{2}-\d{2}),\s*([a-f0-9]+)\)'
 )
 _MANUAL_UNSTAMPED_RE = re.compile(r'@manual(?:\s|$)')
-_PROOF_LINE_RE = re.compile(
-    r'^-\s+(PROOF-\d+)\s*\((RULE-\d+(?:,\s*RULE-\d+)*)\):\s*(.+)', re.MULTILINE
-)
 
-_GLOBAL_RE = re.compile(r'^>\s*Global:\s*true\s*$', re.MULTILINE | re.IGNORECASE)
-_SOURCE_RE = re.compile(r'^>\s*Source:\s*(.+)', re.MULTILINE)
-_PINNED_RE = re.compile(r'^>\s*Pinned:\s*(.+)', re.MULTILINE)
-_PATH_RE = re.compile(r'^>\s*Path:\s*(.+)', re.MULTILINE)
-_VISUAL_REF_RE = re.compile(r'^>\s*Visual-Reference:\s*(.+)', re.MULTILINE)
-_VISUAL_HASH_RE = re.compile(r'^>\s*Visual-Hash:\s*sha256:([a-f0-9]+)', re.MULTILINE)
-_DESCRIPTION_RE = re.compile(r'^>\s*Description:\s*(.+)', re.MULTILINE)
-_STACK_RE = re.compile(r'^>\s*Stack:\s*(.+)', re.MULTILINE)
-_META_FIELD_RE = re.compile(r'^>\s*[A-Z][A-Za-z-]+:')
+_VISUAL_HASH_RE = re.compile(r'^sha256:([a-f0-9]+)')
+_PROOF_FILE_RE = re.compile(r'^(.+)\.proofs-(.+)\.json$')
+
+# Bump when _parse_spec output changes so stale on-disk indexes are discarded.
+_SPEC_INDEX_VERSION = 2
+_SPEC_INDEX_FILE = 'spec_index.json'
+_RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+
+
+def _stat_signature(path):
+    """Return the (mtime_ns, size) stat signature of a file, or None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _is_racy(signature):
+    """True when a file changed too recently for its signature to be trusted.
+
+    A file rewritten within the filesystem's timestamp granularity can keep
+    the same mtime and size, so signatures newer than _RACY_WINDOW_NS are
+    never cached — the file is simply re-read on the next call.
+    """
+    return signature[0] >= time.time_ns() - _RACY_WINDOW_NS
+
+
+def _cache_path(project_root, name):
+    """Return the path of a cache file under .purlin/cache/."""
+    return os.path.join(project_root, '.purlin', 'cache', name)
+
+
+def _load_cache_json(project_root, name, version):
+    """Read a versioned cache file. Returns its dict, or None when missing,
+    malformed, or written by a different cache format version."""
+    try:
+        with open(_cache_path(project_root, name), 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError, OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != version:
+        return None
+    return data
+
+
+def _write_cache_json(project_root, name, data):
+    """Atomically write a cache file. No-op outside a Purlin project."""
+    purlin_dir = os.path.join(project_root, '.purlin')
+    if not os.path.isdir(purlin_dir):
+        return
+    path = _cache_path(project_root, name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    except OSError:
+        return
+    _replace_file(path, lambda f: json.dump(data, f, separators=(',', ':')))
 
 
-def _parse_description(content):
-    """Parse > Description: field with multi-line continuation.
+def _replace_file(path, write):
+    """Atomically replace path with the output of write(f). Returns success.
 
-    Continuation lines start with > followed by whitespace but do not
-    match a known metadata field pattern (> FieldName:).
+    The temp file is unique per call, so concurrent tool calls writing the
+    same path never rename each other's half-written output into place.
     """
-    m = _DESCRIPTION_RE.search(content)
-    if not m:
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                        prefix=os.path.basename(path) + '.', suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            write(f)
+        os.replace(tmp_path, path)
+        return True
+    except (IOError, OSError):
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+# Resident project model. The MCP server is a long-lived process, so parsed
+# specs and JSON inputs (proofs, receipts, audit cache) are kept in memory
+# across tool calls. Every entry is keyed by (kind, path) and stores the
+# file's stat signature; an entry is reused only while the signature is
+# unchanged, so edits invalidate exactly the files they touch.
+#
+# A hot reload re-executes this module in place; the model survives it when
+# the entry format is unchanged. Bump the second element when the shape of
+# a 'json' or 'tree' entry changes ('spec' entries follow the index version).
+_RESIDENT_FORMAT = (_SPEC_INDEX_VERSION, 1)
+if globals().get('_resident_format') == _RESIDENT_FORMAT:
+    _RESIDENT = globals()['_RESIDENT']
+else:
+    _RESIDENT = {}
+_resident_format = _RESIDENT_FORMAT
+
+
+def _read_json_resident(path):
+    """Read a JSON file through the resident model. Returns None on error."""
+    signature = _stat_signature(path)
+    if signature is None:
         return None
-    lines = [m.group(1).strip()]
-    # Collect continuation lines after the match
-    rest = content[m.end():]
-    for line in rest.splitlines():
-        stripped = line.strip()
-        if not stripped:
+    key = ('json', path)
+    hit = _RESIDENT.get(key)
+    if hit is not None and hit[0] == signature:
+        return hit[1]
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError, OSError, ValueError):
+        data = None
+    if not _is_racy(signature):
+        _RESIDENT[key] = (signature, data)
+    return data
+
+
+# Audit cache: one JSON shard per feature under .purlin/cache/audit_cache.d/
+# (written by scripts/audit/static_checks.py), over the legacy single-file
+# audit_cache.json base layer.
+_AUDIT_CACHE_FILE = 'audit_cache.json'
+_AUDIT_SHARD_DIR = 'audit_cache.d'
+
+
+def _audit_cache_paths(project_root):
+    """Return the legacy audit cache file and every shard file, in that order."""
+    paths = [_cache_path(project_root, _AUDIT_CACHE_FILE)]
+    shard_dir = _cache_path(project_root, _AUDIT_SHARD_DIR)
+    try:
+        names = sorted(os.listdir(shard_dir))
+    except OSError:
+        names = []
+    paths.extend(os.path.join(shard_dir, n) for n in names if n.endswith('.json'))
+    return paths
+
+
+def _read_audit_cache(project_root):
+    """Return the merged audit cache (hash -> entry), or None when there is none.
+
+    Shard entries win over base-file entries for the same
+    (feature, proof_id), matching static_checks.read_audit_cache.
+    """
+    base_path, *shard_paths = _audit_cache_paths(project_root)
+    base = _read_json_resident(base_path)
+    merged = {}
+    superseded = set()
+    for path in shard_paths:
+        shard = _read_json_resident(path)
+        if not isinstance(shard, dict):
             continue
-        if stripped.startswith('>') and not _META_FIELD_RE.match(stripped):
-            # Continuation line — strip leading > and whitespace
-            text = stripped[1:].strip()
-            if text:
-                lines.append(text)
-        else:
-            break
-    result = ' '.join(lines)
-    return result if result else None
+        for key, entry in shard.items():
+            merged[key] = entry
+            if isinstance(entry, dict):
+                superseded.add((entry.get('feature', ''), entry.get('proof_id', '')))
+    if not isinstance(base, dict):
+        return merged if shard_paths else None
+    for key, entry in base.items():
+        if key in merged:
+            continue
+        if isinstance(entry, dict) and (entry.get('feature', ''), entry.get('proof_id', '')) in superseded:
+            continue
+        merged[key] = entry
+    return merged
+
+
+# Spec info fields held as sets in memory and as sorted lists on disk.
+_SET_FIELDS = ('deferred_rules', 'assumed_rules')
+
+
+def _spec_info_to_json(info):
+    """Convert parsed spec info to its JSON-serializable index form."""
+    data = dict(info)
+    for field in _SET_FIELDS:
+        data[field] = sorted(info[field])
+    return data
+
+
+def _spec_info_from_json(data):
+    """Inverse of _spec_info_to_json."""
+    info = dict(data)
+    for field in _SET_FIELDS:
+        info[field] = set(data.get(field, []))
+    return info
+
+
+def _spec_tree(project_root):
+    """Walk specs/ once and classify every file in it.
+
+    Returns {'specs': [spec paths],
+             'proofs': [proof file paths],
+             'receipts': {feature: [receipt paths]}}.
+    Hidden files and directories are skipped, as glob does. The result is
+    kept in the resident model together with every directory's stat
+    signature and reused while none of them changed — creating, removing
+    or renaming a file always changes its directory's mtime.
+    """
+    spec_dir = os.path.join(project_root, 'specs')
+    key = ('tree', spec_dir)
+    hit = _RESIDENT.get(key)
+    if hit is not None and all(_stat_signature(d) == sig for d, sig in hit[0]):
+        return hit[1]
+
+    dirs = []
+    specs = []
+    proofs = []
+    receipts = {}
+    racy = False
+    seen = set()
+    pending = [spec_dir]
+    while pending:
+        directory = pending.pop()
+        # Guard against symlink cycles when following linked directories
+        real = os.path.realpath(directory)
+        signature = _stat_signature(directory)
+        if real in seen or signature is None:
+            continue
+        seen.add(real)
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        dirs.append((directory, signature))
+        racy = racy or _is_racy(signature)
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                subdirs.append(entry.path)
+            elif name.endswith('.md'):
+                specs.append(entry.path)
+            elif name.endswith('.receipt.json'):
+                receipts.setdefault(name[:-len('.receipt.json')], []).append(entry.path)
+            elif '.proofs-' in name and name.endswith('.json'):
+                proofs.append(entry.path)
+        # Depth-first in name order
+        pending.extend(reversed(subdirs))
+
+    tree = {'specs': specs, 'proofs': proofs, 'receipts': receipts}
+    if dirs and not racy:
+        _RESIDENT[key] = (dirs, tree)
+    return tree
 
 
 def _scan_specs(project_root):
-    """Scan all specs and return a dict of feature -> spec info."""
+    """Scan all specs and return a dict of feature -> spec info.
+
+    Parse results come from the resident model when the spec is unchanged
+    since the last call in this process, otherwise from the versioned
+    on-disk index (.purlin/cache/spec_index.json) keyed by spec path. A spec
+    is re-parsed only when its (mtime, size) signature differs from the
+    indexed one; bumping _SPEC_INDEX_VERSION discards every entry.
+    """
     spec_dir = os.path.join(project_root, 'specs')
     if not os.path.isdir(spec_dir):
         return {}
 
-    features = {}
-    for spec_path in glob.glob(os.path.join(spec_dir, '**', '*.md'), recursive=True):
-        # Skip proof files and non-spec files
+    specs = []  # (feature_name, rel_path, spec_path, signature)
+    for spec_path in _spec_tree(project_root)['specs']:
         basename = os.path.basename(spec_path)
-        if basename.startswith('.'):
+        signature = _stat_signature(spec_path)
+        if signature is None:
             continue
+        specs.append((
+            os.path.splitext(basename)[0],
+            os.path.relpath(spec_path, project_root),
+            spec_path,
+            signature,
+        ))
 
-        feature_name = os.path.splitext(basename)[0]
-        rel_path = os.path.relpath(spec_path, project_root)
+    infos = {}
+    for _name, rel_path, spec_path, signature in specs:
+        hit = _RESIDENT.get(('spec', spec_path))
+        if hit is not None and hit[0] == signature:
+            infos[rel_path] = hit[1]
+    if len(infos) < len(specs):
+        _load_spec_infos(project_root, specs, infos)
+
+    return {name: infos[rel_path] for name, rel_path, _, _ in specs}
 
-        with open(spec_path, 'r') as f:
-            content = f.read()
 
-        # Determine if this is an anchor
-        is_anchor = '/_anchors/' in rel_path or content.lstrip().startswith('# Anchor:')
-
-        # Detect global anchors (> Global: true)
-        is_global = is_anchor and bool(_GLOBAL_RE.search(content))
-
-        # Extract description from > Description: metadata field
-        description = _parse_description(content)
-
-        # Extract rules from ## Rules section
-        rules = {}
-        deferred_rules = set()
-        assumed_rules = set()
-        rules_section = _extract_section(content, '## Rules')
-        if rules_section is not None:
-            for m in _RULE_RE.finditer(rules_section):
-                rule_id = m.group(1)
-                rule_desc = m.group(2).strip()
-                rules[rule_id] = rule_desc
-                if _DEFERRED_TAG_RE.search(rule_desc):
-                    deferred_rules.add(rule_id)
-                elif _ASSUMED_TAG_RE.search(rule_desc):
-                    assumed_rules.add(rule_id)
-            # Check for unnumbered rule lines
-            unnumbered = []
-            for line in rules_section.strip().splitlines():
-                line = line.strip()
-                if line.startswith('- ') and not _RULE_RE.match(line):
-                    unnumbered.append(line)
+def _load_spec_infos(project_root, specs, infos):
+    """Fill infos for specs the resident model could not serve.
+
+    Unchanged specs are loaded from the on-disk index; changed specs are
+    re-parsed. The index is rewritten when any entry changed.
+    """
+    index = _load_cache_json(project_root, _SPEC_INDEX_FILE, _SPEC_INDEX_VERSION)
+    cached = index.get('entries', {}) if index else {}
+    entries = {}
+    dirty = index is None
+
+    for _name, rel_path, spec_path, signature in specs:
+        info = infos.get(rel_path)
+        entry = cached.get(rel_path)
+        if info is not None:
+            # Resident hit — make sure the on-disk index agrees
+            if entry is None or entry.get('sig') != signature:
+                entry = {'sig': signature, 'info': _spec_info_to_json(info)}
+                dirty = True
+        elif entry is not None and entry.get('sig') == signature:
+            info = _spec_info_from_json(entry['info'])
         else:
-            unnumbered = []
-
-        # Extract requires
-        requires = []
-        req_match = _REQUIRES_RE.search(content)
-        if req_match:
-            requires = [r.strip() for r in req_match.group(1).split(',') if r.strip()]
-
-        # Extract scope
-        scope = []
-        scope_match = _SCOPE_RE.search(content)
-        if scope_match:
-            scope = [s.strip() for s in scope_match.group(1).split(',') if s.strip()]
-
-        # Parse manual proof stamps and collect proof descriptions from ## Proof section
-        manual_proofs = {}
-        proof_descriptions = []
-        proof_desc_by_rule = {}
-        proof_desc_by_id = {}
-        proof_tier_by_id = {}
-        planned_proof_ids_by_rule = {}
-        proof_section = _extract_section(content, '## Proof')
-        if proof_section:
-            for line in proof_section.strip().splitlines():
-                line = line.strip()
-                proof_match = _PROOF_LINE_RE.match(line)
-                if not proof_match:
+            with open(spec_path, 'r') as f:
+                content = f.read()
+            info = _parse_spec(content, rel_path)
+            entry = None
+            if not _is_racy(signature):
+                entry = {'sig': signature, 'info': _spec_info_to_json(info)}
+                dirty = True
+
+        if entry is not None:
+            entries[rel_path] = entry
+            _RESIDENT[('spec', spec_path)] = (signature, info)
+        infos[rel_path] = info
+
+    if dirty or len(entries) != len(cached):
+        _write_cache_json(project_root, _SPEC_INDEX_FILE, {
+            'version': _SPEC_INDEX_VERSION,
+            'entries': entries,
+        })
+
+
+def _parse_spec(content, rel_path):
+    """Parse one spec file's content into its spec info dict."""
+    tokens = tokenize_spec(content)
+    fields = tokens['fields']
+
+    # Determine if this is an anchor
+    is_anchor = '/_anchors/' in rel_path or content.lstrip().startswith('# Anchor:')
+
+    # Detect global anchors (> Global: true)
+    is_global = is_anchor and tokens['is_global']
+
+    # Extract rules from ## Rules section
+    rules = {}
+    deferred_rules = set()
+    assumed_rules = set()
+    for rule_id, rule_desc in tokens['rules']:
+        rules[rule_id] = rule_desc
+        if _DEFERRED_TAG_RE.search(rule_desc):
+            deferred_rules.add(rule_id)
+        elif _ASSUMED_TAG_RE.search(rule_desc):
+            assumed_rules.add(rule_id)
+
+    requires = [r.strip() for r in fields.get('Requires', '').split(',') if r.strip()]
+    scope = [s.strip() for s in fields.get('Scope', '').split(',') if s.strip()]
+
+    # Parse manual proof stamps and collect proof descriptions from ## Proof section
+    manual_proofs = {}
+    proof_descriptions = []
+    proof_desc_by_rule = {}
+    proof_desc_by_id = {}
+    proof_tier_by_id = {}
+    planned_proof_ids_by_rule = {}
+    for proof in tokens['proofs']:
+        proof_id = proof['proof_id']
+        proof_desc = proof['description']
+        proof_descriptions.append(proof_desc)
+        proof_desc_by_id[proof_id] = proof['clean_description']
+        proof_tier_by_id[proof_id] = proof['tier']
+        # Support multi-rule proofs: PROOF-8 (RULE-1, RULE-2, RULE-4)
+        rule_ids = proof['rule_ids']
+        for rule_id in rule_ids:
+            proof_desc_by_rule.setdefault(rule_id, []).append(proof_desc)
+            planned_proof_ids_by_rule.setdefault(rule_id, []).append(proof_id)
+        stamp = _MANUAL_STAMPED_RE.search(proof['line'])
+        for rule_id in rule_ids:
+            if stamp:
+                manual_proofs[f"{proof_id}_{rule_id}"] = {
+                    'rule': rule_id,
+                    'email': stamp.group(1),
+                    'date': stamp.group(2),
+                    'commit_sha': stamp.group(3),
+                    'stamped': True,
+                }
+            elif _MANUAL_UNSTAMPED_RE.search(proof['line']):
+                manual_proofs[f"{proof_id}_{rule_id}"] = {
+                    'rule': rule_id,
+                    'stamped': False,
+                }
+
+    # Visual-Hash is only recognised in its sha256:<hex> form
+    visual_hash_match = _VISUAL_HASH_RE.match(fields.get('Visual-Hash', ''))
+
+    # Derive category from the spec's parent directory under specs/
+    # e.g. specs/skills/skill_anchor.md -> "skills", specs/_anchors/foo.md -> "_anchors"
+    _parts = rel_path.split(os.sep)
+    category = _parts[1] if len(_parts) >= 3 else ''
+
+    return {
+        'path': rel_path,
+        'category': category,
+        'rules': rules,
+        'deferred_rules': deferred_rules,
+        'assumed_rules': assumed_rules,
+        'requires': requires,
+        'scope': scope,
+        'is_anchor': is_anchor,
+        'is_global': is_global,
+        'source_url': fields.get('Source'),
+        'pinned': fields.get('Pinned'),
+        'source_path': fields.get('Path'),
+        'unnumbered_lines': tokens['unnumbered_rules'],
+        'has_rules_section': tokens['has_rules_section'],
+        'manual_proofs': manual_proofs,
+        'proof_descriptions': proof_descriptions,
+        'proof_desc_by_rule': proof_desc_by_rule,
+        'proof_desc_by_id': proof_desc_by_id,
+        'proof_tier_by_id': proof_tier_by_id,
+        'planned_proof_ids_by_rule': planned_proof_ids_by_rule,
+        'visual_ref': fields.get('Visual-Reference'),
+        'visual_hash': visual_hash_match.group(1) if visual_hash_match else None,
+        'description': tokens['description'],
+        'stack': fields.get('Stack'),
+    }
+
+
+# Proof fragments: emitters running with PURLIN_PROOF_RUN_ID set write
+# `<run id>.<pid>.<random>.jsonl` files here (one proof entry per line)
+# instead of rewriting proof files. compact_proof_journal folds them in.
+_PROOF_JOURNAL_DIR = os.path.join('.purlin', 'proof-journal')
+_PROOF_JOURNAL_STATE = 'runs.json'
+_PROOF_JOURNAL_RUN_TTL = 86400  # seconds after its first compaction a run id stays one run
+
+
+def compact_proof_journal(project_root):
+    """Fold proof fragments into the canonical `*.proofs-<tier>.json` files.
+
+    Fragments of one run are applied like a single emitter run: the first
+    time a run touches a (feature, tier), that feature's existing entries
+    are purged (feature-scoped overwrite); later fragments of the same run,
+    including ones compacted on a later call, append to them, an entry for
+    the same (feature, id, test_file, test_name) replacing the earlier one.
+    A run id is one run for _PROOF_JOURNAL_RUN_TTL after it is first seen;
+    reused after that, it starts a fresh run with its own overwrite, however
+    often it was reused in between. Runs are applied oldest fragment first. Compaction holds a lock, so concurrent
+    callers never apply a fragment twice. Returns the number of fragments
+    compacted.
+    """
+    journal = os.path.join(project_root, _PROOF_JOURNAL_DIR)
+    try:
+        if not any(name.endswith('.jsonl') for name in os.listdir(journal)):
+            return 0
+    except OSError:
+        return 0
+
+    with open(os.path.join(journal, '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        fragments = []
+        for name in os.listdir(journal):
+            if name.endswith('.jsonl'):
+                path = os.path.join(journal, name)
+                try:
+                    fragments.append((os.path.getmtime(path), name, path))
+                except OSError:
                     continue
-                proof_id = proof_match.group(1)
-                rule_ids_raw = proof_match.group(2)
-                proof_desc = proof_match.group(3).strip()
-                # Strip tier tags (@unit, @integration, @e2e, @manual...) from description
-                clean_desc = re.sub(r'\s*@\w+(?:\([^)]*\))?\s*$', '', proof_desc).strip()
-                proof_descriptions.append(proof_desc)
-                proof_desc_by_id[proof_id] = clean_desc
-                # Tier from the trailing @tag (default unit)
-                tier_match = re.search(r'@(\w+)(?:\([^)]*\))?\s*$', proof_desc)
-                proof_tier_by_id[proof_id] = tier_match.group(1) if tier_match else 'unit'
-                # Support multi-rule proofs: PROOF-8 (RULE-1, RULE-2, RULE-4)
-                rule_ids = [r.strip() for r in rule_ids_raw.split(',')]
-                for rule_id in rule_ids:
-                    proof_desc_by_rule.setdefault(rule_id, []).append(proof_desc)
-                    planned_proof_ids_by_rule.setdefault(rule_id, []).append(proof_id)
-                stamp = _MANUAL_STAMPED_RE.search(line)
-                for rule_id in rule_ids:
-                    if stamp:
-                        manual_proofs[f"{proof_id}_{rule_id}"] = {
-                            'rule': rule_id,
-                            'email': stamp.group(1),
-                            'date': stamp.group(2),
-                            'commit_sha': stamp.group(3),
-                            'stamped': True,
-                        }
-                    elif _MANUAL_UNSTAMPED_RE.search(line):
-                        manual_proofs[f"{proof_id}_{rule_id}"] = {
-                            'rule': rule_id,
-                            'stamped': False,
-                        }
-
-        # Extract source URL for externally-referenced anchors
-        source_match = _SOURCE_RE.search(content)
-        source_url = source_match.group(1).strip() if source_match else None
-
-        # Extract pinned version and path for externally-referenced anchors
-        pinned_match = _PINNED_RE.search(content)
-        path_match = _PATH_RE.search(content)
-        pinned = pinned_match.group(1).strip() if pinned_match else None
-        source_path = path_match.group(1).strip() if path_match else None
-
-        # Extract visual reference and hash for staleness detection
-        visual_ref_match = _VISUAL_REF_RE.search(content)
-        visual_hash_match = _VISUAL_HASH_RE.search(content)
-        visual_ref = visual_ref_match.group(1).strip() if visual_ref_match else None
-        visual_hash = visual_hash_match.group(1).strip() if visual_hash_match else None
-
-        # Extract > Stack: metadata
-        stack_match = _STACK_RE.search(content)
-        stack = stack_match.group(1).strip() if stack_match else None
-
-        # Derive category from the spec's parent directory under specs/
-        # e.g. specs/skills/skill_anchor.md -> "skills", specs/_anchors/foo.md -> "_anchors"
-        _parts = rel_path.split(os.sep)
-        category = _parts[1] if len(_parts) >= 3 else ''
-
-        features[feature_name] = {
-            'path': rel_path,
-            'category': category,
-            'rules': rules,
-            'deferred_rules': deferred_rules,
-            'assumed_rules': assumed_rules,
-            'requires': requires,
-            'scope': scope,
-            'is_anchor': is_anchor,
-            'is_global': is_global,
-            'source_url': source_url,
-            'pinned': pinned,
-            'source_path': source_path,
-            'unnumbered_lines': unnumbered,
-            'has_rules_section': rules_section is not None,
-            'manual_proofs': manual_proofs,
-            'proof_descriptions': proof_descriptions,
-            'proof_desc_by_rule': proof_desc_by_rule,
-            'proof_desc_by_id': proof_desc_by_id,
-            'proof_tier_by_id': proof_tier_by_id,
-            'planned_proof_ids_by_rule': planned_proof_ids_by_rule,
-            'visual_ref': visual_ref,
-            'visual_hash': visual_hash,
-            'description': description,
-            'stack': stack,
-        }
+        if not fragments:
+            return 0
+        fragments.sort()
+
+        state_path = os.path.join(journal, _PROOF_JOURNAL_STATE)
+        try:
+            with open(state_path) as f:
+                runs = json.load(f)
+        except (OSError, ValueError):
+            runs = {}
+        if not isinstance(runs, dict):
+            runs = {}
+        now = time.time()
+        runs = {run_id: run for run_id, run in runs.items()
+                if isinstance(run, dict)
+                and now - run.get('started', 0) < _PROOF_JOURNAL_RUN_TTL}
+
+        spec_dirs = {}
+        for spec_path in _spec_tree(project_root)['specs']:
+            spec_dirs[os.path.splitext(os.path.basename(spec_path))[0]] = os.path.dirname(spec_path)
+
+        files = {}  # proof file path -> (tier, entries)
+        for _, name, path in fragments:
+            run_id = name.split('.', 1)[0]
+            run = runs.setdefault(run_id, {'keys': [], 'started': now})
+            try:
+                with open(path) as f:
+                    lines = f.read().splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(entry, dict) or not entry.get('feature'):
+                    continue
+                feature = entry['feature']
+                tier = entry.get('tier', 'unit')
+                directory = spec_dirs.get(feature, os.path.join(project_root, 'specs'))
+                proof_path = os.path.join(directory, f'{feature}.proofs-{tier}.json')
+                if proof_path not in files:
+                    try:
+                        with open(proof_path) as f:
+                            existing = json.load(f).get('proofs', [])
+                    except (OSError, ValueError, AttributeError):
+                        existing = []
+                    files[proof_path] = (tier, existing)
+                entries = files[proof_path][1]
+                key = f'{feature}:{tier}'
+                if key not in run['keys']:
+                    run['keys'].append(key)
+                    entries[:] = [e for e in entries if e.get('feature') != feature]
+                else:
+                    same = _journal_entry_key(entry)
+                    entries[:] = [e for e in entries if _journal_entry_key(e) != same]
+                entries.append(entry)
+
+        for proof_path, (tier, entries) in files.items():
+            os.makedirs(os.path.dirname(proof_path), exist_ok=True)
+
+            def write(f, tier=tier, entries=entries):
+                json.dump({'tier': tier, 'proofs': entries}, f, indent=2)
+                f.write('\n')
+            if not _replace_file(proof_path, write):
+                # Keep the fragments: nothing has been consumed yet
+                raise OSError(f'cannot write {proof_path}')
+        for _, _, path in fragments:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
 
-    return features
+        _replace_file(state_path, lambda f: json.dump(runs, f))
+    return len(fragments)
 
 
-def _extract_section(content, heading):
-    """Extract content under a markdown heading until the next heading."""
-    pattern = re.compile(
-        r'^' + re.escape(heading) + r'\s*\n(.*?)(?=^## |\Z)',
-        re.MULTILINE | re.DOTALL
-    )
-    m = pattern.search(content)
-    return m.group(1) if m else None
+def _journal_entry_key(entry):
+    return (entry.get('feature'), entry.get('id'), entry.get('test_file'), entry.get('test_name'))
 
 
 def _read_proofs(project_root):
@@ -264,18 +596,25 @@ def _read_proofs(project_root):
     if not os.path.isdir(spec_dir):
         return {}
 
+    try:
+        compact_proof_journal(project_root)
+    except OSError as e:
+        # Fragments stay in the journal for the next read; report what is on disk
+        print(f"purlin: proof journal not compacted: {e}", file=sys.stderr)
+
+    tree = _spec_tree(project_root)
+
     # Build spec directory map: feature_name -> directory containing its .md
     spec_dirs = {}
-    for spec_path in glob.glob(os.path.join(spec_dir, '**', '*.md'), recursive=True):
+    for spec_path in tree['specs']:
         stem = os.path.splitext(os.path.basename(spec_path))[0]
         spec_dirs[stem] = os.path.dirname(spec_path)
 
     # Collect all proof files, grouped by (feature_stem, tier)
     proof_files = {}  # (feature_stem, tier) -> [paths]
-    proof_re = re.compile(r'^(.+)\.proofs-(.+)\.json$')
-    for proof_path in glob.glob(os.path.join(spec_dir, '**', '*.proofs-*.json'), recursive=True):
+    for proof_path in tree['proofs']:
         basename = os.path.basename(proof_path)
-        m = proof_re.match(basename)
+        m = _PROOF_FILE_RE.match(basename)
         if not m:
             continue
         feature_stem = m.group(1)
@@ -297,10 +636,8 @@ def _read_proofs(project_root):
                 # No spec match — pick most recently modified
                 chosen = max(paths, key=os.path.getmtime)
 
-        try:
-            with open(chosen, 'r') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError, OSError):
+        data = _read_json_resident(chosen)
+        if not isinstance(data, dict):
             continue
 
         for entry in data.get('proofs', []):
@@ -310,18 +647,160 @@ def _read_proofs(project_root):
     return all_proofs
 
 
-def _check_manual_staleness(project_root, scope_files, commit_sha):
-    """Check if any scope files have commits newer than the manual stamp's SHA."""
-    if not scope_files or not commit_sha:
-        return False
+_MANUAL_STALENESS_FILE = 'manual_staleness.json'
+_MANUAL_STALENESS_VERSION = 1
+
+
+def _run_git_lines(project_root, args, input_text=None, timeout=30):
+    """Run a git command; return its stdout lines, or None on failure."""
+    _check_cancelled()
     try:
-        result = subprocess.run(
-            ['git', 'log', '--oneline', f'{commit_sha}..HEAD', '--'] + scope_files,
-            capture_output=True, text=True, cwd=project_root, timeout=5
+        r = subprocess.run(
+            ['git'] + args, capture_output=True, text=True, input=input_text,
+            cwd=project_root, timeout=timeout,
         )
-        return bool(result.stdout.strip())
     except (subprocess.SubprocessError, OSError):
-        return False
+        return None
+    if r.returncode != 0:
+        return None
+    return r.stdout.splitlines()
+
+
+def _pathspec_matches(pathspec, path):
+    """Match a > Scope: entry against a repo path the way a git pathspec
+    does: exact path, directory prefix, or fnmatch-style wildcard."""
+    spec = pathspec.rstrip('/')
+    if spec in ('', '.'):
+        return True
+    if path == spec or path.startswith(spec + '/'):
+        return True
+    return any(c in spec for c in '*?[') and fnmatch.fnmatchcase(path, spec)
+
+
+def _manual_stamps(infos):
+    """Collect (scope tuple, commit_sha) for every stamped @manual proof."""
+    checks = set()
+    for info in infos:
+        scope = tuple(info.get('scope', []))
+        if not scope:
+            continue
+        for mp_info in info.get('manual_proofs', {}).values():
+            if mp_info.get('stamped') and mp_info.get('commit_sha'):
+                checks.add((scope, mp_info['commit_sha']))
+    return checks
+
+
+def _manual_staleness_map(project_root, infos):
+    """Answer staleness for every stamped @manual proof in infos at once.
+
+    A manual proof is stale when a commit after its stamp SHA (and reachable
+    from HEAD) touched a file in the feature's > Scope:. Returns
+    {(scope tuple, commit_sha): bool}. Results are cached in
+    .purlin/cache/manual_staleness.json and stay valid until HEAD moves.
+    """
+    checks = _manual_stamps(infos)
+    if not checks:
+        return {}
+    head = _run_git_lines(project_root, ['rev-parse', 'HEAD'], timeout=5)
+    if not head:
+        return {check: False for check in checks}
+    head = head[0].strip()
+
+    cache = _load_cache_json(project_root, _MANUAL_STALENESS_FILE, _MANUAL_STALENESS_VERSION)
+    cached = cache.get('results', {}) if cache and cache.get('head') == head else {}
+
+    results = {}
+    missing = []
+    for scope, sha in checks:
+        key = json.dumps([sha, list(scope)])
+        if key in cached:
+            results[(scope, sha)] = cached[key]
+        else:
+            missing.append((scope, sha))
+
+    if missing:
+        results.update(_compute_manual_staleness(project_root, head, missing))
+        merged = dict(cached)
+        for scope, sha in missing:
+            merged[json.dumps([sha, list(scope)])] = results[(scope, sha)]
+        _write_cache_json(project_root, _MANUAL_STALENESS_FILE, {
+            'version': _MANUAL_STALENESS_VERSION,
+            'head': head,
+            'results': merged,
+        })
+    return results
+
+
+def _compute_manual_staleness(project_root, head, checks):
+    """Compute staleness for (scope, sha) checks with one git log walk.
+
+    The walk covers every commit reachable from HEAD or any stamp but not
+    from the stamps' common ancestor. For each stamp, the commits in
+    sha..HEAD are then found in-process from the parent links, and their
+    touched files are matched against the scope. Merge commits contribute
+    no files, as in `git log --name-only`. Unknown SHAs are never stale.
+    """
+    stamps = sorted({sha for _, sha in checks})
+    resolved = _run_git_lines(
+        project_root, ['cat-file', '--batch-check'],
+        input_text=''.join(f'{sha}^{{commit}}\n' for sha in stamps), timeout=10,
+    ) or []
+    full_sha = {}
+    for sha, line in zip(stamps, resolved):
+        parts = line.split()
+        if len(parts) == 3 and parts[1] == 'commit':
+            full_sha[sha] = parts[0]
+    if not full_sha:
+        return {check: False for check in checks}
+
+    tips = sorted(set(full_sha.values()))
+    base = _run_git_lines(project_root, ['merge-base', '--octopus'] + tips, timeout=10)
+    rev_args = ['HEAD'] + tips + ([f'^{base[0].strip()}'] if base else [])
+    log = _run_git_lines(
+        project_root,
+        ['log', '--format=%x00%H %P', '--name-only', '--relative'] + rev_args + ['--'],
+    )
+    if log is None:
+        return {check: False for check in checks}
+
+    parents = {}
+    files = {}
+    current = None
+    for line in log:
+        if line.startswith('\0'):
+            ids = line[1:].split()
+            current = ids[0]
+            parents[current] = ids[1:]
+            files[current] = []
+        elif line and current is not None:
+            files[current].append(line)
+
+    def reachable(tip):
+        seen = set()
+        pending = [tip] if tip in parents else []
+        while pending:
+            commit = pending.pop()
+            if commit in seen:
+                continue
+            seen.add(commit)
+            pending.extend(p for p in parents[commit] if p in parents)
+        return seen
+
+    from_head = reachable(head)
+    changed_since = {}
+    for sha, full in full_sha.items():
+        changed = set()
+        for commit in from_head - reachable(full):
+            changed.update(files[commit])
+        changed_since[sha] = changed
+
+    results = {}
+    for scope, sha in checks:
+        changed = changed_since.get(sha, ())
+        results[(scope, sha)] = any(
+            _pathspec_matches(spec, path) for path in changed for spec in scope
+        )
+    return results
 
 
 def _check_visual_hash(project_root, visual_ref, stored_hash):
@@ -424,47 +903,15 @@ def _read_audit_summary(project_root):
     only. Coverage (proved/total rules) is a separate metric.
     Returns dict with integrity stats or None if no cache exists.
     """
-    cache_path = os.path.join(project_root, '.purlin', 'cache', 'audit_cache.json')
-    if not os.path.isfile(cache_path):
-        return None
-    try:
-        with open(cache_path) as f:
-            cache = json.load(f)
-    except (json.JSONDecodeError, IOError, OSError):
-        return None
-    if not isinstance(cache, dict) or not cache:
+    index = _audit_index(project_root)
+    if index is None:
         return None
-
-    # Deduplicate by (feature, proof_id) — keep latest entry
-    latest = {}
-    for _key, entry in cache.items():
-        if not isinstance(entry, dict):
-            continue
-        dedup_key = (entry.get('feature', ''), entry.get('proof_id', ''))
-        existing = latest.get(dedup_key)
-        if existing is None or entry.get('cached_at', '') > existing.get('cached_at', ''):
-            latest[dedup_key] = entry
-
-    strong = 0
-    weak = 0
-    hollow = 0
-    manual = 0
-    latest_ts = None
-
-    for entry in latest.values():
-        assessment = entry.get('assessment', '').upper()
-        if assessment == 'STRONG':
-            strong += 1
-        elif assessment == 'WEAK':
-            weak += 1
-        elif assessment == 'HOLLOW':
-            hollow += 1
-        elif assessment == 'MANUAL':
-            manual += 1
-
-        ts = entry.get('cached_at')
-        if ts and (latest_ts is None or ts > latest_ts):
-            latest_ts = ts
+    totals = index['totals']
+    strong = totals['strong']
+    weak = totals['weak']
+    hollow = totals['hollow']
+    manual = totals['manual']
+    latest_ts = index['latest_ts']
 
     integrity, behavioral_total = _compute_integrity(strong, weak, hollow, manual)
     if integrity is None:
@@ -554,15 +1001,10 @@ def _build_summary_table(summary_rows, audit_summary=None):
 
 def _read_receipt(project_root, feature_name):
     """Read a receipt JSON for a feature, or return None if not found."""
-    spec_dir = os.path.join(project_root, 'specs')
-    if not os.path.isdir(spec_dir):
-        return None
-    for path in glob.glob(os.path.join(spec_dir, '**', f'{feature_name}.receipt.json'), recursive=True):
-        try:
-            with open(path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError, OSError):
-            continue
+    for path in _spec_tree(project_root)['receipts'].get(feature_name, []):
+        receipt = _read_json_resident(path)
+        if receipt is not None:
+            return receipt
     return None
 
 
@@ -620,19 +1062,174 @@ def _check_legacy_mcp_entry(project_root):
     return None
 
 
-def sync_status(project_root, role=None):
-    """Generate the full sync_status report with directives."""
+# Coverage states that need no follow-up; compact mode omits their detail
+_GREEN_STATUSES = ('VERIFIED', 'PASSING')
+
+
+def _parse_page_args(status=None, category=None, cursor=None, page_size=None):
+    """Validate sync_status selection arguments.
+
+    status and category accept a list or a comma-separated string. Returns
+    (statuses, categories, offset, page_size); raises ValueError with a
+    message for the caller on a malformed cursor or page size.
+    """
+    def as_set(value, normalize):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = value.split(',')
+        picked = {normalize(v.strip()) for v in value if v and v.strip()}
+        return picked or None
+
+    offset = 0
+    if cursor not in (None, ''):
+        try:
+            offset = int(cursor)
+        except (TypeError, ValueError):
+            offset = -1
+        if offset < 0:
+            raise ValueError(f"Invalid cursor: {cursor!r}. Pass the cursor from the previous page.")
+    if page_size is not None:
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            page_size = 0
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer.")
+    return (as_set(status, str.upper), as_set(category, lambda c: c.strip('/')),
+            offset, page_size)
+
+
+def _anchor_needs_attention(info, anchor_staleness):
+    """True when an anchor's external source is unpinned, stale or unreachable."""
+    if not info.get('source_url'):
+        return False
+    if not info.get('pinned'):
+        return True
+    staleness = anchor_staleness.get((info['source_url'], info['pinned']))
+    return bool(staleness) and staleness['status'] in ('stale', 'error')
+
+
+def _report_anchor(name, info, anchor_staleness):
+    """Generate report lines for a single anchor."""
+    lines = []
+    rule_count = len(info['rules'])
+    if info.get('is_global'):
+        lines.append(f"{name}: {rule_count} rules (global \u2014 auto-applied to all features)")
+    else:
+        lines.append(f"{name}: {rule_count} rules (apply to features with > Requires: {name})")
+    # Show external reference info with staleness check
+    if info.get('source_url'):
+        lines.append(f"  Source: {info['source_url']}")
+        if info.get('source_path'):
+            lines.append(f"  Path: {info['source_path']}")
+        if info.get('pinned'):
+            pinned_val = info['pinned']
+            pinned_display = pinned_val[:7] if len(pinned_val) > 10 else pinned_val
+            staleness = anchor_staleness.get((info['source_url'], pinned_val))
+            if staleness and staleness['status'] == 'stale':
+                remote_short = staleness['remote_sha'][:7] if staleness.get('remote_sha') else '?'
+                lines.append(f"  Pinned: {pinned_display} \u26a0 STALE \u2014 remote is {remote_short}. Run: purlin:anchor sync {name}")
+            elif staleness and staleness['status'] == 'error':
+                lines.append(f"  Pinned: {pinned_display} (source unreachable)")
+            else:
+                lines.append(f"  Pinned: {pinned_display} (current)")
+        else:
+            lines.append(f"  \u26a0 Unpinned \u2014 run: purlin:anchor sync {name}")
+    for rule_id, desc in sorted(info['rules'].items()):
+        lines.append(f"  {rule_id}: {desc}")
+    return lines
+
+
+def _status_entry(name, info, cov):
+    """Machine-readable coverage of one spec for sync_status format=json."""
+    failing = set(cov['failing'])
+    return {
+        'name': name,
+        'type': 'anchor' if info.get('is_anchor') else 'feature',
+        'category': info.get('category', ''),
+        'status': cov['status'],
+        'proved': cov['proved'],
+        'total': cov['active_total'],
+        'deferred': cov['deferred_count'],
+        'failing_rules': cov['failing'],
+        'unproved_rules': [
+            key for key, _, _ in cov['active_entries']
+            if key not in failing
+            and cov['proof_by_rule'].get(key, {}).get('status') != 'pass'
+        ],
+        'receipt_current': cov['has_current_receipt'],
+    }
+
+
+def _status_summary(entries):
+    """Count the features (not anchors) of _status_entry rows by status."""
+    summary = {'total_features': 0, 'verified': 0, 'passing': 0, 'partial': 0,
+               'failing': 0, 'untested': 0}
+    for entry in entries:
+        if entry['type'] == 'feature':
+            summary['total_features'] += 1
+            summary[entry['status'].lower()] += 1
+    return summary
+
+
+def _write_status_report_data(project_root, features, all_proofs, global_anchors,
+                              coverage, audit_summary=None):
+    """Write report-data.js as a side effect of sync_status when `report` is on.
+
+    Returns the file path, or None when disabled or not written.
+    """
+    config = resolve_config(project_root)
+    if not config.get('report'):
+        return None
+    if audit_summary is None:
+        audit_summary = _read_audit_summary(project_root)
+    return _write_report_data(
+        project_root, features, all_proofs, config, global_anchors,
+        audit_summary, coverage=coverage,
+    )
+
+
+def sync_status(project_root, role=None, status=None, category=None, compact=False,
+                cursor=None, page_size=None, output_format='text'):
+    """Generate the sync_status report with directives.
+
+    With no selection arguments every spec is reported. Otherwise:
+      status, category — report only specs whose coverage status / spec
+                         category is listed (list or comma-separated string)
+      compact          — keep the summary table row of every selected spec
+                         but omit detail for VERIFIED/PASSING features and for
+                         anchors whose external source needs no attention
+      page_size, cursor — report one page of the selected specs (features by
+                         name, then anchors); the output ends with the cursor
+                         of the next page when there is one
+      output_format    — 'json' returns a JSON document instead of text:
+                         {'features': [_status_entry per summary table row],
+                          'summary', 'warnings', 'selected', 'next_cursor'}
+    """
+    as_json = output_format == 'json'
+    try:
+        statuses, categories, offset, page_size = _parse_page_args(
+            status, category, cursor, page_size)
+    except ValueError as e:
+        return f"Error: {e}"
+
     features = _scan_specs(project_root)
     all_proofs = _read_proofs(project_root)
 
     if not features:
+        if as_json:
+            return json.dumps({'features': [], 'summary': _status_summary([]),
+                               'warnings': [], 'selected': 0, 'next_cursor': None})
         return "No specs found in specs/. Run purlin:init to set up, or create specs manually."
 
     preamble = []
+    warnings = []
 
     # Warn about a legacy version-pinned MCP entry (shadows the plugin-bundled server)
     legacy_mcp = _check_legacy_mcp_entry(project_root)
     if legacy_mcp:
+        warnings.append(f'Legacy MCP config: .mcp.json pins purlin to {legacy_mcp}')
         preamble.append('⚠ Legacy MCP config: .mcp.json pins purlin to a plugin-cache path:')
         preamble.append(f'  {legacy_mcp}')
         preamble.append('This entry shadows the plugin-bundled MCP server and stays on the old version after plugin updates.')
@@ -642,6 +1239,7 @@ def sync_status(project_root, role=None):
     # Check for uncommitted spec/proof changes
     uncommitted = _check_uncommitted_specs(project_root)
     if uncommitted:
+        warnings.extend(f'Uncommitted: {entry}' for entry in uncommitted)
         preamble.append('\u26a0 Uncommitted spec/proof changes detected:')
         for entry in uncommitted:
             preamble.append(f'  {entry}')
@@ -656,104 +1254,95 @@ def sync_status(project_root, role=None):
     # Identify global anchors (auto-applied to all features)
     global_anchors = {k: v for k, v in anchors.items() if v.get('is_global')}
 
+    # Coverage is computed once per feature and shared by the detail report,
+    # the summary table and report data
+    coverage = _build_coverage_map(project_root, features, all_proofs, global_anchors)
+
+    # Select the page of specs to report: features by name, then anchors
+    selected = [
+        name for name in sorted(regular.keys()) + sorted(anchors.keys())
+        if (statuses is None or coverage[name]['status'] in statuses)
+        and (categories is None or features[name].get('category', '') in categories)
+    ]
+    total_selected = len(selected)
+    end = total_selected if page_size is None else min(offset + page_size, total_selected)
+    page = set(selected[offset:end])
+
+    if as_json:
+        # Same rows as the summary table: every feature, anchors with proofs
+        entries = [
+            _status_entry(name, features[name], coverage[name])
+            for name in sorted(regular.keys()) + sorted(anchors.keys())
+            if name in page and (name in regular or all_proofs.get(name))
+        ]
+        _write_status_report_data(project_root, features, all_proofs, global_anchors,
+                                  coverage)
+        return json.dumps({
+            'features': entries,
+            'summary': _status_summary(entries),
+            'warnings': warnings,
+            'selected': total_selected,
+            'next_cursor': str(end) if end < total_selected else None,
+        }, indent=2)
+
+    # Staleness of every stamped @manual proof, answered from one git walk
+    manual_staleness = _manual_staleness_map(
+        project_root, [info for name, info in regular.items() if name in page])
+
     summary_rows = []
     detail = []
 
     # Process regular features
     for name in sorted(regular.keys()):
+        if name not in page:
+            continue
+        _check_cancelled()
         info = regular[name]
+        cov = coverage[name]
+        summary_rows.append((name, cov['proved'], cov['active_total'], cov['status']))
+        if compact and cov['status'] in _GREEN_STATUSES:
+            continue
         feature_lines = _report_feature(
-            name, info, features, all_proofs, project_root, role, global_anchors
+            name, info, features, all_proofs, project_root, role, global_anchors,
+            coverage=cov, manual_staleness=manual_staleness,
         )
         detail.extend(feature_lines)
         detail.append('')
 
-        # Collect summary data (must match _report_feature's counting logic)
-        rule_entries, _ = _build_coverage_rules(name, info, features, global_anchors)
-        proof_by_rule = _build_proof_lookup(name, rule_entries, all_proofs)
-        active_entries = [(k, l, s) for k, l, s, is_def in rule_entries if not is_def]
-        active_total = len(active_entries)
-        proved = sum(1 for key, _, _ in active_entries
-                     if proof_by_rule.get(key, {}).get('status') == 'pass')
-        has_fail = any(proof_by_rule.get(key, {}).get('status') == 'fail'
-                       for key, _, _ in active_entries)
-
-        all_proved_passing = (proved == active_total and active_total > 0)
-        receipt = _read_receipt(project_root, name)
-        has_current_receipt = False
-        if all_proved_passing and receipt:
-            cli_rule_entries, _ = _build_coverage_rules(name, info, features, global_anchors)
-            cli_active = [(k, l, s) for k, l, s, is_def in cli_rule_entries if not is_def]
-            cli_all_proofs_list = _collect_relevant_proofs(name, cli_rule_entries, all_proofs)
-            cli_vhash = _compute_vhash(
-                {key: True for key, _, _ in cli_active}, cli_all_proofs_list
-            )
-            has_current_receipt = (receipt.get('vhash') == cli_vhash)
-
-        status = _determine_status(proved, active_total, has_fail, has_current_receipt)
-
-        summary_rows.append((name, proved, active_total, status))
-
-    # Process anchors
+    # Process anchors — external sources are checked together, up front
+    anchor_staleness = _external_anchor_staleness(
+        project_root, {name: info for name, info in anchors.items() if name in page})
     for name in sorted(anchors.keys()):
+        if name not in page:
+            continue
         info = anchors[name]
-        rule_count = len(info['rules'])
-        if info.get('is_global'):
-            detail.append(f"{name}: {rule_count} rules (global \u2014 auto-applied to all features)")
-        else:
-            detail.append(f"{name}: {rule_count} rules (apply to features with > Requires: {name})")
-        # Show external reference info with staleness check
-        if info.get('source_url'):
-            detail.append(f"  Source: {info['source_url']}")
-            if info.get('source_path'):
-                detail.append(f"  Path: {info['source_path']}")
-            if info.get('pinned'):
-                pinned_val = info['pinned']
-                pinned_display = pinned_val[:7] if len(pinned_val) > 10 else pinned_val
-                staleness = _check_git_staleness(info['source_url'], pinned_val, project_root)
-                if staleness and staleness['status'] == 'stale':
-                    remote_short = staleness['remote_sha'][:7] if staleness.get('remote_sha') else '?'
-                    detail.append(f"  Pinned: {pinned_display} \u26a0 STALE \u2014 remote is {remote_short}. Run: purlin:anchor sync {name}")
-                elif staleness and staleness['status'] == 'error':
-                    detail.append(f"  Pinned: {pinned_display} (source unreachable)")
-                else:
-                    detail.append(f"  Pinned: {pinned_display} (current)")
-            else:
-                detail.append(f"  \u26a0 Unpinned \u2014 run: purlin:anchor sync {name}")
-        for rule_id, desc in sorted(info['rules'].items()):
-            detail.append(f"  {rule_id}: {desc}")
-        detail.append('')
+        if not compact or _anchor_needs_attention(info, anchor_staleness):
+            detail.extend(_report_anchor(name, info, anchor_staleness))
+            detail.append('')
 
         # Include anchor in summary if it has proofs
-        anchor_proofs = all_proofs.get(name, [])
-        if anchor_proofs:
-            deferred = info.get('deferred_rules', set())
-            active_rules = set(info['rules'].keys()) - deferred
-            active_total = len(active_rules)
-
-            passed_rules = set()
-            has_fail = False
-            for p in anchor_proofs:
-                rule = p.get('rule', '')
-                if rule in active_rules:
-                    if p.get('status') == 'pass':
-                        passed_rules.add(rule)
-                    elif p.get('status') == 'fail':
-                        has_fail = True
-            proved = len(passed_rules)
-
-            a_all_proved_passing = (proved >= active_total and active_total > 0)
-            a_receipt = _read_receipt(project_root, name)
-            a_has_receipt = False
-            if a_all_proved_passing and a_receipt:
-                a_vhash = _compute_vhash(
-                    {r: True for r in active_rules}, anchor_proofs
-                )
-                a_has_receipt = (a_receipt.get('vhash') == a_vhash)
-
-            a_status = _determine_status(proved, active_total, has_fail, a_has_receipt)
+        if all_proofs.get(name):
+            cov = coverage[name]
+            summary_rows.append(
+                (f"{name} (anchor)", cov['proved'], cov['active_total'], cov['status'])
+            )
 
-            summary_rows.append((f"{name} (anchor)", proved, active_total, a_status))
+    if statuses or categories or compact or page_size or offset:
+        selection = []
+        if statuses:
+            selection.append('status ' + ','.join(sorted(statuses)))
+        if categories:
+            selection.append('category ' + ','.join(sorted(categories)))
+        if compact:
+            selection.append('compact')
+        if page:
+            shown = f"Showing specs {offset + 1}\u2013{end} of {total_selected}"
+        else:
+            shown = f"No specs on this page ({total_selected} selected)"
+        preamble.append(shown + (f" ({'; '.join(selection)})" if selection else ''))
+        preamble.append('')
+    if end < total_selected:
+        detail.append(f'\u2192 More: call sync_status again with cursor "{end}"')
 
     # Read audit cache for integrity summary
     audit_summary = _read_audit_summary(project_root)
@@ -762,20 +1351,16 @@ def sync_status(project_root, role=None):
     table_lines = _build_summary_table(summary_rows, audit_summary)
 
     # Report data generation (side effect)
-    config = resolve_config(project_root)
-    if config.get('report'):
-        data_path = _write_report_data(
-            project_root, features, all_proofs, config, global_anchors,
-            audit_summary,
-        )
-        if data_path:
-            html_path = os.path.join(project_root, 'purlin-report.html')
-            if os.path.isfile(html_path):
-                abs_html = os.path.abspath(html_path)
-                preamble.append(
-                    f'\u2192 Dashboard: file://{abs_html}'
-                )
-                preamble.append('')
+    data_path = _write_status_report_data(
+        project_root, features, all_proofs, global_anchors, coverage, audit_summary)
+    if data_path:
+        html_path = os.path.join(project_root, 'purlin-report.html')
+        if os.path.isfile(html_path):
+            abs_html = os.path.abspath(html_path)
+            preamble.append(
+                f'\u2192 Dashboard: file://{abs_html}'
+            )
+            preamble.append('')
 
     return '\n'.join(preamble + table_lines + detail).strip()
 
@@ -889,26 +1474,101 @@ def _collect_relevant_proofs(name, rule_entries, all_proofs):
     return proofs
 
 
-def _report_feature(name, info, all_features, all_proofs, project_root, role,
-                    global_anchors=None):
-    """Generate report lines for a single feature."""
-    lines = []
-    if global_anchors is None:
-        global_anchors = {}
+def _feature_coverage(project_root, name, info, all_features, all_proofs,
+                      global_anchors=None):
+    """Compute a feature's coverage: rule set, best proofs, counts, vhash,
+    receipt and status.
 
-    # Build combined rule set (own + required + global)
-    rule_entries, unresolved_requires = _build_coverage_rules(name, info, all_features, global_anchors)
+    Returns a dict consumed by the text report, the summary table, report
+    data and drift's proof_status, so all of them agree on one result.
+    """
+    rule_entries, unresolved_requires = _build_coverage_rules(
+        name, info, all_features, global_anchors
+    )
     proof_by_rule = _build_proof_lookup(name, rule_entries, all_proofs)
-    all_relevant_proofs = _collect_relevant_proofs(name, rule_entries, all_proofs)
+    relevant_proofs = _collect_relevant_proofs(name, rule_entries, all_proofs)
 
-    total = len(rule_entries)
-    deferred_count = sum(1 for _, _, _, is_def in rule_entries if is_def)
     active_entries = [(k, l, s) for k, l, s, is_def in rule_entries if not is_def]
     active_total = len(active_entries)
     proved = sum(1 for key, _, _ in active_entries
                  if proof_by_rule.get(key, {}).get('status') == 'pass')
+    failing = [key for key, _, _ in active_entries
+               if proof_by_rule.get(key, {}).get('status') == 'fail']
 
+    # vhash is only meaningful once every active rule has a passing proof
     all_proved_passing = (proved == active_total and active_total > 0)
+    vhash = None
+    if all_proved_passing:
+        vhash = _compute_vhash({key: True for key, _, _ in active_entries}, relevant_proofs)
+
+    receipt = _read_receipt(project_root, name)
+    has_current_receipt = (
+        vhash is not None and receipt is not None and receipt.get('vhash') == vhash
+    )
+
+    return {
+        'rule_entries': rule_entries,
+        'unresolved_requires': unresolved_requires,
+        'proof_by_rule': proof_by_rule,
+        'relevant_proofs': relevant_proofs,
+        'active_entries': active_entries,
+        'active_total': active_total,
+        'deferred_count': len(rule_entries) - active_total,
+        'proved': proved,
+        'failing': failing,
+        'all_proved_passing': all_proved_passing,
+        'vhash': vhash,
+        'receipt': receipt,
+        'has_current_receipt': has_current_receipt,
+        'status': _determine_status(proved, active_total, bool(failing), has_current_receipt),
+    }
+
+
+def _build_coverage_map(project_root, features, all_proofs, global_anchors, names=None):
+    """Compute _feature_coverage once for every spec in a request.
+
+    Features get global anchors applied; anchors are covered by their own
+    (and required) rules only. names limits the map to those specs.
+    """
+    coverage = {}
+    for name in (features if names is None else names):
+        _check_cancelled()
+        info = features[name]
+        coverage[name] = _feature_coverage(
+            project_root, name, info, features, all_proofs,
+            global_anchors if not info.get('is_anchor') else {},
+        )
+    return coverage
+
+
+def _report_feature(name, info, all_features, all_proofs, project_root, role,
+                    global_anchors=None, coverage=None, manual_staleness=None):
+    """Generate report lines for a single feature.
+
+    coverage is the feature's _feature_coverage result and manual_staleness
+    the request's _manual_staleness_map; each is computed here when the
+    caller has not already done so.
+    """
+    lines = []
+    if global_anchors is None:
+        global_anchors = {}
+    if coverage is None:
+        coverage = _feature_coverage(
+            project_root, name, info, all_features, all_proofs, global_anchors
+        )
+
+    # Combined rule set (own + required + global)
+    rule_entries = coverage['rule_entries']
+    unresolved_requires = coverage['unresolved_requires']
+    proof_by_rule = coverage['proof_by_rule']
+
+    total = len(rule_entries)
+    deferred_count = coverage['deferred_count']
+    active_entries = coverage['active_entries']
+    active_total = coverage['active_total']
+    proved = coverage['proved']
+
+    all_proved_passing = coverage['all_proved_passing']
 
     # Count assumed rules (own only)
     assumed_count = len(info.get('assumed_rules', set()))
@@ -952,13 +1612,9 @@ def _report_feature(name, info, all_features, all_proofs, project_root, role,
     # Header — all rules proved
     if all_proved_passing and not warnings:
         all_rules_dict = {key: True for key, _, _ in active_entries}
-        vhash = _compute_vhash(all_rules_dict, all_relevant_proofs)
-        receipt = _read_receipt(project_root, name)
-        has_current_receipt = (
-            proved == active_total
-            and receipt is not None
-            and receipt.get('vhash') == vhash
-        )
+        vhash = coverage['vhash']
+        receipt = coverage['receipt']
+        has_current_receipt = coverage['has_current_receipt']
 
         if has_current_receipt:
             header_status = "VERIFIED"
@@ -1055,8 +1711,10 @@ def _report_feature(name, info, all_features, all_proofs, project_root, role,
         elif manual:
             mp_id, mp_info = manual
             if mp_info.get('stamped'):
-                stale = _check_manual_staleness(
-                    project_root, info.get('scope', []), mp_info.get('commit_sha', '')
+                if manual_staleness is None:
+                    manual_staleness = _manual_staleness_map(project_root, [info])
+                stale = manual_staleness.get(
+                    (tuple(info.get('scope', [])), mp_info.get('commit_sha', '')), False
                 )
                 if stale:
                     lines.append(f"  {key}: MANUAL PROOF STALE ({mp_id}, verified {mp_info['date']}) ({label})")
@@ -1168,6 +1826,69 @@ def _get_plugin_docs_url():
     return None
 
 
+def _audit_index(project_root):
+    """Return the audit cache indexed for the status and dashboard paths.
+
+    {'by_feature': {feature: [entries]},
+     'by_proof': {(feature, proof_id): assessment},
+     'feature_audit': {feature: _build_feature_audit result},
+     'totals': {'strong', 'weak', 'hollow', 'manual': counts},
+     'latest_ts': newest cached_at or None}
+    Entries are deduplicated by (feature, proof_id), keeping the latest
+    cached_at; totals also count entries without a feature. Returns None
+    when there is no audit cache. The index is kept in the resident model
+    and rebuilt only when one of the cache files changes, so every caller
+    in a request (and in later requests) shares one load.
+    """
+    signatures = [(path, _stat_signature(path)) for path in _audit_cache_paths(project_root)]
+    key = ('audit_index', project_root)
+    hit = _RESIDENT.get(key)
+    if hit is not None and hit[0] == signatures:
+        return hit[1]
+
+    cache = _read_audit_cache(project_root)
+    if not cache:
+        index = None
+    else:
+        latest = {}  # (feature, proof_id) -> entry
+        for _key, entry in cache.items():
+            if not isinstance(entry, dict):
+                continue
+            dedup_key = (entry.get('feature', ''), entry.get('proof_id', ''))
+            existing = latest.get(dedup_key)
+            if existing is None or entry.get('cached_at', '') > existing.get('cached_at', ''):
+                latest[dedup_key] = entry
+
+        totals = {'strong': 0, 'weak': 0, 'hollow': 0, 'manual': 0}
+        latest_ts = None
+        by_feature = {}
+        by_proof = {}
+        for (feat, pid), entry in latest.items():
+            level = entry.get('assessment', '').lower()
+            if level in totals:
+                totals[level] += 1
+            ts = entry.get('cached_at')
+            if ts and (latest_ts is None or ts > latest_ts):
+                latest_ts = ts
+            if not feat:
+                continue
+            by_feature.setdefault(feat, []).append(entry)
+            if pid:
+                by_proof[(feat, pid)] = entry.get('assessment', '')
+        index = {
+            'by_feature': by_feature,
+            'by_proof': by_proof,
+            'feature_audit': {feat: _build_feature_audit(entries)
+                              for feat, entries in by_feature.items()},
+            'totals': totals,
+            'latest_ts': latest_ts,
+        }
+
+    if not any(sig is not None and _is_racy(sig) for _, sig in signatures):
+        _RESIDENT[key] = (signatures, index)
+    return index
+
+
 def _read_audit_cache_by_feature(project_root):
     """Read audit cache and group entries by feature name.
 
@@ -1175,35 +1896,8 @@ def _read_audit_cache_by_feature(project_root):
     Uses the 'feature' field that the audit skill stores in cache entries.
     Falls back to returning an empty dict if the cache doesn't exist or has no feature info.
     """
-    cache_path = os.path.join(project_root, '.purlin', 'cache', 'audit_cache.json')
-    if not os.path.isfile(cache_path):
-        return {}
-    try:
-        with open(cache_path) as f:
-            cache = json.load(f)
-    except (json.JSONDecodeError, IOError, OSError):
-        return {}
-    if not isinstance(cache, dict):
-        return {}
-
-    # Collect all entries, deduplicating by (feature, proof_id) — keep latest
-    latest = {}  # (feature, proof_id) -> entry
-    for _key, entry in cache.items():
-        if not isinstance(entry, dict):
-            continue
-        feat = entry.get('feature')
-        if not feat:
-            continue
-        pid = entry.get('proof_id', '')
-        dedup_key = (feat, pid)
-        existing = latest.get(dedup_key)
-        if existing is None or entry.get('cached_at', '') > existing.get('cached_at', ''):
-            latest[dedup_key] = entry
-
-    by_feature = {}
-    for (_feat, _pid), entry in latest.items():
-        by_feature.setdefault(_feat, []).append(entry)
-    return by_feature
+    index = _audit_index(project_root)
+    return index['by_feature'] if index else {}
 
 
 def _build_feature_audit(entries):
@@ -1282,197 +1976,175 @@ def _check_uncommitted_all(project_root):
     return files
 
 
-def _build_report_data(project_root, features, all_proofs, config, global_anchors,
-                       audit_summary=None):
-    """Build the structured PURLIN_DATA dict for the dashboard."""
-    audit_by_feature = _read_audit_cache_by_feature(project_root)
-    # Build per-proof audit lookup: (feature_name, proof_id) -> assessment
-    audit_by_proof = {}
-    for feat_name, entries in audit_by_feature.items():
-        for e in entries:
-            pid = e.get('proof_id', '')
-            if pid:
-                audit_by_proof[(feat_name, pid)] = e.get('assessment', '')
-    feature_list = []
-    summary = {'total_features': 0, 'verified': 0, 'passing': 0, 'partial': 0, 'failing': 0, 'untested': 0}
-    anchors_total = 0
-    anchors_with_source = 0
-    anchors_global = 0
-
-    for name in sorted(features.keys()):
-        info = features[name]
-        is_anchor = info.get('is_anchor', False)
-
-        if is_anchor:
-            anchors_total += 1
-            if info.get('source_url'):
-                anchors_with_source += 1
-            if info.get('is_global'):
-                anchors_global += 1
-
-        # Build combined rule set
-        ga = global_anchors if not is_anchor else {}
-        rule_entries, _ = _build_coverage_rules(name, info, features, ga)
-        proof_by_rule = _build_proof_lookup(name, rule_entries, all_proofs)
-        all_proofs_by_rule = _build_all_proofs_lookup(name, rule_entries, all_proofs)
-        all_relevant_proofs = _collect_relevant_proofs(name, rule_entries, all_proofs)
-
-        active_entries = [(k, l, s) for k, l, s, is_def in rule_entries if not is_def]
-        deferred_count = sum(1 for _, _, _, d in rule_entries if d)
-        active_total = len(active_entries)
-
-        has_fail = any(
-            proof_by_rule.get(key, {}).get('status') == 'fail'
-            for key, _, _ in active_entries
-        )
+def _audit_lookups(project_root):
+    """Return (per-feature audit block by feature, assessment by
+    (feature, proof id)) from the audit index."""
+    index = _audit_index(project_root)
+    if index is None:
+        return {}, {}
+    return index['feature_audit'], index['by_proof']
+
+
+def _report_feature_entry(name, info, cov, features, all_proofs, feature_audit,
+                          audit_by_proof, anchor_staleness):
+    """Build one feature's entry in PURLIN_DATA['features'] from its coverage."""
+    is_anchor = info.get('is_anchor', False)
+    rule_entries = cov['rule_entries']
+    proof_by_rule = cov['proof_by_rule']
+    all_proofs_by_rule = _build_all_proofs_lookup(name, rule_entries, all_proofs)
+    deferred_count = cov['deferred_count']
+    active_total = cov['active_total']
+    proved = cov['proved']
+    vhash = cov['vhash']
+
+    # Read receipt
+    receipt_data = None
+    receipt = cov['receipt']
+    if receipt:
+        receipt_data = {
+            'commit': receipt.get('commit', ''),
+            'timestamp': receipt.get('timestamp', ''),
+            'stale': not cov['has_current_receipt'],
+        }
 
-        # Compute vhash when ALL proofs pass
-        proved = sum(
-            1 for key, _, _ in active_entries
-            if proof_by_rule.get(key, {}).get('status') == 'pass'
-        )
-        vhash = None
-        all_proved_passing = (proved == active_total and active_total > 0)
-        if all_proved_passing:
-            all_rules_dict = {key: True for key, _, _ in active_entries}
-            vhash = _compute_vhash(all_rules_dict, all_relevant_proofs)
-
-        # Read receipt
-        receipt_data = None
-        receipt = _read_receipt(project_root, name)
-        if receipt:
-            receipt_data = {
-                'commit': receipt.get('commit', ''),
-                'timestamp': receipt.get('timestamp', ''),
-                'stale': receipt.get('vhash') != vhash if vhash else True,
-            }
+    # Determine status
+    status = cov['status']
 
-        # Determine status
-        has_current_receipt = (receipt_data is not None and not receipt_data['stale'])
-        status = _determine_status(proved, active_total, has_fail, has_current_receipt)
+    # Build per-rule list
+    rules_list = []
+    for key, label, src_feature, is_deferred in rule_entries:
+        if label == 'own':
+            rule_desc = info['rules'].get(key, '')
+        else:
+            bare_rule = key.split('/', 1)[1] if '/' in key else key
+            src_info = features.get(src_feature, {})
+            rule_desc = src_info.get('rules', {}).get(bare_rule, '')
 
-        # Update summary for non-anchor features
-        if not is_anchor:
-            summary['total_features'] += 1
-            if status == 'VERIFIED':
-                summary['verified'] += 1
-            elif status == 'PASSING':
-                summary['passing'] += 1
-            elif status == 'PARTIAL':
-                summary['partial'] += 1
-            elif status == 'FAILING':
-                summary['failing'] += 1
-            else:
-                summary['untested'] += 1
+        # Collect ALL proofs for this rule (not just the best one)
+        best_proof = proof_by_rule.get(key)
+        rule_proofs = all_proofs_by_rule.get(key, [])
 
-        # Build per-rule list
-        rules_list = []
-        for key, label, src_feature, is_deferred in rule_entries:
-            if label == 'own':
-                rule_desc = info['rules'].get(key, '')
-            else:
-                bare_rule = key.split('/', 1)[1] if '/' in key else key
-                src_info = features.get(src_feature, {})
-                rule_desc = src_info.get('rules', {}).get(bare_rule, '')
+        # Get proof descriptions from the source spec
+        if label == 'own':
+            src_info = info
+        else:
+            src_info = features.get(src_feature, {})
+        desc_by_id = src_info.get('proof_desc_by_id', {})
+
+        proofs_data = []
+        audit_feat = name if label == 'own' else src_feature
+        for p in rule_proofs:
+            pid = p.get('id', '')
+            proof_audit = audit_by_proof.get((audit_feat, pid), '')
+            if not proof_audit and label != 'own':
+                proof_audit = audit_by_proof.get((name, pid), '')
+            proofs_data.append({
+                'id': pid,
+                'description': desc_by_id.get(pid, ''),
+                'test_file': p.get('test_file', ''),
+                'test_name': p.get('test_name', ''),
+                'tier': p.get('tier', 'unit'),
+                'status': p.get('status', ''),
+                'audit': proof_audit,
+            })
 
-            # Collect ALL proofs for this rule (not just the best one)
-            best_proof = proof_by_rule.get(key)
-            rule_proofs = all_proofs_by_rule.get(key, [])
+        # Planned proofs: spec PROOF-N entries with no executed result.
+        # Display-only — never affects proved/total, vhash, or status.
+        bare_rule = key.split('/', 1)[1] if '/' in key else key
+        executed_ids = {p['id'] for p in proofs_data}
+        tier_by_id = src_info.get('proof_tier_by_id', {})
+        for pid in src_info.get('planned_proof_ids_by_rule', {}).get(bare_rule, []):
+            if pid in executed_ids:
+                continue
+            proofs_data.append({
+                'id': pid,
+                'description': desc_by_id.get(pid, ''),
+                'test_file': '',
+                'test_name': '',
+                'tier': tier_by_id.get(pid, 'unit'),
+                'status': 'planned',
+                'audit': '',
+            })
 
-            # Get proof descriptions from the source spec
-            if label == 'own':
-                src_info = info
-            else:
-                src_info = features.get(src_feature, {})
-            desc_by_id = src_info.get('proof_desc_by_id', {})
-
-            proofs_data = []
-            audit_feat = name if label == 'own' else src_feature
-            for p in rule_proofs:
-                pid = p.get('id', '')
-                proof_audit = audit_by_proof.get((audit_feat, pid), '')
-                if not proof_audit and label != 'own':
-                    proof_audit = audit_by_proof.get((name, pid), '')
-                proofs_data.append({
-                    'id': pid,
-                    'description': desc_by_id.get(pid, ''),
-                    'test_file': p.get('test_file', ''),
-                    'test_name': p.get('test_name', ''),
-                    'tier': p.get('tier', 'unit'),
-                    'status': p.get('status', ''),
-                    'audit': proof_audit,
-                })
+        if is_deferred:
+            rule_status = 'DEFERRED'
+        elif best_proof and best_proof.get('status') == 'pass':
+            rule_status = 'PASS'
+        elif best_proof and best_proof.get('status') == 'fail':
+            rule_status = 'FAIL'
+        else:
+            rule_status = 'NONE'
+
+        rules_list.append({
+            'id': key,
+            'description': rule_desc,
+            'label': label,
+            'source': src_feature if label != 'own' else None,
+            'is_deferred': is_deferred,
+            'is_assumed': label == 'own' and key in info.get('assumed_rules', set()),
+            'status': rule_status,
+            'proofs': proofs_data,
+        })
 
-            # Planned proofs: spec PROOF-N entries with no executed result.
-            # Display-only — never affects proved/total, vhash, or status.
-            bare_rule = key.split('/', 1)[1] if '/' in key else key
-            executed_ids = {p['id'] for p in proofs_data}
-            tier_by_id = src_info.get('proof_tier_by_id', {})
-            for pid in src_info.get('planned_proof_ids_by_rule', {}).get(bare_rule, []):
-                if pid in executed_ids:
-                    continue
-                proofs_data.append({
-                    'id': pid,
-                    'description': desc_by_id.get(pid, ''),
-                    'test_file': '',
-                    'test_name': '',
-                    'tier': tier_by_id.get(pid, 'unit'),
-                    'status': 'planned',
-                    'audit': '',
-                })
+    # Check external anchor staleness for report data
+    ext_status = None
+    if is_anchor and info.get('source_url'):
+        staleness = anchor_staleness.get((info['source_url'], info.get('pinned')))
+        if staleness:
+            ext_status = staleness.get('status')
 
-            if is_deferred:
-                rule_status = 'DEFERRED'
-            elif best_proof and best_proof.get('status') == 'pass':
-                rule_status = 'PASS'
-            elif best_proof and best_proof.get('status') == 'fail':
-                rule_status = 'FAIL'
-            else:
-                rule_status = 'NONE'
+    return {
+        'name': name,
+        'category': info.get('category', ''),
+        'type': 'anchor' if is_anchor else 'feature',
+        'is_global': info.get('is_global', False),
+        'source_url': info.get('source_url'),
+        'pinned': info.get('pinned'),
+        'description': info.get('description'),
+        'source_path': info.get('source_path'),
+        'stack': info.get('stack'),
+        'ext_status': ext_status,
+        'proved': proved,
+        'total': active_total,
+        'deferred': deferred_count,
+        'status': status,
+        'vhash': vhash,
+        'receipt': receipt_data,
+        'rules': rules_list,
+        'audit': feature_audit.get(name),
+    }
 
-            rules_list.append({
-                'id': key,
-                'description': rule_desc,
-                'label': label,
-                'source': src_feature if label != 'own' else None,
-                'is_deferred': is_deferred,
-                'is_assumed': label == 'own' and key in info.get('assumed_rules', set()),
-                'status': rule_status,
-                'proofs': proofs_data,
-            })
 
-        # Check external anchor staleness for report data
-        ext_status = None
-        if is_anchor and info.get('source_url'):
-            staleness = _check_git_staleness(
-                info['source_url'], info.get('pinned'), project_root
-            )
-            if staleness:
-                ext_status = staleness.get('status')
-
-        feature_list.append({
-            'name': name,
-            'category': info.get('category', ''),
-            'type': 'anchor' if is_anchor else 'feature',
-            'is_global': info.get('is_global', False),
-            'source_url': info.get('source_url'),
-            'pinned': info.get('pinned'),
-            'description': info.get('description'),
-            'source_path': info.get('source_path'),
-            'stack': info.get('stack'),
-            'ext_status': ext_status,
-            'proved': proved,
-            'total': active_total,
-            'deferred': deferred_count,
-            'status': status,
-            'vhash': vhash,
-            'receipt': receipt_data,
-            'rules': rules_list,
-            'audit': _build_feature_audit(audit_by_feature.get(name, [])),
-        })
+def _report_summaries(feature_list):
+    """Return (summary, anchors_summary) counted over report feature entries."""
+    summary = {'total_features': 0, 'verified': 0, 'passing': 0, 'partial': 0, 'failing': 0, 'untested': 0}
+    anchors_summary = {'total': 0, 'with_source': 0, 'global': 0}
+    for entry in feature_list:
+        if entry['type'] == 'anchor':
+            anchors_summary['total'] += 1
+            if entry.get('source_url'):
+                anchors_summary['with_source'] += 1
+            if entry.get('is_global'):
+                anchors_summary['global'] += 1
+            continue
+        summary['total_features'] += 1
+        status = entry['status']
+        if status == 'VERIFIED':
+            summary['verified'] += 1
+        elif status == 'PASSING':
+            summary['passing'] += 1
+        elif status == 'PARTIAL':
+            summary['partial'] += 1
+        elif status == 'FAILING':
+            summary['failing'] += 1
+        else:
+            summary['untested'] += 1
+    return summary, anchors_summary
 
-    uncommitted_files = _check_uncommitted_all(project_root)
 
+def _report_payload(project_root, config, feature_list, audit_summary, uncommitted):
+    """Assemble the PURLIN_DATA dict around a sorted feature entry list."""
+    summary, anchors_summary = _report_summaries(feature_list)
     return {
         'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
         'project': os.path.basename(os.path.abspath(project_root)),
@@ -1480,45 +2152,332 @@ def _build_report_data(project_root, features, all_proofs, config, global_anchor
         'docs_url': _get_plugin_docs_url(),
         'summary': summary,
         'features': feature_list,
-        'anchors_summary': {
-            'total': anchors_total,
-            'with_source': anchors_with_source,
-            'global': anchors_global,
-        },
+        'anchors_summary': anchors_summary,
         'audit_summary': audit_summary,
         'drift': None,
-        'uncommitted': uncommitted_files,
+        'uncommitted': uncommitted,
+    }
+
+
+def _build_report_data(project_root, features, all_proofs, config, global_anchors,
+                       audit_summary=None, coverage=None, uncommitted=None):
+    """Build the structured PURLIN_DATA dict for the dashboard.
+
+    coverage is the request's _build_coverage_map result and uncommitted the
+    `git status --porcelain` file list; each is computed here when not
+    supplied.
+    """
+    if coverage is None:
+        coverage = _build_coverage_map(project_root, features, all_proofs, global_anchors)
+    feature_audit, audit_by_proof = _audit_lookups(project_root)
+    anchor_staleness = _external_anchor_staleness(project_root, features)
+    feature_list = [
+        _report_feature_entry(name, features[name], coverage[name], features, all_proofs,
+                              feature_audit, audit_by_proof, anchor_staleness)
+        for name in sorted(features.keys())
+    ]
+    if uncommitted is None:
+        uncommitted = _check_uncommitted_all(project_root)
+    return _report_payload(project_root, config, feature_list, audit_summary, uncommitted)
+
+
+def _patch_report_data(project_root, previous, affected, features, all_proofs, config,
+                       global_anchors, audit_summary=None, coverage=None,
+                       uncommitted=None):
+    """Build PURLIN_DATA by rebuilding only the `affected` feature entries of
+    a previous payload. Every other entry is carried over unchanged, so the
+    result equals a full _build_report_data whenever `affected` covers every
+    feature whose inputs changed (see _report_changes)."""
+    coverage = dict(coverage or {})
+    coverage.update(_build_coverage_map(
+        project_root, features, all_proofs, global_anchors,
+        names=[name for name in affected if name not in coverage]))
+    feature_audit, audit_by_proof = _audit_lookups(project_root)
+    anchor_staleness = _external_anchor_staleness(
+        project_root, {name: features[name] for name in affected})
+    entries = {entry['name']: entry for entry in previous['features']}
+    for name in affected:
+        entries[name] = _report_feature_entry(
+            name, features[name], coverage[name], features, all_proofs,
+            feature_audit, audit_by_proof, anchor_staleness)
+    feature_list = [entries[name] for name in sorted(features.keys())]
+    if uncommitted is None:
+        uncommitted = _check_uncommitted_all(project_root)
+    return _report_payload(project_root, config, feature_list, audit_summary, uncommitted)
+
+
+_REPORT_DATA_PREFIX = 'const PURLIN_DATA = '
+_REPORT_HEAD_RE = re.compile(r'"fingerprint":"([0-9a-f]+)","timestamp":"([^"]+)"')
+# The dashboard flags data older than an hour; an unchanged report is
+# re-stamped (not rebuilt) once its timestamp is this old.
+_REPORT_RESTAMP_SECONDS = 30 * 60
+
+
+def _report_inputs(project_root):
+    """Return {relative path: stat signature} for every report input file:
+    specs, proof files, receipts, and the audit cache when present."""
+    tree = _spec_tree(project_root)
+    paths = tree['specs'] + tree['proofs'] + sorted(
+        p for receipts in tree['receipts'].values() for p in receipts
+    )
+    paths.extend(_audit_cache_paths(project_root))
+    inputs = {}
+    for path in paths:
+        signature = _stat_signature(path)
+        if signature is not None:
+            inputs[os.path.relpath(path, project_root)] = signature
+    return inputs
+
+
+def _anchor_window(project_root, features):
+    """Current anchor_staleness_ttl window when any anchor has a git
+    > Source:, so remote staleness is re-checked as often as the anchor cache
+    allows; None otherwise."""
+    if any(info.get('is_anchor') and info.get('source_url')
+           and _is_git_source(info['source_url']) for info in features.values()):
+        ttl = _anchor_staleness_ttl(project_root)
+        return int(time.time() // ttl) if ttl else time.time_ns()
+    return None
+
+
+def _report_fingerprint(project_root, features, config, uncommitted,
+                        drift_data=None, git_sha=None, inputs=None):
+    """Fingerprint every input of report-data.js.
+
+    Covers the stat signatures of all specs, proof files, receipts and the
+    audit cache (inputs, from _report_inputs when not supplied), HEAD, the
+    resolved config, the uncommitted file list, the drift data and git SHA
+    when supplied, and the anchor window. A file changed within the racy
+    window makes the fingerprint unique, forcing a rewrite.
+    """
+    if inputs is None:
+        inputs = _report_inputs(project_root)
+    racy = any(_is_racy(signature) for signature in inputs.values())
+    head = _run_git_lines(project_root, ['rev-parse', 'HEAD'], timeout=5)
+
+    payload = json.dumps({
+        'inputs': inputs,
+        'head': head[0].strip() if head else None,
+        'config': config,
+        # The report file itself shows up here once written; ignore it
+        'uncommitted': [f for f in uncommitted if not f.endswith('.purlin/report-data.js')],
+        'drift': drift_data,
+        'git_sha': git_sha,
+        'anchor_window': _anchor_window(project_root, features),
+        'racy': time.time_ns() if racy else None,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+# The incremental-digest state lives in the gitignored cache rather than in
+# the committed report-data.js: its stat signatures and drift base are
+# specific to one checkout. It names the report fingerprint it was written
+# with, so a report-data.js pulled from elsewhere is never patched with it.
+_REPORT_STATE_FILE = 'report_state.json'
+# Bump when the shape of the state changes; older states are ignored and
+# the next digest is rebuilt in full.
+_REPORT_STATE_VERSION = 2
+
+
+def _report_state(project_root, features, config, inputs, drift_base=None):
+    """What a later digest needs to patch this report instead of rebuilding it.
+
+    Racy signatures are recorded as None so they never compare equal.
+    proof_features lists the features each proof file held, so a feature
+    whose entries are later removed from a file is still found affected.
+    """
+    proof_features = {}
+    for path in inputs:
+        if _PROOF_FILE_RE.match(os.path.basename(path)):
+            data = _read_json_resident(os.path.join(project_root, path))
+            if isinstance(data, dict):
+                proof_features[path] = sorted({e.get('feature', '') for e in data.get('proofs', [])
+                                               if isinstance(e, dict)} - {''})
+    return {
+        'version': _REPORT_STATE_VERSION,
+        'inputs': {path: None if _is_racy(signature) else signature
+                   for path, signature in inputs.items()},
+        'proof_features': proof_features,
+        'config': hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16],
+        'anchor_window': _anchor_window(project_root, features),
+        'drift_base': drift_base,
     }
 
 
+def _load_report_state(project_root, previous):
+    """The cached state of the digest in `previous`, or None when the cache
+    is missing, outdated, or was written for a different report."""
+    state = _load_cache_json(project_root, _REPORT_STATE_FILE, _REPORT_STATE_VERSION)
+    if state is None or not isinstance(previous, dict):
+        return None
+    if state.get('fingerprint') != previous.get('fingerprint'):
+        return None
+    return state
+
+
+def _report_changes(project_root, previous, state, features, config, inputs, staged=()):
+    """Features whose report entries must be rebuilt to bring a previous
+    PURLIN_DATA up to date, or None when it needs a full rebuild.
+
+    A feature is affected when its spec, proof file or receipt is staged or
+    its stat signature differs from the one recorded in the previous state
+    (from _load_report_state), and so is every feature that requires an
+    affected one. For a changed proof file that covers the features it
+    holds now and those it held before. Changes that reach every feature —
+    config, the audit cache, the anchor window, a global anchor, or specs
+    added or removed — return None.
+    """
+    if not isinstance(state, dict) or state.get('version') != _REPORT_STATE_VERSION:
+        return None
+    current = _report_state(project_root, features, config, inputs)
+    if (state.get('config') != current['config']
+            or state.get('anchor_window') != current['anchor_window']):
+        return None
+    old = state.get('inputs') or {}
+    if {p for p in old if p.endswith('.md')} != {p for p in inputs if p.endswith('.md')}:
+        return None
+
+    changed = {p for p in set(old) | set(inputs) if old.get(p) is None or old[p] != inputs.get(p)}
+    changed.update(p for p in staged or () if p in old or p in inputs)
+    audit_paths = {os.path.relpath(_cache_path(project_root, _AUDIT_CACHE_FILE), project_root)}
+    audit_dir = os.path.relpath(_cache_path(project_root, _AUDIT_SHARD_DIR), project_root)
+    if any(p in audit_paths or p.startswith(audit_dir + os.sep) for p in changed):
+        return None
+
+    affected = set()
+    for path in changed:
+        basename = os.path.basename(path)
+        if basename.endswith('.md'):
+            affected.add(basename[:-3])
+        elif basename.endswith('.receipt.json'):
+            affected.add(basename[:-len('.receipt.json')])
+        else:
+            m = _PROOF_FILE_RE.match(basename)
+            if m:
+                affected.add(m.group(1))
+                affected.update((state.get('proof_features') or {}).get(path, ()))
+                affected.update(current['proof_features'].get(path, ()))
+    affected &= set(features)
+    was_global = {entry.get('name') for entry in previous.get('features', [])
+                  if entry.get('type') == 'anchor' and entry.get('is_global')}
+    if any(name in was_global or (features[name].get('is_anchor')
+                                  and features[name].get('is_global'))
+           for name in affected):
+        return None
+    affected.update(name for name, info in features.items()
+                    if affected.intersection(info.get('requires', [])))
+    return affected
+
+
+def _read_report_head(data_path):
+    """Return (fingerprint, timestamp) from the head of report-data.js, or None."""
+    try:
+        with open(data_path, 'r') as f:
+            head = f.read(len(_REPORT_DATA_PREFIX) + 128)
+    except (IOError, OSError, UnicodeDecodeError):
+        return None
+    if not head.startswith(_REPORT_DATA_PREFIX):
+        return None
+    m = _REPORT_HEAD_RE.match(head, len(_REPORT_DATA_PREFIX) + 1)
+    return (m.group(1), m.group(2)) if m else None
+
+
+def _read_report_data(data_path):
+    """Return the PURLIN_DATA dict stored in report-data.js, or None."""
+    try:
+        with open(data_path, 'r') as f:
+            content = f.read()
+    except (IOError, OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith(_REPORT_DATA_PREFIX):
+        return None
+    try:
+        data = json.loads(content[len(_REPORT_DATA_PREFIX):].rstrip().rstrip(';'))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _restamp_report_data(data_path, old_timestamp):
+    """Refresh the timestamp of an unchanged report-data.js in place."""
+    try:
+        with open(data_path, 'r') as f:
+            content = f.read()
+    except (IOError, OSError, UnicodeDecodeError):
+        return False
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    content = content.replace(f'"timestamp":"{old_timestamp}"', f'"timestamp":"{now}"', 1)
+    return _replace_file(data_path, lambda f: f.write(content))
+
+
 def _write_report_data(project_root, features, all_proofs, config, global_anchors,
-                       audit_summary=None, drift_data=None, git_sha=None):
-    """Write .purlin/report-data.js for the dashboard. Returns the file path or None."""
+                       audit_summary=None, drift_data=None, git_sha=None,
+                       coverage=None, inputs=None, drift_base=None,
+                       previous=None, affected=None):
+    """Write .purlin/report-data.js for the dashboard. Returns the file path or None.
+
+    The payload starts with a fingerprint of its inputs. When the existing
+    file already carries the current fingerprint, nothing is rebuilt; the
+    file is only re-stamped once its timestamp is older than
+    _REPORT_RESTAMP_SECONDS so the dashboard does not report it as stale.
+
+    With a previous payload and its `affected` feature set (from
+    _report_changes), only those feature entries are rebuilt. What a later
+    digest needs to do the same is saved to the cache (see _report_state).
+    """
     purlin_dir = os.path.join(project_root, '.purlin')
     if not os.path.isdir(purlin_dir):
         return None
+    data_path = os.path.join(purlin_dir, 'report-data.js')
 
-    data = _build_report_data(
-        project_root, features, all_proofs, config, global_anchors, audit_summary
+    if inputs is None:
+        inputs = _report_inputs(project_root)
+    uncommitted = _check_uncommitted_all(project_root)
+    fingerprint = _report_fingerprint(
+        project_root, features, config, uncommitted,
+        drift_data=drift_data, git_sha=git_sha, inputs=inputs,
     )
+    previous_head = _read_report_head(data_path)
+    if previous_head and previous_head[0] == fingerprint:
+        try:
+            written = datetime.datetime.fromisoformat(previous_head[1])
+            age = (datetime.datetime.now(datetime.timezone.utc) - written).total_seconds()
+        except (TypeError, ValueError):
+            age = None
+        if age is None or age >= _REPORT_RESTAMP_SECONDS:
+            _restamp_report_data(data_path, previous_head[1])
+        return data_path
+
+    # fingerprint and timestamp lead the payload so _read_report_head can
+    # find them without parsing the whole file
+    if previous is not None and affected is not None:
+        report = _patch_report_data(
+            project_root, previous, affected, features, all_proofs, config,
+            global_anchors, audit_summary, coverage=coverage, uncommitted=uncommitted,
+        )
+    else:
+        report = _build_report_data(
+            project_root, features, all_proofs, config, global_anchors, audit_summary,
+            coverage=coverage, uncommitted=uncommitted,
+        )
+    data = {'fingerprint': fingerprint, 'timestamp': report.pop('timestamp')}
+    data.update(report)
     if drift_data is not None:
         data['drift'] = drift_data
     if git_sha:
         data['git_sha'] = git_sha
-    data_path = os.path.join(purlin_dir, 'report-data.js')
 
-    tmp_path = data_path + '.tmp'
-    try:
-        with open(tmp_path, 'w') as f:
-            f.write('const PURLIN_DATA = ')
-            json.dump(data, f, separators=(',', ':'))
-            f.write(';\n')
-        os.replace(tmp_path, data_path)
-        return data_path
-    except (IOError, OSError):
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    def write(f):
+        f.write(_REPORT_DATA_PREFIX)
+        json.dump(data, f, separators=(',', ':'))
+        f.write(';\n')
+    if not _replace_file(data_path, write):
         return None
+    state = _report_state(project_root, features, config, inputs, drift_base)
+    state['fingerprint'] = fingerprint
+    _write_cache_json(project_root, _REPORT_STATE_FILE, state)
+    return data_path
 
 
 # ---------------------------------------------------------------------------
@@ -1616,35 +2575,78 @@ def _resolve_since_anchor(project_root, since_arg=None):
     })
 
 
-def _get_diff_stat(project_root, since_ref, filepath):
-    """Get +/- line counts for a single file."""
+def _get_diff_stats(project_root, since_ref, paths=None):
+    """Get changed files and their +/- line counts for since_ref..HEAD.
+
+    One `git diff --numstat` call covers the whole range, or only the given
+    paths. Returns a list of (path, diff_stat) in git's path order; empty on
+    any git error.
+    """
     try:
         r = subprocess.run(
-            ['git', 'diff', '--numstat', since_ref + '..HEAD', '--', filepath],
-            capture_output=True, text=True, cwd=project_root, timeout=5,
+            ['git', 'diff', '--numstat', '-z', '--no-renames', since_ref + '..HEAD']
+            + (['--', *(':(literal)' + p for p in paths)] if paths else []),
+            capture_output=True, text=True, cwd=project_root, timeout=30,
         )
-        if r.returncode == 0 and r.stdout.strip():
-            parts = r.stdout.strip().split('\t')
-            if len(parts) >= 2:
-                return f'+{parts[0]} -{parts[1]}'
     except (subprocess.SubprocessError, OSError):
-        pass
-    return ''
+        return []
+    if r.returncode != 0:
+        return []
+    stats = []
+    for record in r.stdout.split('\0'):
+        parts = record.split('\t', 2)
+        if len(parts) == 3 and parts[2]:
+            stats.append((parts[2], f'+{parts[0]} -{parts[1]}'))
+    return stats
+
+
+def _split_diff_by_file(diff_text, paths):
+    """Split unified diff output into {path: diff text} for the given paths."""
+    headers = {f'diff --git a/{p} b/{p}': p for p in paths}
+    by_path = {}
+    current = None
+    for line in diff_text.splitlines():
+        if line.startswith('diff --git '):
+            current = headers.get(line)
+            if current is not None:
+                by_path[current] = []
+            continue
+        if current is not None:
+            by_path[current].append(line)
+    return {p: '\n'.join(lines) for p, lines in by_path.items()}
+
+
+def _git_diff_text(project_root, since_ref, paths):
+    """Run `git diff since_ref..HEAD -- paths`; returns '' on error."""
+    try:
+        r = subprocess.run(
+            ['git', '-c', 'core.quotePath=false', 'diff', '--no-renames',
+             since_ref + '..HEAD', '--'] + list(paths),
+            capture_output=True, text=True, cwd=project_root, timeout=30,
+        )
+        return r.stdout if r.returncode == 0 else ''
+    except (subprocess.SubprocessError, OSError):
+        return ''
 
 
 def _detect_spec_changes(project_root, since_ref, spec_files_in_diff):
-    """For changed spec files, detect new/removed rules."""
+    """For changed spec files, detect new/removed rules.
+
+    All spec diffs come from one `git diff` call, split per file in-process.
+    A path whose diff header git had to quote is fetched on its own.
+    """
+    diffs = {}
+    if spec_files_in_diff:
+        diffs = _split_diff_by_file(
+            _git_diff_text(project_root, since_ref, spec_files_in_diff),
+            spec_files_in_diff,
+        )
     changes = []
     for spec_path in spec_files_in_diff:
         feature_name = os.path.splitext(os.path.basename(spec_path))[0]
-        try:
-            r = subprocess.run(
-                ['git', 'diff', since_ref + '..HEAD', '--', spec_path],
-                capture_output=True, text=True, cwd=project_root, timeout=5,
-            )
-            diff_text = r.stdout if r.returncode == 0 else ''
-        except (subprocess.SubprocessError, OSError):
-            diff_text = ''
+        diff_text = diffs.get(spec_path)
+        if diff_text is None:
+            diff_text = _git_diff_text(project_root, since_ref, [spec_path])
 
         new_rules = []
         removed_rules = []
@@ -1669,6 +2671,130 @@ def _detect_spec_changes(project_root, since_ref, spec_files_in_diff):
     return changes
 
 
+_ANCHOR_STALENESS_FILE = 'anchor_staleness.json'
+_ANCHOR_STALENESS_VERSION = 1
+_DEFAULT_ANCHOR_STALENESS_TTL = 900  # seconds; config key: anchor_staleness_ttl
+_LS_REMOTE_WORKERS = 8
+
+
+def _is_git_source(source_url):
+    """True when an anchor's > Source: is something git ls-remote can reach."""
+    return (source_url.startswith('git@') or source_url.endswith('.git')
+            or 'github.com' in source_url or 'gitlab.com' in source_url
+            or _is_local_source(source_url))
+
+
+def _is_local_source(source_url):
+    """True for a local repository path (cheap to query, never TTL-cached)."""
+    return source_url.startswith('/') or source_url.startswith('.')
+
+
+def _ls_remote_head(source_url, project_root=None):
+    """Return {'remote_sha': sha} or {'error': message} for a source's HEAD."""
+    try:
+        result = subprocess.run(
+            ['git', 'ls-remote', source_url, 'HEAD'],
+            capture_output=True, text=True, timeout=10,
+            cwd=project_root or '.',
+        )
+    except subprocess.TimeoutExpired:
+        return {'error': 'Timeout reaching remote'}
+    except (subprocess.SubprocessError, OSError) as e:
+        return {'error': str(e)[:200]}
+    if result.returncode != 0:
+        return {'error': result.stderr.strip()[:200]}
+    lines = result.stdout.strip().splitlines()
+    if not lines:
+        return {'error': 'No HEAD ref returned'}
+    return {'remote_sha': lines[0].split('\t')[0]}
+
+
+def _anchor_staleness_ttl(project_root):
+    """Seconds a remote HEAD lookup stays cached (0 disables the cache)."""
+    try:
+        ttl = float(resolve_config(project_root).get(
+            'anchor_staleness_ttl', _DEFAULT_ANCHOR_STALENESS_TTL))
+    except (TypeError, ValueError):
+        ttl = _DEFAULT_ANCHOR_STALENESS_TTL
+    return max(ttl, 0)
+
+
+def _check_anchors_staleness(project_root, anchors):
+    """Compare pinned SHAs to remote HEAD for many git-sourced anchors at once.
+
+    anchors is an iterable of (source_url, pinned) pairs. Each distinct
+    source URL is queried once, all of them concurrently. Successful remote
+    lookups are cached in .purlin/cache/anchor_staleness.json for the
+    configured anchor_staleness_ttl; local repository paths are always
+    re-queried. Returns {(source_url, pinned): result} with results shaped
+    as _check_git_staleness documents.
+    """
+    anchors = [(url, pinned) for url, pinned in anchors if url]
+    urls = sorted({url for url, pinned in anchors if pinned and _is_git_source(url)})
+
+    ttl = _anchor_staleness_ttl(project_root) if project_root else 0
+    now = time.time()
+    cache = None
+    if ttl:
+        cache = _load_cache_json(project_root, _ANCHOR_STALENESS_FILE,
+                                 _ANCHOR_STALENESS_VERSION)
+    cached = cache.get('entries', {}) if cache else {}
+
+    heads = {}
+    to_query = []
+    for url in urls:
+        entry = cached.get(url)
+        if (entry and not _is_local_source(url)
+                and 0 <= now - entry.get('checked_at', 0) < ttl):
+            heads[url] = {'remote_sha': entry.get('remote_sha')}
+        else:
+            to_query.append(url)
+
+    if to_query:
+        workers = min(_LS_REMOTE_WORKERS, len(to_query))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for url, head in zip(to_query, pool.map(
+                    lambda u: _ls_remote_head(u, project_root), to_query)):
+                heads[url] = head
+
+        if ttl:
+            entries = {url: e for url, e in cached.items()
+                       if 0 <= now - e.get('checked_at', 0) < ttl}
+            for url in to_query:
+                if heads[url].get('remote_sha') and not _is_local_source(url):
+                    entries[url] = {'remote_sha': heads[url]['remote_sha'], 'checked_at': now}
+            _write_cache_json(project_root, _ANCHOR_STALENESS_FILE, {
+                'version': _ANCHOR_STALENESS_VERSION,
+                'entries': entries,
+            })
+
+    results = {}
+    for url, pinned in anchors:
+        if not _is_git_source(url):
+            results[(url, pinned)] = None
+        elif not pinned:
+            results[(url, pinned)] = {'status': 'unpinned', 'remote_sha': None}
+        elif 'error' in heads[url]:
+            results[(url, pinned)] = {'status': 'error', 'remote_sha': None,
+                                      'error': heads[url]['error']}
+        else:
+            remote_sha = heads[url]['remote_sha']
+            if remote_sha.startswith(pinned) or pinned.startswith(remote_sha):
+                results[(url, pinned)] = {'status': 'current', 'remote_sha': remote_sha}
+            else:
+                results[(url, pinned)] = {'status': 'stale', 'remote_sha': remote_sha}
+    return results
+
+
+def _external_anchor_staleness(project_root, features):
+    """Run _check_anchors_staleness for every anchor with a > Source:."""
+    return _check_anchors_staleness(project_root, [
+        (info['source_url'], info.get('pinned'))
+        for info in features.values()
+        if info.get('is_anchor') and info.get('source_url')
+    ])
+
+
 def _check_git_staleness(source_url, pinned, project_root=None):
     """Compare pinned SHA to remote HEAD for git-sourced anchors.
 
@@ -1677,41 +2803,84 @@ def _check_git_staleness(source_url, pinned, project_root=None):
     """
     if not source_url:
         return None
-    is_git = (source_url.startswith('git@') or source_url.endswith('.git')
-              or 'github.com' in source_url or 'gitlab.com' in source_url
-              or source_url.startswith('/') or source_url.startswith('.'))
-    if not is_git:
-        return None
-    if not pinned:
-        return {'status': 'unpinned', 'remote_sha': None}
+    return _check_anchors_staleness(project_root, [(source_url, pinned)])[(source_url, pinned)]
+
+
+def _scope_to_specs(features):
+    """Map each > Scope: entry to the specs that list it."""
+    scope_to_specs = {}  # source_file → [spec_names]
+    for name, info in features.items():
+        for scope_file in info.get('scope', []):
+            scope_to_specs.setdefault(scope_file, []).append(name)
+    return scope_to_specs
+
+
+def _specs_for_path(filepath, scope_to_specs):
+    """Specs whose scope covers filepath: an exact scope entry, else the
+    first directory entry (trailing `/`) containing it."""
+    matched_specs = scope_to_specs.get(filepath, [])
+    if not matched_specs:
+        for scope_path, specs in scope_to_specs.items():
+            if scope_path.endswith('/') and filepath.startswith(scope_path):
+                return specs
+    return matched_specs
+
+
+def _is_test_path(filepath):
+    """True for test sources (not proof files), by drift's test patterns."""
+    return '.proofs-' not in filepath and any(p in filepath for p in _TEST_PATTERNS)
+
+
+def _is_no_impact_path(filepath):
+    """True for docs, config and asset files drift classifies as NO_IMPACT."""
+    is_behavioral_md = any(filepath.startswith(d) for d in _BEHAVIORAL_MD_PREFIXES)
+    if is_behavioral_md:
+        return False
+    return filepath.endswith('.md') or any(
+        filepath.startswith(p) or filepath == p or filepath.endswith(p)
+        for p in _NO_IMPACT_PATTERNS)
+
+
+def _git_oneline_log(project_root, rev_range):
+    """`git log --oneline rev_range` as a list of lines; [] on error."""
     try:
-        result = subprocess.run(
-            ['git', 'ls-remote', source_url, 'HEAD'],
-            capture_output=True, text=True, timeout=10,
-            cwd=project_root or '.',
+        r = subprocess.run(
+            ['git', 'log', '--oneline', rev_range],
+            capture_output=True, text=True, cwd=project_root, timeout=10,
         )
-        if result.returncode != 0:
-            return {'status': 'error', 'remote_sha': None,
-                    'error': result.stderr.strip()[:200]}
-        lines = result.stdout.strip().splitlines()
-        if not lines:
-            return {'status': 'error', 'remote_sha': None,
-                    'error': 'No HEAD ref returned'}
-        remote_sha = lines[0].split('\t')[0]
-        if remote_sha.startswith(pinned) or pinned.startswith(remote_sha):
-            return {'status': 'current', 'remote_sha': remote_sha}
-        return {'status': 'stale', 'remote_sha': remote_sha}
-    except subprocess.TimeoutExpired:
-        return {'status': 'error', 'remote_sha': None, 'error': 'Timeout reaching remote'}
-    except (subprocess.SubprocessError, OSError) as e:
-        return {'status': 'error', 'remote_sha': None, 'error': str(e)[:200]}
+        return [l.strip() for l in r.stdout.strip().splitlines() if l.strip()] \
+            if r.returncode == 0 else []
+    except (subprocess.SubprocessError, OSError):
+        return []
+
+
+def _resolve_commit(project_root, ref):
+    """Full SHA of ref, or None when it does not name a commit."""
+    lines = _run_git_lines(project_root, ['rev-parse', '--verify', '-q', ref + '^{commit}'],
+                           timeout=5)
+    return lines[0].strip() if lines else None
+
 
+# Past this many files committed since the previous digest, drift re-reads
+# the whole range rather than passing every path to git.
+_DRIFT_INCREMENTAL_MAX_FILES = 500
 
-def _compute_drift(project_root, since=None):
+
+def _compute_drift(project_root, since=None, previous=None, coverage=None,
+                   unchanged=(), base=None):
     """Compute drift data as a Python dict.
 
     Returns a dict with drift results, or a dict with 'recommendation' key
     if no verification anchor could be resolved.
+
+    Digest generation passes the previous digest's drift and base as
+    previous=(drift, base). When the since commit is unchanged and the
+    previous HEAD is an ancestor of HEAD, only commits and files in
+    previous-HEAD..HEAD are read from git and only their spec diffs are
+    re-parsed; proof_status of features named in `unchanged` is carried
+    over. coverage is an optional {name: _feature_coverage result} to reuse.
+    When base is a dict it is filled with what the next digest needs:
+    HEAD, the since commit and the range's numstat.
     """
     since_ref, since_desc = _resolve_since_anchor(project_root, since)
 
@@ -1719,40 +2888,58 @@ def _compute_drift(project_root, since=None):
     if since_ref is None:
         return json.loads(since_desc)  # recommendation dict
 
-    # Gather commits
-    try:
-        r = subprocess.run(
-            ['git', 'log', '--oneline', since_ref + '..HEAD'],
-            capture_output=True, text=True, cwd=project_root, timeout=10,
-        )
-        commits = [l.strip() for l in r.stdout.strip().splitlines() if l.strip()] \
-            if r.returncode == 0 else []
-    except (subprocess.SubprocessError, OSError):
-        commits = []
+    prev_drift, prev_base = previous or (None, None)
+    if not isinstance(prev_drift, dict) or 'files' not in prev_drift:
+        prev_drift = None
+    head = since_sha = None
+    if base is not None or previous:
+        head = _resolve_commit(project_root, 'HEAD')
+        since_sha = _resolve_commit(project_root, since_ref)
+    touched = None
+    if (prev_drift and isinstance(prev_base, dict) and since_sha and head
+            and prev_base.get('since') == since_sha and prev_base.get('head')
+            and isinstance(prev_base.get('stats'), list)
+            and _run_git_lines(project_root, ['merge-base', '--is-ancestor',
+                                              prev_base['head'], head], timeout=10) is not None):
+        touched = [path for path, _ in _get_diff_stats(project_root, prev_base['head'])]
+        if len(touched) > _DRIFT_INCREMENTAL_MAX_FILES:
+            touched = None
 
-    # Gather changed files
-    try:
-        r = subprocess.run(
-            ['git', 'diff', '--name-only', since_ref + '..HEAD'],
-            capture_output=True, text=True, cwd=project_root, timeout=10,
-        )
-        changed_files = [l.strip() for l in r.stdout.strip().splitlines() if l.strip()] \
-            if r.returncode == 0 else []
-    except (subprocess.SubprocessError, OSError):
-        changed_files = []
-
-    # Filter deleted files — only keep files that exist on disk
-    changed_files = [
-        f for f in changed_files
-        if os.path.exists(os.path.join(project_root, f))
-    ]
+    # Gather commits
+    _check_cancelled()
+    if touched is not None:
+        commits = _git_oneline_log(project_root, prev_base['head'] + '..HEAD') \
+            + prev_drift.get('commits', [])
+    else:
+        commits = _git_oneline_log(project_root, since_ref + '..HEAD')
+
+    # Gather changed files with their line counts in one git call (only
+    # the touched files when updating the previous digest's range);
+    # keep only files that still exist on disk (drops deletions)
+    _check_cancelled()
+    if touched is not None:
+        touched_set = set(touched)
+        range_stats = {path: stat for path, stat in prev_base['stats']
+                       if path not in touched_set}
+        if touched:
+            range_stats.update(_get_diff_stats(project_root, since_ref, touched))
+        range_stats = sorted(range_stats.items())
+    else:
+        range_stats = _get_diff_stats(project_root, since_ref)
+    if base is not None:
+        base.update({'head': head, 'since': since_sha,
+                     'stats': [list(item) for item in range_stats]})
+    diff_stats = {}
+    changed_files = []
+    for path, stat in range_stats:
+        if os.path.exists(os.path.join(project_root, path)):
+            changed_files.append(path)
+            diff_stats[path] = stat
 
     # Build scope map from specs
+    _check_cancelled()
     features = _scan_specs(project_root)
-    scope_to_specs = {}  # source_file → [spec_names]
-    for name, info in features.items():
-        for scope_file in info.get('scope', []):
-            scope_to_specs.setdefault(scope_file, []).append(name)
+    scope_to_specs = _scope_to_specs(features)
 
     # Classify each file
     file_entries = []
@@ -1767,7 +2954,7 @@ def _compute_drift(project_root, since=None):
                 'path': filepath,
                 'category': 'CHANGED_SPECS',
                 'spec': spec_name,
-                'diff_stat': _get_diff_stat(project_root, since_ref, filepath),
+                'diff_stat': diff_stats[filepath],
             })
             continue
 
@@ -1783,37 +2970,28 @@ def _compute_drift(project_root, since=None):
                 'path': filepath,
                 'category': 'TESTS_ADDED',
                 'spec': spec_name,
-                'diff_stat': _get_diff_stat(project_root, since_ref, filepath),
+                'diff_stat': diff_stats[filepath],
             })
             continue
 
         # Check scope map → CHANGED_BEHAVIOR (exact match then prefix match)
-        matched_specs = scope_to_specs.get(filepath, [])
-        if not matched_specs:
-            for scope_path, specs in scope_to_specs.items():
-                if scope_path.endswith('/') and filepath.startswith(scope_path):
-                    matched_specs = specs
-                    break
+        matched_specs = _specs_for_path(filepath, scope_to_specs)
         if matched_specs:
             file_entries.append({
                 'path': filepath,
                 'category': 'CHANGED_BEHAVIOR',
                 'spec': matched_specs[0],
-                'diff_stat': _get_diff_stat(project_root, since_ref, filepath),
+                'diff_stat': diff_stats[filepath],
             })
             continue
 
         # Docs/config/assets → NO_IMPACT (but not behavioral .md dirs)
-        is_behavioral_md = any(filepath.startswith(d) for d in _BEHAVIORAL_MD_PREFIXES)
-        is_no_impact = any(filepath.startswith(p) or filepath == p or filepath.endswith(p)
-                           for p in _NO_IMPACT_PATTERNS) and not is_behavioral_md
-        is_generic_md = filepath.endswith('.md') and not is_behavioral_md
-        if is_no_impact or is_generic_md:
+        if _is_no_impact_path(filepath):
             file_entries.append({
                 'path': filepath,
                 'category': 'NO_IMPACT',
                 'spec': None,
-                'diff_stat': _get_diff_stat(project_root, since_ref, filepath),
+                'diff_stat': diff_stats[filepath],
             })
             continue
 
@@ -1822,11 +3000,21 @@ def _compute_drift(project_root, since=None):
             'path': filepath,
             'category': 'NEW_BEHAVIOR',
             'spec': None,
-            'diff_stat': _get_diff_stat(project_root, since_ref, filepath),
+            'diff_stat': diff_stats[filepath],
         })
 
-    # Detect spec rule changes
-    spec_changes = _detect_spec_changes(project_root, since_ref, spec_files_in_diff)
+    # Detect spec rule changes, re-reading only touched specs' diffs when
+    # updating the previous digest's range
+    _check_cancelled()
+    if touched is not None:
+        kept = {c['spec']: c for c in prev_drift.get('spec_changes', [])}
+        stale = [p for p in spec_files_in_diff
+                 if p in touched_set or os.path.splitext(os.path.basename(p))[0] not in kept]
+        kept.update((c['spec'], c) for c in _detect_spec_changes(project_root, since_ref, stale))
+        spec_changes = [kept[os.path.splitext(os.path.basename(p))[0]]
+                        for p in spec_files_in_diff]
+    else:
+        spec_changes = _detect_spec_changes(project_root, since_ref, spec_files_in_diff)
 
     # Collect proof status per feature (including required + global rules)
     all_proofs = _read_proofs(project_root)
@@ -1834,33 +3022,27 @@ def _compute_drift(project_root, since=None):
         k: v for k, v in features.items()
         if v.get('is_anchor') and v.get('is_global')
     }
+    coverage = dict(coverage or {})
+    previous_status = prev_drift.get('proof_status', {}) if prev_drift else {}
     proof_status = {}
     for name, info in features.items():
         if info['is_anchor']:
             continue
-        rule_entries, _ = _build_coverage_rules(name, info, features, global_anchors)
-        total = len(rule_entries)
-        if total == 0:
+        if name in unchanged and prev_drift:
+            if name in previous_status:
+                proof_status[name] = previous_status[name]
             continue
-        deferred_count = sum(1 for _, _, _, is_def in rule_entries if is_def)
-        active_entries = [(k, l, s) for k, l, s, is_def in rule_entries if not is_def]
-        active_total = len(active_entries)
-        proof_by_rule = _build_proof_lookup(name, rule_entries, all_proofs)
-        proved = sum(1 for key, _, _ in active_entries
-                     if proof_by_rule.get(key, {}).get('status') == 'pass')
-        failing = [key for key, _, _ in active_entries
-                   if proof_by_rule.get(key, {}).get('status') == 'fail']
-        all_pass = (proved == active_total and active_total > 0)
-        d_receipt = _read_receipt(project_root, name)
-        d_has_receipt = False
-        if all_pass and d_receipt:
-            d_vhash = _compute_vhash(
-                {key: True for key, _, _ in active_entries},
-                _collect_relevant_proofs(name, rule_entries, all_proofs),
-            )
-            d_has_receipt = (d_receipt.get('vhash') == d_vhash)
-        has_fail = len(failing) > 0
-        status = _determine_status(proved, active_total, has_fail, d_has_receipt)
+        cov = coverage.get(name)
+        if cov is None:
+            cov = _feature_coverage(project_root, name, info, features, all_proofs, global_anchors)
+            coverage[name] = cov
+        if not cov['rule_entries']:
+            continue
+        deferred_count = cov['deferred_count']
+        proved = cov['proved']
+        active_total = cov['active_total']
+        failing = cov['failing']
+        status = cov['status']
         assumed_count = len(info.get('assumed_rules', set()))
         entry = {
             'proved': proved,
@@ -1920,12 +3102,12 @@ def _compute_drift(project_root, since=None):
 
     # Detect external anchor drift — compare Pinned to remote HEAD
     external_anchor_drift = []
+    _check_cancelled()
+    anchor_staleness = _external_anchor_staleness(project_root, features)
     for name, info in features.items():
         if not info.get('is_anchor') or not info.get('source_url'):
             continue
-        staleness = _check_git_staleness(
-            info['source_url'], info.get('pinned'), project_root
-        )
+        staleness = anchor_staleness.get((info['source_url'], info.get('pinned')))
         if staleness is None:
             continue
         if staleness['status'] == 'current':
@@ -1958,10 +3140,10 @@ def _compute_drift(project_root, since=None):
         ps = proof_status.get(spec_name, {})
         proof_by_rule = {}
         if not info['is_anchor']:
-            rule_entries, _ = _build_coverage_rules(
-                spec_name, info, features, global_anchors)
-            proof_by_rule = _build_proof_lookup(
-                spec_name, rule_entries, all_proofs)
+            if spec_name not in coverage:
+                coverage[spec_name] = _feature_coverage(
+                    project_root, spec_name, info, features, all_proofs, global_anchors)
+            proof_by_rule = coverage[spec_name]['proof_by_rule']
         changed_scope_files = [
             e['path'] for e in file_entries
             if e.get('spec') == spec_name
@@ -2004,7 +3186,7 @@ def drift(project_root, since=None, role=None):
     return json.dumps(result, indent=2)
 
 
-def generate_digest(project_root):
+def generate_digest(project_root, staged=None):
     """Generate the project digest file with coverage, drift, and git SHA.
 
     This is called by the pre-commit hook to produce .purlin/report-data.js
@@ -2012,6 +3194,13 @@ def generate_digest(project_root):
 
     IMPORTANT: Does NOT trigger a new audit. Uses cached audit data only.
     Runs sync_status internals (coverage scan) and drift.
+
+    staged is the list of paths staged for the commit being made. When it is
+    given and the cache holds a usable state for the existing report-data.js, the
+    digest is patched instead of rebuilt: only features whose inputs are
+    staged or changed since that digest (see _report_changes) get new
+    coverage and report entries, and drift only re-reads files committed
+    since that digest. Anything else falls back to a full rebuild.
     """
     config = resolve_config(project_root)
     if not config:
@@ -2042,19 +3231,170 @@ def generate_digest(project_root):
     except (subprocess.SubprocessError, OSError):
         pass
 
+    inputs = _report_inputs(project_root)
+    previous = state = affected = None
+    if staged is not None:
+        previous = _read_report_data(os.path.join(project_root, '.purlin', 'report-data.js'))
+        state = _load_report_state(project_root, previous)
+        if state is not None:
+            affected = _report_changes(project_root, previous, state, features, config,
+                                       inputs, staged)
+    if affected is None:
+        coverage = _build_coverage_map(project_root, features, all_proofs, global_anchors)
+        unchanged = ()
+    else:
+        coverage = _build_coverage_map(project_root, features, all_proofs, global_anchors,
+                                       names=sorted(affected))
+        unchanged = set(features) - affected
+
     # Compute drift data (returns dict, or recommendation dict if no anchor)
     drift_data = None
+    drift_base = {}
+    drift_previous = None
+    if state is not None:
+        drift_previous = (previous.get('drift'), state.get('drift_base'))
     try:
-        drift_data = _compute_drift(project_root)
+        drift_data = _compute_drift(project_root, previous=drift_previous, coverage=coverage,
+                                    unchanged=unchanged, base=drift_base)
     except Exception:
         pass  # Drift failure should not block digest generation
 
     return _write_report_data(
         project_root, features, all_proofs, config, global_anchors,
         audit_summary, drift_data=drift_data, git_sha=git_sha,
+        coverage=coverage, inputs=inputs, drift_base=drift_base or None,
+        previous=previous, affected=affected,
     )
 
 
+# Changes to these files can affect any test, so the pre-push hook runs the
+# whole unit tier for them.
+_FULL_SUITE_FILES = (
+    'conftest.py', 'pytest.ini', 'pyproject.toml', 'setup.cfg', 'setup.py', 'tox.ini',
+    'requirements.txt', 'package.json', 'package-lock.json', 'jest.config.js',
+    '.purlin/config.json',
+)
+
+
+def _push_changed_files(project_root, push_refs):
+    """Files changed by the commits a push sends.
+
+    push_refs are the pre-push hook's stdin lines, `<local ref> <local sha>
+    <remote ref> <remote sha>`. A ref new to the remote is compared against
+    every remote-tracking branch. Returns a sorted path list, or None when
+    a line is malformed or git cannot resolve the range.
+    """
+    changed = set()
+    for line in push_refs:
+        parts = line.split()
+        if not parts:
+            continue
+        if len(parts) != 4:
+            return None
+        local_sha, remote_sha = parts[1], parts[3]
+        if not local_sha.strip('0'):
+            continue  # deleting a remote ref pushes no commits
+        if remote_sha.strip('0') and _resolve_commit(project_root, remote_sha):
+            args = ['diff', '--name-only', '--no-renames', remote_sha, local_sha]
+        else:
+            args = ['log', '--name-only', '--format=', '--no-renames',
+                    local_sha, '--not', '--remotes']
+        lines = _run_git_lines(project_root, ['-c', 'core.quotePath=false'] + args)
+        if lines is None:
+            return None
+        changed.update(line for line in lines if line)
+    return sorted(changed)
+
+
+def select_tests(project_root, push_refs, tier='unit'):
+    """Choose the `tier` tests a push has to run.
+
+    Files changed by the pushed commits are mapped to features the way drift
+    maps them: spec files by name, other files through > Scope:. Features
+    requiring an affected feature are affected too. The selection is every
+    test file named by an affected feature's `tier` proof entries, plus the
+    changed test files themselves, closed over shared files: when a selected
+    file proves another feature, that feature's test files are selected too,
+    so the run rewrites each feature's proofs in full. `features` lists
+    every feature whose proofs the selection reruns.
+
+    Returns {'mode', 'reason', 'features', 'test_files'}. mode is
+    'selected', 'none' (nothing to run), or 'full' when a change cannot be
+    mapped to features — an unscoped source file, a test configuration
+    file, a global anchor — or the push range is unknown.
+    """
+    def full(reason):
+        return {'mode': 'full', 'reason': reason, 'features': [], 'test_files': []}
+
+    changed_files = _push_changed_files(project_root, push_refs or [])
+    if changed_files is None or not push_refs:
+        return full('push range unknown')
+
+    features = _scan_specs(project_root)
+    scope_to_specs = _scope_to_specs(features)
+    affected = set()
+    test_files = set()
+    for path in changed_files:
+        if path in _FULL_SUITE_FILES or os.path.basename(path) in _FULL_SUITE_FILES:
+            return full(f'{path} changed')
+        if path.startswith('.purlin/'):
+            continue  # digest and caches
+        if path.startswith('specs/'):
+            if path.endswith('.md'):
+                affected.add(os.path.splitext(os.path.basename(path))[0])
+            continue  # proof files and receipts are test output
+        if _is_test_path(path):
+            if os.path.isfile(os.path.join(project_root, path)):
+                test_files.add(path)
+            continue
+        specs = _specs_for_path(path, scope_to_specs)
+        if specs:
+            affected.update(specs)
+        elif not _is_no_impact_path(path):
+            return full(f'{path} is not in any spec scope')
+
+    affected &= set(features)
+    for name in sorted(affected):
+        if features[name].get('is_anchor') and features[name].get('is_global'):
+            return full(f'global anchor {name} changed')
+    affected.update(name for name, info in features.items()
+                    if affected.intersection(info.get('requires', [])))
+
+    files_by_feature = {}
+    features_by_file = {}
+    for name, entries in _read_proofs(project_root).items():
+        for entry in entries:
+            test_file = entry.get('test_file')
+            if (entry.get('tier', 'unit') == tier and test_file
+                    and os.path.isfile(os.path.join(project_root, test_file))):
+                files_by_feature.setdefault(name, set()).add(test_file)
+                features_by_file.setdefault(test_file, set()).add(name)
+
+    # Proof emitters replace a feature's entries wholesale, so running one
+    # file that proves a feature wipes that feature's proofs from every file
+    # left out. Close the selection over shared files: every file proving a
+    # feature that a selected file proves is selected too.
+    pending = set(test_files)
+    for name in affected:
+        pending.update(files_by_feature.get(name, ()))
+    covered = set(affected)
+    test_files = set()
+    while pending:
+        test_file = pending.pop()
+        test_files.add(test_file)
+        for name in features_by_file.get(test_file, ()):
+            if name not in covered:
+                covered.add(name)
+                pending.update(files_by_feature.get(name, set()) - test_files)
+
+    return {
+        'mode': 'selected' if test_files else 'none',
+        'reason': f'{len(changed_files)} changed files, {len(affected)} affected features',
+        'features': sorted(covered),
+        'test_files': sorted(test_files),
+    }
+
+
 # ---------------------------------------------------------------------------
 # purlin_config tool
 # ---------------------------------------------------------------------------
@@ -2114,6 +3454,34 @@ TOOLS = [
                     "type": "string",
                     "description": "Optional role filter (pm, dev, qa) to prioritize relevant items.",
                     "enum": ["pm", "dev", "qa"]
+                },
+                "status": {
+                    "type": "array",
+                    "description": "Only report specs with these coverage statuses (FAILING, PARTIAL, UNTESTED, PASSING, VERIFIED).",
+                    "items": {"type": "string"}
+                },
+                "category": {
+                    "type": "array",
+                    "description": "Only report specs in these categories (directory under specs/, e.g. 'mcp' or '_anchors').",
+                    "items": {"type": "string"}
+                },
+                "compact": {
+                    "type": "boolean",
+                    "description": "Summary table plus detail only for specs that need attention (not VERIFIED/PASSING)."
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "Report at most this many specs; the output ends with a cursor for the next page.",
+                    "minimum": 1
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "Cursor returned by the previous page."
+                },
+                "format": {
+                    "type": "string",
+                    "description": "'text' (default) for the report, or 'json' for a machine-readable result: per-spec status, proved/total, failing and unproved rules.",
+                    "enum": ["text", "json"]
                 }
             },
             "required": []
@@ -2163,6 +3531,48 @@ TOOLS = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Request cancellation
+# ---------------------------------------------------------------------------
+
+class RequestCancelled(BaseException):
+    """Raised inside a tool call whose request the client cancelled.
+
+    Derives from BaseException (like asyncio.CancelledError) so the tools'
+    broad `except Exception` handlers do not turn it into an error result.
+    """
+
+
+# The cancel event of the request being handled on this worker thread
+_request_state = threading.local()
+
+
+def _check_cancelled():
+    """Raise RequestCancelled if the current request has been cancelled.
+
+    Long-running tools call this between steps; a git subprocess already
+    running is allowed to finish. A no-op outside the stdio dispatcher.
+    """
+    event = getattr(_request_state, 'cancel_event', None)
+    if event is not None and event.is_set():
+        raise RequestCancelled()
+
+
+def _handle_cancellable(request, project_root, cancel_event):
+    """Run handle_request on a worker thread with cancel_event installed.
+
+    Returns the response dict, or None when the request was cancelled.
+    """
+    _request_state.cancel_event = cancel_event
+    try:
+        response = handle_request(request, project_root)
+    except RequestCancelled:
+        return None
+    finally:
+        _request_state.cancel_event = None
+    return None if cancel_event.is_set() else response
+
+
 def handle_request(request, project_root):
     """Handle a single JSON-RPC request and return a response dict."""
     method = request.get('method', '')
@@ -2196,7 +3606,16 @@ def handle_request(request, project_root):
 
         if tool_name == 'sync_status':
             try:
-                result_text = sync_status(project_root, role=arguments.get('role'))
+                result_text = sync_status(
+                    project_root,
+                    role=arguments.get('role'),
+                    status=arguments.get('status'),
+                    category=arguments.get('category'),
+                    compact=bool(arguments.get('compact')),
+                    cursor=arguments.get('cursor'),
+                    page_size=arguments.get('page_size'),
+                    output_format=arguments.get('format', 'text'),
+                )
             except Exception as e:
                 result_text = f"Error running sync_status: {e}"
             return {
@@ -2253,52 +3672,170 @@ def handle_request(request, project_root):
     return None
 
 
-_SERVER_MTIME = os.path.getmtime(os.path.abspath(__file__))
+# Tool calls run on a small worker pool so a slow drift or sync_status does
+# not hold up cheaper requests queued behind it.
+_MAX_WORKERS = 4
+
+# Server modules picked up by hot reload, in dependency order
+_SERVER_MODULES = ('spec_parser', 'config_engine', 'purlin_server')
+_DEFAULT_RELOAD_INTERVAL = 2.0
+
+
+def _reload_interval(project_root):
+    """Seconds between hot-reload checks (config `mcp_reload_interval`,
+    0 disables hot reload)."""
+    try:
+        interval = float(resolve_config(project_root).get(
+            'mcp_reload_interval', _DEFAULT_RELOAD_INTERVAL))
+    except (TypeError, ValueError):
+        interval = _DEFAULT_RELOAD_INTERVAL
+    return max(interval, 0)
+
+
+def _module_mtimes():
+    """Return {module name: source mtime_ns} for every server module."""
+    mtimes = {}
+    for name in _SERVER_MODULES:
+        try:
+            mtimes[name] = os.stat(os.path.join(SCRIPT_DIR, name + '.py')).st_mtime_ns
+        except OSError:
+            mtimes[name] = None
+    return mtimes
+
+
+def _reload_server_modules():
+    """Reload every server module in dependency order; return purlin_server."""
+    import importlib
+    for name in _SERVER_MODULES:
+        module = sys.modules.get(name)
+        if module is None:
+            importlib.import_module(name)
+        else:
+            importlib.reload(module)
+    return sys.modules['purlin_server']
 
 
 def main():
-    """Run the MCP server on stdio."""
-    global _SERVER_MTIME
+    """Run the MCP server on stdio.
+
+    Protocol methods (initialize, tools/list, notifications) are answered
+    inline in arrival order. tools/call requests are dispatched to a thread
+    pool and their responses written, correlated by JSON-RPC id, as they
+    complete. `notifications/cancelled` drops a queued call outright and
+    asks a running one to stop at its next checkpoint; no response is
+    written for a cancelled request. On end of input, pending calls are
+    drained before returning.
+
+    Server module sources are checked for changes at most once per
+    mcp_reload_interval and reloaded together when any changed.
+
+    `--compact-proofs [project_root]` instead folds pending proof fragments
+    into the proof files, prints how many were compacted, and exits.
+    """
+    import importlib
+    if sys.argv[1:2] == ['--compact-proofs']:
+        root = sys.argv[2] if len(sys.argv) > 2 else find_project_root()
+        print(f"compacted {compact_proof_journal(root)} proof fragment(s)")
+        return
     project_root = find_project_root()
 
     # Log startup to stderr (stdout is reserved for JSON-RPC)
     print(f"Purlin MCP server v{PURLIN_VERSION} started (root: {project_root})", file=sys.stderr)
 
-    mod = sys.modules[__name__]
-    src_path = os.path.abspath(__file__)
-
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-
+    # Dispatch through the module imported by name: when run as a script this
+    # module is __main__, which importlib.reload cannot re-import.
+    mod = importlib.import_module('purlin_server')
+    interval = _reload_interval(project_root)
+    mtimes = _module_mtimes()
+    next_check = time.monotonic() + interval
+    stdout = sys.stdout
+    write_lock = threading.Lock()
+    inflight_lock = threading.Lock()
+    inflight = {}  # JSON-RPC id -> (future, cancel event)
+
+    def write(response):
+        line = json.dumps(response) + '\n'
+        with write_lock:
+            stdout.write(line)
+            stdout.flush()
+
+    def finish(req_id, future):
+        with inflight_lock:
+            if inflight.get(req_id, (None,))[0] is future:
+                del inflight[req_id]
+        if future.cancelled():
+            return
         try:
-            request = json.loads(line)
-        except json.JSONDecodeError:
+            response = future.result()
+        except Exception as e:
             response = {
                 "jsonrpc": "2.0",
-                "id": None,
-                "error": {"code": -32700, "message": "Parse error"}
+                "id": req_id,
+                "error": {"code": -32603, "message": f"Internal error: {e}"}
             }
-            sys.stdout.write(json.dumps(response) + '\n')
-            sys.stdout.flush()
-            continue
+        if response is not None:
+            write(response)
+
+    def cancel(req_id):
+        with inflight_lock:
+            entry = inflight.pop(req_id, None)
+        if entry is not None:
+            future, event = entry
+            event.set()
+            future.cancel()
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=_MAX_WORKERS, thread_name_prefix='purlin-mcp',
+    )
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
 
-        # Hot-reload: re-import module when source file changes
-        try:
-            current_mtime = os.path.getmtime(src_path)
-            if current_mtime != _SERVER_MTIME:
-                _SERVER_MTIME = current_mtime
-                import importlib
-                mod = importlib.reload(mod)
-                print("Purlin MCP: reloaded", file=sys.stderr)
-        except Exception:
-            pass
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                write({
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32700, "message": "Parse error"}
+                })
+                continue
 
-        response = mod.handle_request(request, project_root)
-        if response is not None:
-            sys.stdout.write(json.dumps(response) + '\n')
-            sys.stdout.flush()
+            method = request.get('method', '')
+            if method == 'notifications/cancelled':
+                cancel((request.get('params') or {}).get('requestId'))
+                continue
+
+            # Hot-reload: at most once per interval, reload the server modules
+            # when any source file changed. Deferred while calls are in
+            # flight so none sees its globals swapped.
+            if interval and not inflight and time.monotonic() >= next_check:
+                next_check = time.monotonic() + interval
+                current = _module_mtimes()
+                if current != mtimes:
+                    mtimes = current
+                    try:
+                        mod = _reload_server_modules()
+                        print("Purlin MCP: reloaded", file=sys.stderr)
+                    except Exception as e:
+                        print(f"Purlin MCP: reload failed: {e}", file=sys.stderr)
+
+            if method != 'tools/call':
+                response = mod.handle_request(request, project_root)
+                if response is not None:
+                    write(response)
+                continue
+
+            req_id = request.get('id')
+            event = threading.Event()
+            future = executor.submit(mod._handle_cancellable, request, project_root, event)
+            with inflight_lock:
+                inflight[req_id] = (future, event)
+            future.add_done_callback(lambda f, req_id=req_id: finish(req_id, f))
+    finally:
+        executor.shutdown(wait=True)
 
 
 if __name__ == '__main__':
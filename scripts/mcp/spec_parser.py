@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Single-pass spec tokenizer shared by the MCP server and static checks.
+
+Walks a spec's lines once and emits its metadata fields, description,
+rules and proof lines. Matching follows the spec format conventions:
+
+  - Metadata fields are `> Field: value` lines at column 0; the first
+    occurrence of a field wins.
+  - `> Description:` continues across following `>` lines that are not
+    themselves metadata fields.
+  - Rules are `- RULE-N: text` lines at column 0. Rules inside the first
+    `## Rules` section are the spec's rules; `all_rules` holds every rule
+    line in the document.
+  - Proofs are `- PROOF-N (RULE-N, ...): text @tier` lines inside the
+    first `## Proof` section.
+  - A section runs from its `## ` heading line to the next `## ` heading.
+
+Uses Python stdlib only.
+"""
+
+import re
+
+_FIELD_RE = re.compile(r'>\s*([A-Za-z][A-Za-z-]*):(.*)')
+_RULE_LINE_RE = re.compile(r'-\s+(RULE-\d+):\s*(.+)')
+_PROOF_LINE_RE = re.compile(r'-\s+(PROOF-\d+)\s*\((RULE-\d+(?:,\s*RULE-\d+)*)\):\s*(.+)')
+_TIER_TAG_RE = re.compile(r'\s*@(\w+)(?:\([^)]*\))?\s*$')
+
+_RULES_HEADING = '## Rules'
+_PROOF_HEADING = '## Proof'
+
+
+def _is_meta_field(name):
+    """True for a metadata field name (`> Field:`), as opposed to a `>`
+    continuation line that happens to contain a colon."""
+    return len(name) >= 2 and name[0].isupper()
+
+
+def _opens_section(line, heading, has_newline):
+    """True when line is exactly `heading` (plus trailing whitespace) and
+    is followed by a newline."""
+    return (has_newline and line.startswith(heading)
+            and not line[len(heading):].strip())
+
+
+def tokenize_spec(content):
+    """Tokenize a spec in one pass over its lines.
+
+    Returns a dict with:
+      fields             — {field name: stripped value}, first occurrence wins
+      is_global          — True when any `> Global: true` line is present
+      description        — joined `> Description:` text, or None
+      has_rules_section  — True when a `## Rules` heading is present
+      has_proof_section  — True when a `## Proof` heading is present
+      rules              — [(rule_id, text)] from the `## Rules` section
+      unnumbered_rules   — `- ` lines in `## Rules` that are not RULE-N lines
+      all_rules          — [(rule_id, text)] from anywhere in the spec
+      proofs             — list of proof dicts from the `## Proof` section:
+                           proof_id, rule_ids, description (as written),
+                           clean_description (tier tag removed), tier, line
+    """
+    fields = {}
+    is_global = False
+    description = None
+    desc_open = False
+    has_rules_section = False
+    has_proof_section = False
+    rules = []
+    unnumbered = []
+    all_rules = []
+    proofs = []
+    section = None
+
+    lines = content.split('\n')
+    last = len(lines) - 1
+    for i, line in enumerate(lines):
+        first = line[:1]
+
+        # Description continuation: blank lines are skipped, `>` lines that
+        # are not metadata fields extend it, anything else closes it.
+        if desc_open:
+            stripped = line.strip()
+            if stripped:
+                if stripped[0] == '>':
+                    m = _FIELD_RE.match(stripped)
+                    if m and _is_meta_field(m.group(1)):
+                        desc_open = False
+                    else:
+                        text = stripped[1:].strip()
+                        if text:
+                            description.append(text)
+                else:
+                    desc_open = False
+
+        if first == '#':
+            if line.startswith('## '):
+                section = None
+                if not has_rules_section and _opens_section(line, _RULES_HEADING, i < last):
+                    has_rules_section = True
+                    section = _RULES_HEADING
+                elif not has_proof_section and _opens_section(line, _PROOF_HEADING, i < last):
+                    has_proof_section = True
+                    section = _PROOF_HEADING
+            continue
+
+        if first == '>':
+            m = _FIELD_RE.match(line)
+            if not m:
+                continue
+            name, raw = m.group(1), m.group(2)
+            if name.lower() == 'global' and raw.strip().lower() == 'true':
+                is_global = True
+            if not raw.strip(' \t') or name in fields:
+                continue
+            value = raw.strip()
+            fields[name] = value
+            if name == 'Description' and description is None:
+                description = [value]
+                desc_open = True
+            continue
+
+        if section == _RULES_HEADING:
+            stripped = line.strip()
+            if stripped.startswith('- ') and not _RULE_LINE_RE.match(stripped):
+                unnumbered.append(stripped)
+
+        if first == '-':
+            m = _RULE_LINE_RE.match(line)
+            if m:
+                rule = (m.group(1), m.group(2).strip())
+                all_rules.append(rule)
+                if section == _RULES_HEADING:
+                    rules.append(rule)
+                continue
+
+        if section == _PROOF_HEADING:
+            stripped = line.strip()
+            m = _PROOF_LINE_RE.match(stripped)
+            if m:
+                desc = m.group(3).strip()
+                tier = _TIER_TAG_RE.search(desc)
+                proofs.append({
+                    'proof_id': m.group(1),
+                    'rule_ids': [r.strip() for r in m.group(2).split(',')],
+                    'description': desc,
+                    'clean_description': _TIER_TAG_RE.sub('', desc).strip(),
+                    'tier': tier.group(1) if tier else 'unit',
+                    'line': stripped,
+                })
+
+    if description is not None:
+        description = ' '.join(description) or None
+
+    return {
+        'fields': fields,
+        'is_global': is_global,
+        'description': description,
+        'has_rules_section': has_rules_section,
+        'has_proof_section': has_proof_section,
+        'rules': rules,
+        'unnumbered_rules': unnumbered,
+        'all_rules': all_rules,
+        'proofs': proofs,
+    }
+
+
+def tokenize_spec_file(spec_path):
+    """Read and tokenize a spec file. Returns None if it cannot be read."""
+    try:
+        with open(spec_path) as f:
+            return tokenize_spec(f.read())
+    except (IOError, OSError, UnicodeDecodeError):
+        return None
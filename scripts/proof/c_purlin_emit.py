@@ -20,6 +20,14 @@ def main():
     if not proofs_raw:
         return
 
+    # Journal mode (see purlin_journal.py)
+    run_id = os.environ.get("PURLIN_PROOF_RUN_ID")
+    if run_id:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        import purlin_journal
+        purlin_journal.write_fragment(run_id, proofs_raw)
+        return
+
     # Build feature -> spec directory mapping
     spec_dirs = {}
     for spec in glob.glob("specs/**/*.md", recursive=True):
@@ -15,6 +15,7 @@
  *   it("fetches weather data", async () => { ... });
  */
 
+const crypto = require("crypto");
 const fs = require("fs");
 const path = require("path");
 const { globSync } = require("glob");
@@ -56,6 +57,22 @@ class PurlinProofReporter {
   onRunComplete() {
     if (Object.keys(this.proofs).length === 0) return;
 
+    // Journal mode: one fragment per writer, in the "Proof Journal" format
+    // of references/formats/proofs_format.md.
+    const runId = process.env.PURLIN_PROOF_RUN_ID;
+    if (runId) {
+      const journal = path.join(".purlin", "proof-journal");
+      fs.mkdirSync(journal, { recursive: true });
+      const safeId = runId.replace(/[^A-Za-z0-9_-]/g, "_");
+      const fragment = path.join(journal, `${safeId}.${process.pid}.${crypto.randomBytes(4).toString("hex")}.jsonl`);
+      const lines = Object.values(this.proofs)
+        .flat()
+        .map((entry) => JSON.stringify(entry) + "\n");
+      fs.writeFileSync(fragment + ".tmp", lines.join(""));
+      fs.renameSync(fragment + ".tmp", fragment);
+      return;
+    }
+
     // Build feature -> spec directory mapping
     const specDirs = {};
     const specs = globSync("specs/**/*.md");
@@ -76,7 +76,32 @@ function resolve_spec_dirs(): array {
     return $dirs;
 }
 
+function write_fragment(string $run_id, array $proofs_by_key): void {
+    $journal = '.purlin/proof-journal';
+    if (!is_dir($journal)) {
+        mkdir($journal, 0777, true);
+    }
+    $safe_id = preg_replace('/[^A-Za-z0-9_-]/', '_', $run_id);
+    $path = "{$journal}/{$safe_id}." . getmypid() . '.' . bin2hex(random_bytes(4)) . '.jsonl';
+    $lines = '';
+    foreach ($proofs_by_key as $entries) {
+        foreach ($entries as $entry) {
+            $lines .= json_encode($entry, JSON_UNESCAPED_SLASHES) . "\n";
+        }
+    }
+    file_put_contents($path . '.tmp', $lines);
+    rename($path . '.tmp', $path);
+}
+
 function write_proofs(array $proofs_by_key, string $test_file): void {
+    // Journal mode: one fragment per writer, in the "Proof Journal" format
+    // of references/formats/proofs_format.md.
+    $run_id = getenv('PURLIN_PROOF_RUN_ID');
+    if ($run_id !== false && $run_id !== '') {
+        write_fragment($run_id, $proofs_by_key);
+        return;
+    }
+
     $spec_dirs = resolve_spec_dirs();
 
     foreach ($proofs_by_key as $key => $new_entries) {
@@ -0,0 +1,48 @@
+"""Purlin proof journal writer shared by the Python-based proof plugins.
+
+When PURLIN_PROOF_RUN_ID is set, the pytest, C, shell and SQL plugins do not
+rewrite proof files. Each writer leaves one fragment instead, and
+purlin_server folds the fragments into the proof files on its next read.
+The format is described under "Proof Journal" in
+references/formats/proofs_format.md; the JS, PHP and C# plugins write the
+same format.
+
+Usage:
+    run_id = os.environ.get("PURLIN_PROOF_RUN_ID")
+    if run_id:
+        import purlin_journal
+        purlin_journal.write_fragment(run_id, entries)
+"""
+
+import json
+import os
+import re
+
+JOURNAL_DIR = os.path.join(".purlin", "proof-journal")
+
+
+def fragment_name(run_id):
+    """Return a fragment file name unique to this writer.
+
+    ``<run id>.<pid>.<random>.jsonl`` — the pid and random suffix keep two
+    writers (or two runs reusing one id) from ever picking the same name.
+    """
+    safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", run_id)
+    return f"{safe_id}.{os.getpid()}.{os.urandom(4).hex()}.jsonl"
+
+
+def write_fragment(run_id, entries, root="."):
+    """Write entries as one journal fragment (one JSON entry per line).
+
+    The fragment is written under a temporary name and renamed into place,
+    so compaction never reads a partial fragment. Returns the fragment path.
+    """
+    journal = os.path.join(root, JOURNAL_DIR)
+    os.makedirs(journal, exist_ok=True)
+    path = os.path.join(journal, fragment_name(run_id))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    os.replace(tmp_path, path)
+    return path
@@ -16,6 +16,7 @@ Usage in tests:
 import glob
 import json
 import os
+import sys
 
 import pytest
 
@@ -30,12 +31,24 @@ def pytest_configure(config):
 
 
 class ProofCollector:
+    """Collects proof entries and writes them once, at session end.
+
+    Entries ride on the call-phase test report (`purlin_proofs`) and are
+    gathered from pytest_runtest_logreport. Under pytest-xdist, worker
+    reports are forwarded to the controller with that attribute intact, so
+    the controller sees every worker's results and is the only process that
+    writes proof files; workers write nothing.
+    """
+
     def __init__(self):
         self.proofs = {}  # keyed by (feature, tier)
 
+    @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_makereport(self, item, call):
+        outcome = yield
         if call.when != "call":
             return
+        entries = []
         for marker in item.iter_markers("proof"):
             if len(marker.args) < 3:
                 continue
@@ -43,8 +56,7 @@ class ProofCollector:
             proof_id = marker.args[1]
             rule_id = marker.args[2]
             tier = marker.kwargs.get("tier", "unit")
-            key = (feature, tier)
-            self.proofs.setdefault(key, []).append(
+            entries.append(
                 {
                     "feature": feature,
                     "id": proof_id,
@@ -55,8 +67,16 @@ class ProofCollector:
                     "tier": tier,
                 }
             )
+        if entries:
+            outcome.get_result().purlin_proofs = entries
+
+    def pytest_runtest_logreport(self, report):
+        for entry in getattr(report, "purlin_proofs", None) or ():
+            self.proofs.setdefault((entry["feature"], entry["tier"]), []).append(entry)
 
     def pytest_sessionfinish(self, session):
+        if hasattr(session.config, "workerinput"):
+            return  # xdist worker: the controller writes the proof files
         if not self.proofs:
             return
 
@@ -66,10 +86,19 @@ class ProofCollector:
             stem = os.path.splitext(os.path.basename(spec))[0]
             spec_dirs[stem] = os.path.dirname(spec)
 
+        # Sharded runs (shard_runner.py) collect each shard's proofs in its
+        # own directory and merge them into the spec directories afterwards.
+        shard_dir = os.environ.get("PURLIN_PROOF_SHARD_DIR")
+
+        # Journal mode (see purlin_journal.py)
+        run_id = os.environ.get("PURLIN_PROOF_RUN_ID")
+        if run_id and not shard_dir:
+            _journal().write_fragment(run_id, [e for entries in self.proofs.values() for e in entries])
+            return
+
         for (feature, tier), new_entries in self.proofs.items():
-            spec_dir = spec_dirs.get(feature)
+            spec_dir = shard_dir or spec_dirs.get(feature)
             if spec_dir is None:
-                import sys
                 print(f'WARNING: No spec found for feature "{feature}" — writing proofs to specs/{feature}.proofs-{tier}.json. Create a spec with: purlin:spec {feature}', file=sys.stderr)
                 spec_dir = "specs"
             path = os.path.join(spec_dir, f"{feature}.proofs-{tier}.json")
@@ -89,3 +118,13 @@ class ProofCollector:
                 json.dump({"tier": tier, "proofs": kept + new_entries}, f, indent=2)
                 f.write("\n")
             os.replace(tmp_path, path)
+
+
+
+def _journal():
+    """Import purlin_journal, which ships next to this plugin."""
+    plugin_dir = os.path.dirname(os.path.abspath(__file__))
+    if plugin_dir not in sys.path:
+        sys.path.insert(0, plugin_dir)
+    import purlin_journal
+    return purlin_journal
@@ -22,6 +22,9 @@ purlin_proof() {
 purlin_proof_finish() {
   [[ -z "$_PURLIN_PROOFS" ]] && return 0
 
+  local plugin_dir
+  plugin_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
   python3 -c "
 import json, os, glob, sys
 
@@ -51,9 +54,21 @@ for line in sys.stdin.read().strip().split('\n'):
         'tier': tier,
     })
 
+# Sharded runs (shard_runner.py) collect each shard's proofs in its own
+# directory and merge them into the spec directories afterwards.
+shard_dir = os.environ.get('PURLIN_PROOF_SHARD_DIR')
+
+# Journal mode (see purlin_journal.py, shipped next to this script)
+run_id = os.environ.get('PURLIN_PROOF_RUN_ID')
+if run_id and not shard_dir:
+    sys.path.insert(0, sys.argv[1])
+    import purlin_journal
+    purlin_journal.write_fragment(run_id, [e for new_entries in entries.values() for e in new_entries])
+    entries = {}
+
 # Write proof files (feature-scoped overwrite)
 for (feature, tier), new_entries in entries.items():
-    spec_dir = spec_dirs.get(feature)
+    spec_dir = shard_dir or spec_dirs.get(feature)
     if spec_dir is None:
         print(f'WARNING: No spec found for feature \"{feature}\" — writing proofs to specs/{feature}.proofs-{tier}.json. Create a spec with: purlin:spec {feature}', file=sys.stderr)
         spec_dir = 'specs'
@@ -68,7 +83,7 @@ for (feature, tier), new_entries in entries.items():
         json.dump({'tier': tier, 'proofs': kept + new_entries}, f, indent=2)
         f.write('\n')
     os.replace(tmp_path, path)
-" <<< "$_PURLIN_PROOFS"
+" "$plugin_dir" <<< "$_PURLIN_PROOFS"
 
   _PURLIN_PROOFS=""
 }
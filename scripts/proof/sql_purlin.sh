@@ -107,8 +107,17 @@ for spec in glob.glob('specs/**/*.md', recursive=True):
     stem = os.path.splitext(os.path.basename(spec))[0]
     spec_dirs[stem] = os.path.dirname(spec)
 
+# Journal mode (see purlin_journal.py, shipped next to this script)
+to_write = proofs_by_key
+run_id = os.environ.get('PURLIN_PROOF_RUN_ID')
+if run_id:
+    sys.path.insert(0, '$SCRIPT_DIR')
+    import purlin_journal
+    purlin_journal.write_fragment(run_id, [e for new_entries in proofs_by_key.values() for e in new_entries])
+    to_write = {}
+
 # Write proof files (feature-scoped overwrite)
-for key, new_entries in proofs_by_key.items():
+for key, new_entries in to_write.items():
     feature, tier = key.split(':')
     spec_dir = spec_dirs.get(feature)
     if spec_dir is None:
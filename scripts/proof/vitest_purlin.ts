@@ -23,6 +23,7 @@
  *   });
  */
 
+import * as crypto from "crypto";
 import * as fs from "fs";
 import * as path from "path";
 import { globSync } from "glob";
@@ -125,6 +126,26 @@ class PurlinVitestReporter implements Reporter {
   private writeProofFiles(): void {
     if (this.proofs.size === 0) return;
 
+    // Journal mode: one fragment per writer, in the "Proof Journal" format
+    // of references/formats/proofs_format.md.
+    const runId = process.env.PURLIN_PROOF_RUN_ID;
+    if (runId) {
+      const journal = path.join(".purlin", "proof-journal");
+      fs.mkdirSync(journal, { recursive: true });
+      const safeId = runId.replace(/[^A-Za-z0-9_-]/g, "_");
+      const suffix = crypto.randomBytes(4).toString("hex");
+      const fragment = path.join(
+        journal,
+        `${safeId}.${process.pid}.${suffix}.jsonl`
+      );
+      const lines = [...this.proofs.values()]
+        .flat()
+        .map((entry) => JSON.stringify(entry) + "\n");
+      fs.writeFileSync(fragment + ".tmp", lines.join(""));
+      fs.renameSync(fragment + ".tmp", fragment);
+      return;
+    }
+
     // Build feature -> spec directory mapping
     const specDirs: Record<string, string> = {};
     const specs = globSync("specs/**/*.md");
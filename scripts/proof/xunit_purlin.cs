@@ -140,6 +140,15 @@ namespace Purlin
             // RULE-7: no markers collected -> write nothing.
             if (_proofs.Count == 0) return;
 
+            // Journal mode: one fragment per writer, in the "Proof Journal" format
+            // of references/formats/proofs_format.md.
+            string? runId = Environment.GetEnvironmentVariable("PURLIN_PROOF_RUN_ID");
+            if (!string.IsNullOrEmpty(runId))
+            {
+                WriteFragment(runId);
+                return;
+            }
+
             string specsRoot = Path.Combine(_root, "specs");
 
             // RULE-1: feature -> spec directory, matched by spec filename stem.
@@ -217,6 +226,36 @@ namespace Purlin
                 $"[PurlinProofLogger] collected {_proofs.Count} proof(s) in-process; wrote {filesWritten} file(s).");
         }
 
+        // One proof entry per line in .purlin/proof-journal/<run id>.<pid>.<random>.jsonl,
+        // written to a tmp file and renamed into place.
+        private void WriteFragment(string runId)
+        {
+            var safeId = new StringBuilder();
+            foreach (char c in runId)
+                safeId.Append(char.IsAsciiLetterOrDigit(c) || c == '_' || c == '-' ? c : '_');
+            string journal = Path.Combine(_root, ".purlin", "proof-journal");
+            Directory.CreateDirectory(journal);
+            string path = Path.Combine(journal,
+                $"{safeId}.{Environment.ProcessId}.{Guid.NewGuid().ToString("N").Substring(0, 8)}.jsonl");
+
+            var sb = new StringBuilder();
+            foreach (Proof p in _proofs)
+            {
+                sb.Append("{\"feature\": ").Append(JsonStr(p.Feature))
+                  .Append(", \"id\": ").Append(JsonStr(p.Id))
+                  .Append(", \"rule\": ").Append(JsonStr(p.Rule))
+                  .Append(", \"test_file\": ").Append(JsonStr(p.TestFile))
+                  .Append(", \"test_name\": ").Append(JsonStr(p.TestName))
+                  .Append(", \"status\": ").Append(JsonStr(p.Status))
+                  .Append(", \"tier\": ").Append(JsonStr(p.Tier))
+                  .Append("}\n");
+            }
+            File.WriteAllText(path + ".tmp", sb.ToString());
+            File.Move(path + ".tmp", path);
+            Console.Error.WriteLine(
+                $"[PurlinProofLogger] collected {_proofs.Count} proof(s) in-process; wrote 1 journal fragment.");
+        }
+
         // Walk up from `start` to the nearest ancestor containing a `specs/`
         // directory. Falls back to `start` if none is found.
         private static string FindRoot(string start)